@@ -0,0 +1,208 @@
+"""Times the board, legality, scoring and search hot paths.
+
+    python benchmarks.py --out results.json
+    python benchmarks.py --out new.json --baseline results.json
+
+Every benchmark replays games generated from fixed seeds and reports the
+best of several runs. With a baseline, any result more than `--tolerance`
+worse than the baseline is listed and the script exits with status 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+import numpy as np
+
+from dlgo.agents.naive import AlphaBetaBot, RandomBot
+from dlgo.goboard import Board, GameState, Move
+from dlgo.goboard_bit import BitBoard
+from dlgo.goboard_fast import FastBoard
+from dlgo.gotypes import Player, Point
+from dlgo.playout import random_playout
+from dlgo.scoring import compute_game_result
+
+SEED = 20190419
+BOARD_CLASSES = (Board, FastBoard, BitBoard)
+
+
+def best_time(fn, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def random_game(size: int, board_cls: type, seed: int) -> list[GameState]:
+    """Every state of a RandomBot game, played from a fixed seed"""
+    random.seed(seed)
+    bot = RandomBot()
+    game = GameState.new_game(size, board_cls=board_cls)
+    states = [game]
+    while not game.is_over():
+        game = game.apply_move(bot.select_move(game))
+        states.append(game)
+    return states
+
+
+def bench_board(size: int, board_cls: type, repeats: int) -> dict[str, tuple]:
+    """Returns {name: (value, unit)} for the board and GameState operations"""
+    states = random_game(size, board_cls, SEED)
+    moves = [state.last_move for state in states[1:]]
+    plays = [
+        (state.previous_state.next_player, state.last_move.point)
+        for state in states[1:]
+        if state.last_move.is_play
+    ]
+    # A spread of positions from every stage of the game
+    samples = states[:: max(1, len(states) // 20)]
+    points = [
+        Point(row=row, col=col)
+        for row in range(1, size + 1)
+        for col in range(1, size + 1)
+    ]
+    results = {}
+
+    def place_stones():
+        board = board_cls(size, size)
+        for player, point in plays:
+            if board.get(point) is None:
+                board.place_stone(player, point)
+
+    seconds = best_time(place_stones, repeats)
+    results["place_stone"] = (seconds / len(plays) * 1e6, "us")
+
+    def apply_moves():
+        game = GameState.new_game(size, board_cls=board_cls)
+        for move in moves:
+            game = game.apply_move(move)
+
+    seconds = best_time(apply_moves, repeats)
+    results["apply_move"] = (seconds / len(moves) * 1e6, "us")
+
+    def legal_moves():
+        for state in samples:
+            # Drop the per-state cache so every call does the work
+            state._legal_moves = None
+            state.legal_moves()
+
+    seconds = best_time(legal_moves, repeats)
+    results["legal_moves"] = (seconds / len(samples) * 1e6, "us")
+
+    def is_valid_move():
+        for state in samples:
+            for point in points:
+                state.is_valid_move(Move.play(point))
+
+    seconds = best_time(is_valid_move, repeats)
+    results["is_valid_move"] = (seconds / (len(samples) * len(points)) * 1e6, "us")
+
+    def game_results():
+        for state in samples:
+            compute_game_result(state)
+
+    seconds = best_time(game_results, repeats)
+    results["compute_game_result"] = (seconds / len(samples) * 1e6, "us")
+    return results
+
+
+def bench_playouts(size: int, repeats: int, num_playouts: int = 50) -> tuple:
+    board = FastBoard(size, size)
+
+    def playouts():
+        rng = random.Random(SEED)
+        for _ in range(num_playouts):
+            random_playout(board, Player.black, rng=rng)
+
+    return num_playouts / best_time(playouts, repeats), "playouts/s"
+
+
+def bench_alpha_beta(size: int, repeats: int, depth: int = 2) -> tuple:
+    # A mid-game position, where search is most expensive
+    states = random_game(size, Board, SEED)
+    game_state = states[len(states) // 3]
+    best = 0.0
+    for _ in range(repeats):
+        np.random.seed(SEED)
+        bot = AlphaBetaBot(depth=depth)
+        bot.select_move(game_state)
+        best = max(best, bot.stats()["nodes_per_second"])
+    return best, "nodes/s"
+
+
+def run(sizes: list[int], repeats: int) -> dict[str, dict]:
+    results = {}
+    for size in sizes:
+        label = f"{size}x{size}"
+        for board_cls in BOARD_CLASSES:
+            for name, (value, unit) in bench_board(size, board_cls, repeats).items():
+                results[f"{board_cls.__name__}.{name}/{label}"] = {
+                    "value": value,
+                    "unit": unit,
+                }
+        for name, (value, unit) in (
+            ("random_playout", bench_playouts(size, repeats)),
+            ("alpha_beta", bench_alpha_beta(size, repeats)),
+        ):
+            results[f"{name}/{label}"] = {"value": value, "unit": unit}
+        for name, result in sorted(results.items()):
+            if name.endswith(label):
+                print(f"{name:<40} {result['value']:>12.2f} {result['unit']}")
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Names of the results more than `tolerance` worse than the baseline"""
+    regressions = []
+    for name, result in sorted(results.items()):
+        if name not in baseline:
+            continue
+        old = baseline[name]["value"]
+        new = result["value"]
+        # Rates are better when higher, times when lower
+        higher_is_better = result["unit"].endswith("/s")
+        change = (new - old) / old if old else 0.0
+        worse = -change if higher_is_better else change
+        flag = "REGRESSION" if worse > tolerance else ""
+        print(f"{name:<40} {old:>12.2f} -> {new:>12.2f} {change:>+8.1%} {flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[9, 13, 19])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--out", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with an earlier JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeats)
+    if args.out:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": SEED,
+            "results": results,
+        }
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        print()
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
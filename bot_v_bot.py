@@ -3,13 +3,14 @@ import time
 from dlgo.agents.helpers import capture_diff, current_score
 from dlgo.agents.naive import AlphaBetaBot, RandomBot
 from dlgo.goboard import GameState
+from dlgo.goboard_fast import FastBoard
 from dlgo.gotypes import Player
 from dlgo.utils import print_board, print_move
 
 
 def main():
     board_size = 9
-    game = GameState.new_game(board_size)
+    game = GameState.new_game(board_size, board_cls=FastBoard)
     bots = {
         Player.black: AlphaBetaBot(eval_fn=capture_diff, depth=3),
         Player.white: AlphaBetaBot(eval_fn=current_score, depth=3),
@@ -1,55 +1,108 @@
 from __future__ import annotations
 
-import copy
+import time
 
 import numpy as np
+from dlgo.agents.transposition import (
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    TranspositionTable,
+    position_key,
+)
+from dlgo.geometry import geometry_for
 from dlgo.goboard import Board, GameState, Move
+from dlgo.goboard_fast import BORDER, EMPTY, SearchState
 from dlgo.gotypes import Player, Point
 from dlgo.scoring import GameResult, compute_game_result
 
+# Byte translation tables for the padded grids of `Board.color_grid`: each maps
+# the matching cells to 1 and every other cell to 0
+_EMPTY_CELLS = bytes(1 if value == EMPTY else 0 for value in range(256))
+_OWN_OR_BORDER_CELLS = {
+    player: bytes(1 if value in (player.value, BORDER) else 0 for value in range(256))
+    for player in Player
+}
+# (num_rows, num_cols) -> a byte mask of the points that are not on the edge
+_interior_masks: dict[tuple[int, int], int] = {}
+
 
 def is_point_an_eye(board: Board, point: Point, color: Player):
     if board.get(point) is not None:
         return False
+    geometry = geometry_for(board.num_rows, board.num_cols)
     # All adjacent points must contain friendly stones
-    for neighbor in point.neighbors():
-        if board.is_on_grid(neighbor):
-            neighbor_color: Player = board.get(neighbor)
-            if neighbor_color != color:
-                return False
-
-    friendly_corners = 0
-    off_board_corners = 0
-    corners = [
-        Point(point.row - 1, point.col - 1),
-        Point(point.row - 1, point.col + 1),
-        Point(point.row + 1, point.col - 1),
-        Point(point.row + 1, point.col + 1),
-    ]
-    for corner in corners:
-        if board.is_on_grid(corner):
-            corner_color: Player = board.get(corner)
-            if corner_color == color:
-                friendly_corners += 1
-        else:
-            off_board_corners += 1
-    if off_board_corners > 0:
-        return off_board_corners + friendly_corners == 4
+    for neighbor in geometry.neighbors[point]:
+        if board.get(neighbor) != color:
+            return False
+
+    corners = geometry.diagonals[point]
+    friendly_corners = sum(board.get(corner) == color for corner in corners)
+    if point in geometry.edges:
+        # Every corner on the board must be friendly
+        return friendly_corners == len(corners)
     return friendly_corners >= 3
 
 
+def eye_points(board: Board, color: Player) -> set[Point]:
+    """Every point where `is_point_an_eye(board, point, color)` holds, found
+    in one sweep over the whole board.
+
+    The padded grid is turned into integers with one byte per cell, and the
+    neighbor and corner tests become shifts and masks of those integers.
+    """
+    geometry = geometry_for(board.num_rows, board.num_cols)
+    interior = _interior_masks.get((board.num_rows, board.num_cols))
+    if interior is None:
+        interior = sum(
+            1 << 8 * (point.row * geometry.width + point.col)
+            for point in geometry.points
+            if point not in geometry.edges
+        )
+        _interior_masks[board.num_rows, board.num_cols] = interior
+    grid = bytes(board.color_grid())
+    empty = int.from_bytes(grid.translate(_EMPTY_CELLS), "little")
+    own = int.from_bytes(grid.translate(_OWN_OR_BORDER_CELLS[color]), "little")
+    row = 8 * geometry.width
+    candidates = empty & (own >> row) & (own << row) & (own >> 8) & (own << 8)
+    if not candidates:
+        return set()
+    up_left = own << row + 8
+    up_right = own << row - 8
+    down_left = own >> row - 8
+    down_right = own >> row + 8
+    all_corners = up_left & up_right & down_left & down_right
+    # At least three of four; only allowed away from the edge
+    three_corners = (up_left & up_right & (down_left | down_right)) | (
+        down_left & down_right & (up_left | up_right)
+    )
+    eyes = candidates & (all_corners | (three_corners & interior))
+    if not eyes:
+        return set()
+
+    point_at = geometry.point_at
+    cells = eyes.to_bytes(geometry.size, "little")
+    points = set()
+    index = cells.find(1)
+    while index >= 0:
+        points.add(point_at[index])
+        index = cells.find(1, index + 1)
+    return points
+
+
 def capture_diff(game_state: GameState) -> int:
-    black_stones = 0
-    white_stones = 0
-    for row in range(1, game_state.board.num_rows + 1):
-        for col in range(1, game_state.board.num_cols + 1):
-            point = Point(row=row, col=col)
-            color = game_state.board.get(point)
-            if color == Player.black:
-                black_stones += 1
-            elif color == Player.white:
-                white_stones += 1
-    diff = black_stones - white_stones
+    board = game_state.board
+    diff = board.num_stones(Player.black) - board.num_stones(Player.white)
+    if game_state.next_player == Player.black:
+        return diff
+    return -diff
+
+
+def area_diff(game_state: GameState) -> int:
+    """Like capture_diff, but also counts empty points surrounded by one
+    color. Reads the board's running area estimate, so it is O(1)."""
+    board = game_state.board
+    diff = board.area_estimate(Player.black) - board.area_estimate(Player.white)
     if game_state.next_player == Player.black:
         return diff
     return -diff
@@ -62,68 +115,140 @@ def current_score(game_state: GameState) -> int:
     return -game_result.winning_margin
 
 
+class SearchTimeout(Exception):
+    """Raised inside alpha_beta when its deadline has passed"""
+
+
+def _order_moves(moves: list[Move], first: Move | None) -> list[Move]:
+    """Shuffles the moves, then moves `first` (e.g. a stored best move) to the front"""
+    np.random.shuffle(moves)
+    if first is not None and first.is_play:
+        for i, move in enumerate(moves):
+            if move.is_play and move.point == first.point:
+                moves.insert(0, moves.pop(i))
+                break
+    return moves
+
+
 def alpha_beta(
-    game_state: GameState,
+    game_state: GameState | SearchState,
     depth: int,
     eval_fn,
     maximizing_player: bool,
     alpha: int = -np.inf,
     beta: int = np.inf,
     return_move: bool = False,
+    tt: TranspositionTable | None = None,
+    deadline: float | None = None,
+    first_move: Move | None = None,
+) -> Move | float | int | None:
+    """Minimax search w/ alpha-beta pruning. `deadline` is a
+    `time.monotonic()` value after which SearchTimeout is raised, and
+    `first_move` is searched first at the root if it is legal.
+
+    The search runs on a SearchState, making and unmaking moves in place;
+    a GameState is converted once at the root. `eval_fn` is called with the
+    SearchState, which exposes the same `board` and `next_player`."""
+    if not isinstance(game_state, SearchState):
+        game_state = SearchState.from_game_state(game_state)
+    return _alpha_beta(
+        game_state,
+        depth,
+        eval_fn,
+        maximizing_player,
+        alpha,
+        beta,
+        return_move,
+        tt,
+        deadline,
+        first_move,
+    )
+
+
+def _alpha_beta(
+    state: SearchState,
+    depth: int,
+    eval_fn,
+    maximizing_player: bool,
+    alpha: float,
+    beta: float,
+    return_move: bool = False,
+    tt: TranspositionTable | None = None,
+    deadline: float | None = None,
+    first_move: Move | None = None,
 ) -> Move | float | int | None:
-    if game_state.is_over():
-        game_result: GameResult = compute_game_result(game_state)
+    if deadline is not None and time.monotonic() > deadline:
+        raise SearchTimeout()
+    if state.is_over():
+        game_result: GameResult = compute_game_result(state)
         if game_result.winner == Player.black:
             return np.inf
         return -np.inf
 
-    elif depth == 0:
-        return eval_fn(game_state)
-
-    if maximizing_player:
-        max_eval = -np.inf
-        best_move = None
-        moves = game_state.legal_moves()
-        np.random.shuffle(moves)
-        for move in moves:
-            if (
-                move.is_pass
-                or move.is_resign
-                or is_point_an_eye(game_state.board, move.point, game_state.next_player)
-            ):
-                continue
-            game = copy.deepcopy(game_state)
-            game.apply_move(move)
-            eval = alpha_beta(game, depth - 1, eval_fn, False, alpha, beta)
-            if eval > max_eval and return_move:
+    tt_move = first_move
+    if tt is not None:
+        key = position_key(state)
+        entry = tt.lookup(key)
+        if entry is not None:
+            tt_move = tt_move or entry.move
+            if entry.depth >= depth and not return_move:
+                if entry.flag == EXACT:
+                    return entry.value
+                if entry.flag == LOWER_BOUND:
+                    alpha = max(alpha, entry.value)
+                else:
+                    beta = min(beta, entry.value)
+                if alpha >= beta:
+                    return entry.value
+        alpha_orig, beta_orig = alpha, beta
+
+    if depth == 0:
+        value = eval_fn(state)
+        if tt is not None:
+            tt.store(key, 0, EXACT, value, None)
+        return value
+
+    best_move = None
+    value = -np.inf if maximizing_player else np.inf
+    moves = _order_moves(state.legal_moves(), tt_move)
+    eyes = eye_points(state.board, state.next_player)
+    for move in moves:
+        if not move.is_play or move.point in eyes:
+            continue
+        state.play(move)
+        try:
+            eval = _alpha_beta(
+                state,
+                depth - 1,
+                eval_fn,
+                not maximizing_player,
+                alpha,
+                beta,
+                tt=tt,
+                deadline=deadline,
+            )
+        finally:
+            state.undo()
+        if maximizing_player:
+            if eval > value:
                 best_move = move
-            max_eval = max(max_eval, eval)
+            value = max(value, eval)
             alpha = max(alpha, eval)
-            if alpha >= beta:
-                break
-
-        return best_move if return_move else max_eval
-
-    else:
-        min_eval = np.inf
-        best_move = None
-        moves = game_state.legal_moves()
-        np.random.shuffle(moves)
-        for move in moves:
-            if (
-                move.is_pass
-                or move.is_resign
-                or is_point_an_eye(game_state.board, move.point, game_state.next_player)
-            ):
-                continue
-            game = copy.deepcopy(game_state)
-            game.apply_move(move)
-            eval = alpha_beta(game, depth - 1, eval_fn, True, alpha, beta)
-            if eval < min_eval and return_move:
+        else:
+            if eval < value:
                 best_move = move
-            min_eval = min(min_eval, eval)
+            value = min(value, eval)
             beta = min(beta, eval)
-            if beta <= alpha:
-                break
+        if alpha >= beta:
+            break
+
+    if tt is not None:
+        if value <= alpha_orig:
+            flag = UPPER_BOUND
+        elif value >= beta_orig:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        tt.store(key, depth, flag, value, best_move)
 
-        return best_move if return_move else min_eval
+    return best_move if return_move else value
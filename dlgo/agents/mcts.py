@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from dlgo.agents.base import Agent
+from dlgo.agents.helpers import eye_points
+from dlgo.goboard import GameState, Move
+from dlgo.goboard_fast import SearchState
+from dlgo.gotypes import Player
+from dlgo.playout import random_playout
+from dlgo.scoring import compute_game_result
+from dlgo.workers import reseed
+
+
+def candidate_moves(state: SearchState) -> list[Move]:
+    """Legal moves that don't fill the mover's own eyes, or a pass if none"""
+    eyes = eye_points(state.board, state.next_player)
+    moves = [
+        move for move in state.legal_moves() if move.is_play and move.point not in eyes
+    ]
+    return moves or [Move.pass_turn()]
+
+
+def _playout(state: SearchState) -> Player:
+    if state.is_over():
+        return compute_game_result(state).winner
+    return random_playout(state.board, state.next_player)
+
+
+class MCTSNode:
+    def __init__(
+        self,
+        parent: MCTSNode | None,
+        move: Move | None,
+        next_player: Player,
+        unvisited_moves: list[Move],
+        is_terminal: bool,
+    ):
+        self.parent = parent
+        self.move = move
+        self.next_player = next_player
+        self.win_counts = {Player.black: 0, Player.white: 0}
+        self.num_rollouts = 0
+        self.children: list[MCTSNode] = []
+        self.unvisited_moves = unvisited_moves
+        self.is_terminal = is_terminal
+
+    def add_child(self, move: Move, state: SearchState) -> MCTSNode:
+        """Adds the child reached by `move`; `state` must be after the move"""
+        self.unvisited_moves.remove(move)
+        is_over = state.is_over()
+        child = MCTSNode(
+            self,
+            move,
+            state.next_player,
+            [] if is_over else candidate_moves(state),
+            is_over,
+        )
+        self.children.append(child)
+        return child
+
+    def record_win(self, winner: Player):
+        self.win_counts[winner] += 1
+        self.num_rollouts += 1
+
+    def can_add_child(self):
+        return len(self.unvisited_moves) > 0
+
+    def winning_frac(self, player: Player) -> float:
+        return self.win_counts[player] / self.num_rollouts
+
+
+def _new_root(state: SearchState) -> MCTSNode:
+    is_over = state.is_over()
+    return MCTSNode(
+        None,
+        None,
+        state.next_player,
+        [] if is_over else candidate_moves(state),
+        is_over,
+    )
+
+
+class MCTSBot(Agent):
+    def __init__(self, num_rounds: int = 1000, temperature: float = 1.5):
+        """Runs `num_rounds` simulations per move. `temperature` weights
+        exploration against win rate when picking which child to visit."""
+        self.num_rounds = num_rounds
+        self.temperature = temperature
+        self.last_simulations = 0
+        self.last_seconds = 0.0
+
+    def select_move(self, game_state: GameState) -> Move:
+        """Chooses the root move with the best win rate after the simulations."""
+        start = time.perf_counter()
+        root = self._search(SearchState.from_game_state(game_state), self.num_rounds)
+        self.last_simulations = self.num_rounds
+        self.last_seconds = time.perf_counter() - start
+        return self._best_move(root, game_state.next_player)
+
+    def _search(self, state: SearchState, num_rounds: int) -> MCTSNode:
+        root = _new_root(state)
+        for _ in range(num_rounds):
+            self._simulate(root, state)
+        return root
+
+    def _simulate(self, root: MCTSNode, state: SearchState):
+        """One round of selection, expansion, playout and backup. `state`
+        is returned to the root position afterwards."""
+        node = root
+        depth = 0
+        while not node.can_add_child() and not node.is_terminal:
+            node = self.select_child(node)
+            state.play(node.move)
+            depth += 1
+        if node.can_add_child():
+            move = random.choice(node.unvisited_moves)
+            state.play(move)
+            depth += 1
+            node = node.add_child(move, state)
+
+        winner = self._playout(state)
+        for _ in range(depth):
+            state.undo()
+        while node is not None:
+            node.record_win(winner)
+            node = node.parent
+
+    @staticmethod
+    def _playout(state: SearchState) -> Player:
+        return _playout(state)
+
+    def select_child(self, node: MCTSNode) -> MCTSNode:
+        """Picks the child with the highest UCT score"""
+        log_rollouts = math.log(node.num_rollouts)
+        best_score = -1.0
+        best_child = None
+        for child in node.children:
+            win_percentage = child.winning_frac(node.next_player)
+            exploration_factor = math.sqrt(log_rollouts / child.num_rollouts)
+            uct_score = win_percentage + self.temperature * exploration_factor
+            if uct_score > best_score:
+                best_score = uct_score
+                best_child = child
+        return best_child
+
+    @staticmethod
+    def _best_move(root: MCTSNode, player: Player) -> Move:
+        best_move = None
+        best_pct = -1.0
+        for child in root.children:
+            child_pct = child.winning_frac(player)
+            if child_pct > best_pct:
+                best_pct = child_pct
+                best_move = child.move
+        return best_move if best_move is not None else Move.pass_turn()
+
+    def stats(self) -> dict[str, float]:
+        """Simulation count and rate of the last `select_move`"""
+        rate = self.last_simulations / self.last_seconds if self.last_seconds else 0.0
+        return {
+            "simulations": self.last_simulations,
+            "seconds": self.last_seconds,
+            "simulations_per_second": rate,
+        }
+
+
+def _grow_tree(
+    state: SearchState, num_rounds: int, temperature: float
+) -> list[tuple[Move, int, int]]:
+    """Builds an independent tree and returns (move, wins for the player to
+    move, rollouts) for each root child"""
+    root = MCTSBot(num_rounds, temperature)._search(state, num_rounds)
+    return [
+        (child.move, child.win_counts[state.next_player], child.num_rollouts)
+        for child in root.children
+    ]
+
+
+class ParallelMCTSBot(MCTSBot):
+    ROOT = "root"
+    LEAF = "leaf"
+
+    def __init__(
+        self,
+        num_rounds: int = 1000,
+        temperature: float = 1.5,
+        workers: int = 4,
+        mode: str = ROOT,
+    ):
+        """Runs the simulations on a pool of `workers` processes, kept until
+        `close` is called.
+
+        In "root" mode every worker grows its own tree with an equal share of
+        the rounds and the root statistics are summed. In "leaf" mode one
+        tree is kept here and batches of `workers` leaves are played out in
+        parallel; each selected path carries a virtual loss until its result
+        comes back, so the leaves of a batch differ.
+        """
+        super().__init__(num_rounds, temperature)
+        if mode not in (self.ROOT, self.LEAF):
+            raise ValueError(f"Unknown parallel MCTS mode: {mode}")
+        self.workers = workers
+        self.mode = mode
+        self._pool: ProcessPoolExecutor | None = None
+
+    def select_move(self, game_state: GameState) -> Move:
+        start = time.perf_counter()
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers, initializer=reseed)
+        state = SearchState.from_game_state(game_state)
+        if self.mode == self.ROOT:
+            move = self._root_parallel(state)
+        else:
+            move = self._best_move(self._leaf_parallel(state), state.next_player)
+        self.last_simulations = self.num_rounds
+        self.last_seconds = time.perf_counter() - start
+        return move
+
+    def _root_parallel(self, state: SearchState) -> Move:
+        rounds = [
+            self.num_rounds // self.workers + (i < self.num_rounds % self.workers)
+            for i in range(self.workers)
+        ]
+        futures = [
+            self._pool.submit(_grow_tree, state, num_rounds, self.temperature)
+            for num_rounds in rounds
+            if num_rounds
+        ]
+        # point (None for a pass) -> [move, wins, rollouts] over all trees
+        totals: dict = {}
+        for future in futures:
+            for move, wins, rollouts in future.result():
+                total = totals.setdefault(move.point, [move, 0, 0])
+                total[1] += wins
+                total[2] += rollouts
+        best_move = None
+        best_pct = -1.0
+        for move, wins, rollouts in totals.values():
+            if wins / rollouts > best_pct:
+                best_pct = wins / rollouts
+                best_move = move
+        return best_move if best_move is not None else Move.pass_turn()
+
+    def _leaf_parallel(self, state: SearchState) -> MCTSNode:
+        root = _new_root(state)
+        remaining = self.num_rounds
+        while remaining:
+            batch = [
+                self._select_leaf(root, state)
+                for _ in range(min(self.workers, remaining))
+            ]
+            remaining -= len(batch)
+            winners = self._pool.map(_playout, [leaf_state for _, leaf_state in batch])
+            for (node, _), winner in zip(batch, winners):
+                while node is not None:
+                    # Replace the virtual loss with the real result
+                    node.num_rollouts -= 1
+                    node.record_win(winner)
+                    node = node.parent
+        return root
+
+    def _select_leaf(
+        self, root: MCTSNode, state: SearchState
+    ) -> tuple[MCTSNode, SearchState]:
+        """Selects and expands one leaf, adding a virtual loss along its path.
+        Returns the leaf and a detached copy of its position."""
+        node = root
+        node.num_rollouts += 1
+        depth = 0
+        while not node.can_add_child() and not node.is_terminal:
+            node = self.select_child(node)
+            node.num_rollouts += 1
+            state.play(node.move)
+            depth += 1
+        if node.can_add_child():
+            move = random.choice(node.unvisited_moves)
+            state.play(move)
+            depth += 1
+            node = node.add_child(move, state)
+            node.num_rollouts += 1
+        leaf_state = state.copy()
+        for _ in range(depth):
+            state.undo()
+        return node, leaf_state
+
+    def close(self):
+        """Shuts down the worker pool, if one was started"""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
@@ -1,22 +1,31 @@
+from __future__ import annotations
+
 import random
+import time
 
 from dlgo.agents.base import Agent
-from dlgo.agents.helpers import alpha_beta, capture_diff, is_point_an_eye
+from dlgo.agents.helpers import (
+    SearchTimeout,
+    alpha_beta,
+    capture_diff,
+    eye_points,
+)
+from dlgo.agents.parallel import RootSplitSearch
+from dlgo.agents.transposition import TranspositionTable
 from dlgo.goboard import GameState, Move
+from dlgo.goboard_fast import SearchState
 from dlgo.gotypes import Player
 
 
 class RandomBot(Agent):
     def select_move(self, game_state: GameState) -> Move:
         """Chooses a random valid move. Will avoid closing its own eyes."""
-        candidates = []
-        for move in game_state.legal_moves():
-            if move.is_pass or move.is_resign:
-                continue
-            if not is_point_an_eye(
-                game_state.board, move.point, game_state.next_player
-            ):
-                candidates.append(move)
+        eyes = eye_points(game_state.board, game_state.next_player)
+        candidates = [
+            move
+            for move in game_state.legal_moves()
+            if move.is_play and move.point not in eyes
+        ]
 
         if not candidates:
             return Move.pass_turn()
@@ -24,17 +33,114 @@ class RandomBot(Agent):
 
 
 class AlphaBetaBot(Agent):
-    def __init__(self, depth: int = 3, eval_fn=capture_diff):
-        """Optionally takes an evaluation function to override the default."""
+    def __init__(
+        self,
+        depth: int = 3,
+        eval_fn=capture_diff,
+        tt_size: int = 1 << 16,
+        time_limit: float | None = None,
+        workers: int = 1,
+    ):
+        """Optionally takes an evaluation function to override the default.
+        Search results are kept in a transposition table of `tt_size` slots
+        that lives as long as the bot; pass 0 to disable it.
+        With a `time_limit` in seconds, each move is searched by iterative
+        deepening until the time runs out, and `depth` is ignored.
+        With `workers` > 1 the root moves are split across a process pool
+        that is kept until `close` is called; `eval_fn` must then be a
+        module-level function."""
         self.depth = depth
         self.eval_fn = eval_fn
+        self.tt = TranspositionTable(tt_size) if tt_size else None
+        self.time_limit = time_limit
+        self.workers = workers
+        self.last_depth = 0
+        self.last_nodes = 0
+        self.last_seconds = 0.0
+        self._root_split: RootSplitSearch | None = None
 
     def select_move(self, game_state: GameState) -> Move:
         """Chooses a move from a minimax search w/ alpha-beta pruning."""
-        maximizing_player = game_state.next_player == Player.black
-        move = alpha_beta(
-            game_state, self.depth, self.eval_fn, maximizing_player, return_move=True
-        )
+        start = time.perf_counter()
+        self.last_nodes = 0
+        if self.tt is not None:
+            self.tt.new_search()
+        if self.time_limit is None:
+            move = self._search(game_state, self.depth)
+            self.last_depth = self.depth
+        else:
+            move = self._iterative_deepening(game_state)
+        self.last_seconds = time.perf_counter() - start
         if move is None:
             return Move.pass_turn()
         return move
+
+    def _search(self, game_state, depth, deadline=None, first_move=None):
+        maximizing_player = game_state.next_player == Player.black
+        state = SearchState.from_game_state(game_state)
+        if self.workers > 1:
+            if self._root_split is None:
+                self._root_split = RootSplitSearch(
+                    self.workers, self.tt.size if self.tt is not None else 0
+                )
+            try:
+                return self._root_split.search(
+                    state,
+                    depth,
+                    self.eval_fn,
+                    maximizing_player,
+                    tt=self.tt,
+                    deadline=deadline,
+                    first_move=first_move,
+                )
+            finally:
+                self.last_nodes += self._root_split.last_nodes
+        try:
+            return alpha_beta(
+                state,
+                depth,
+                self.eval_fn,
+                maximizing_player,
+                return_move=True,
+                tt=self.tt,
+                deadline=deadline,
+                first_move=first_move,
+            )
+        finally:
+            self.last_nodes += state.num_plays
+
+    def _iterative_deepening(self, game_state: GameState) -> Move | None:
+        """Searches one ply deeper at a time, starting each iteration from the
+        previous best move, and returns the result of the deepest completed
+        iteration. The first iteration always runs to completion."""
+        deadline = time.monotonic() + self.time_limit
+        board = game_state.board
+        max_depth = board.num_rows * board.num_cols
+        move = self._search(game_state, 1)
+        self.last_depth = 1
+        for depth in range(2, max_depth + 1):
+            try:
+                move = self._search(game_state, depth, deadline, first_move=move)
+            except SearchTimeout:
+                break
+            self.last_depth = depth
+        return move
+
+    def close(self):
+        """Shuts down the worker pool, if one was started"""
+        if self._root_split is not None:
+            self._root_split.close()
+            self._root_split = None
+
+    def stats(self) -> dict[str, float]:
+        """Nodes searched and time taken by the last `select_move`, plus
+        transposition table counts accumulated over all searches"""
+        rate = self.last_nodes / self.last_seconds if self.last_seconds else 0.0
+        stats = {
+            "nodes": self.last_nodes,
+            "seconds": self.last_seconds,
+            "nodes_per_second": rate,
+        }
+        if self.tt is not None:
+            stats.update(self.tt.stats())
+        return stats
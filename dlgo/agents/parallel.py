@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from dlgo.agents.helpers import _alpha_beta, _order_moves, eye_points
+from dlgo.agents.transposition import TranspositionTable, position_key
+from dlgo.goboard import Move
+from dlgo.goboard_fast import SearchState
+
+__all__ = ["RootSplitSearch"]
+
+# Set in each worker process by _init_worker. The shared bound holds the
+# id of the current search, the best value so far and its root index.
+_shared_bound = None
+_worker_tt: TranspositionTable | None = None
+# Id of the search the worker's TT generation belongs to
+_worker_search = 0
+
+_NO_MOVE = -1
+
+
+def _init_worker(shared_bound, tt_size: int):
+    global _shared_bound, _worker_tt
+    _shared_bound = shared_bound
+    _worker_tt = TranspositionTable(tt_size) if tt_size else None
+
+
+def _ready():
+    """Does nothing; submitted once per worker to start the pool early"""
+
+
+def _improves(
+    value: float, index: int, best_value: float, best_index: int, maximizing: bool
+) -> bool:
+    """Whether a root move beats the best so far. Ties go to the move that
+    comes first in the root ordering, as in a serial search."""
+    if value == best_value:
+        return best_index != _NO_MOVE and index < best_index
+    return value > best_value if maximizing else value < best_value
+
+
+def _window(
+    best_value: float, best_index: int, index: int, maximizing: bool
+) -> tuple[float, float]:
+    """Alpha-beta window for one root move. A move ordered before the current
+    best has to detect a tie with it, so its bound is moved one ulp outward."""
+    ties_win = best_index != _NO_MOVE and index < best_index
+    if maximizing:
+        alpha = math.nextafter(best_value, -math.inf) if ties_win else best_value
+        return alpha, math.inf
+    beta = math.nextafter(best_value, math.inf) if ties_win else best_value
+    return -math.inf, beta
+
+
+def _search_root_move(
+    state: SearchState,
+    move: Move,
+    index: int,
+    depth: int,
+    eval_fn,
+    maximizing: bool,
+    deadline: float | None,
+    search_id: int,
+) -> tuple[int, float, bool, int]:
+    global _worker_search
+    with _shared_bound.get_lock():
+        current_id = int(_shared_bound[0])
+        best_value, best_index = _shared_bound[1], int(_shared_bound[2])
+    if current_id != search_id:
+        # Left over from a search that has already ended
+        return index, math.nan, False, 0
+    if search_id != _worker_search and _worker_tt is not None:
+        _worker_tt.new_search()
+    _worker_search = search_id
+    alpha, beta = _window(best_value, best_index, index, maximizing)
+    state.play(move)
+    value = _alpha_beta(
+        state,
+        depth - 1,
+        eval_fn,
+        not maximizing,
+        alpha,
+        beta,
+        tt=_worker_tt,
+        deadline=deadline,
+    )
+    # Outside the window the value is only a bound and cannot be the best
+    exact = value > alpha if maximizing else value < beta
+    if exact:
+        with _shared_bound.get_lock():
+            if int(_shared_bound[0]) == search_id and _improves(
+                value, index, _shared_bound[1], int(_shared_bound[2]), maximizing
+            ):
+                _shared_bound[1], _shared_bound[2] = value, index
+    return index, value, exact, state.num_plays
+
+
+class RootSplitSearch:
+    """Searches the root moves of an alpha-beta search on a process pool.
+
+    The first root move is searched in this process to get a bound (young
+    brothers wait); the remaining moves are then searched by the workers,
+    which share the best value found so far so every later search starts
+    with the tightest known window. For the same root move ordering the
+    result is the move a serial search picks. The pool is started once and
+    reused for every search until `close` is called.
+
+    Deadlines are `time.monotonic()` values, which all processes share, so
+    root moves still queued when the deadline passes time out at once.
+    Every search has an id, and workers still busy with an earlier search
+    cannot change the bound of the current one.
+
+    `eval_fn` must be picklable, i.e. a module-level function.
+    """
+
+    def __init__(self, workers: int, tt_size: int = 1 << 16):
+        self.workers = workers
+        # Nodes visited by the last search, over all processes
+        self.last_nodes = 0
+        # Search id, best value so far and the root index of its move
+        self._bound = multiprocessing.Array("d", 3)
+        self._search_id = 0
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._bound, tt_size),
+        )
+        # Start the workers now rather than within the first timed search
+        for _ in range(workers):
+            self._pool.submit(_ready)
+
+    def search(
+        self,
+        state: SearchState,
+        depth: int,
+        eval_fn,
+        maximizing: bool,
+        tt: TranspositionTable | None = None,
+        deadline: float | None = None,
+        first_move: Move | None = None,
+    ) -> Move | None:
+        self.last_nodes = 0
+        if state.is_over() or depth == 0:
+            return None
+        if first_move is None and tt is not None:
+            entry = tt.lookup(position_key(state))
+            first_move = entry.move if entry is not None else None
+        eyes = eye_points(state.board, state.next_player)
+        moves = [
+            move
+            for move in _order_moves(state.legal_moves(), first_move)
+            if move.is_play and move.point not in eyes
+        ]
+        if not moves:
+            return None
+
+        best_value = -math.inf if maximizing else math.inf
+        best_index = _NO_MOVE
+        plays_before = state.num_plays
+        state.play(moves[0])
+        try:
+            value = _alpha_beta(
+                state,
+                depth - 1,
+                eval_fn,
+                not maximizing,
+                -math.inf,
+                math.inf,
+                tt=tt,
+                deadline=deadline,
+            )
+        finally:
+            state.undo()
+        self.last_nodes = state.num_plays - plays_before
+        if _improves(value, 0, best_value, best_index, maximizing):
+            best_value, best_index = value, 0
+        self._search_id += 1
+        with self._bound.get_lock():
+            self._bound[0] = self._search_id
+            self._bound[1], self._bound[2] = best_value, best_index
+
+        futures = [
+            self._pool.submit(
+                _search_root_move,
+                state,
+                move,
+                index,
+                depth,
+                eval_fn,
+                maximizing,
+                deadline,
+                self._search_id,
+            )
+            for index, move in enumerate(moves[1:], start=1)
+        ]
+        try:
+            for future in as_completed(futures):
+                index, value, exact, nodes = future.result()
+                self.last_nodes += nodes
+                if exact and _improves(
+                    value, index, best_value, best_index, maximizing
+                ):
+                    best_value, best_index = value, index
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return moves[best_index] if best_index != _NO_MOVE else None
+
+    def close(self):
+        self._pool.shutdown(cancel_futures=True)
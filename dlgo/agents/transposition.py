@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections import namedtuple
+
+from dlgo import zobrist
+from dlgo.goboard import GameState, Move
+from dlgo.gotypes import Player
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class TTEntry(namedtuple("TTEntry", "key depth flag value move generation")):
+    key: int
+    depth: int
+    flag: int
+    value: float
+    move: Move | None
+    generation: int
+
+
+def position_key(game_state: GameState) -> int:
+    """Zobrist hash of the board combined with the side to move"""
+    board = game_state.board
+    key = board.zobrist_hash()
+    if game_state.next_player == Player.white:
+        key ^= zobrist.table_for(board.num_rows, board.num_cols).side_to_move
+    return key
+
+
+class TranspositionTable:
+    """Fixed-size table of search results keyed by position hash.
+
+    Each key maps to a single slot. A slot is overwritten when it holds an
+    entry from an earlier search, or one searched no deeper than the new
+    result (depth-preferred replacement).
+    """
+
+    def __init__(self, size: int = 1 << 16):
+        self.size = size
+        self._entries: list[TTEntry | None] = [None] * size
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def new_search(self):
+        """Marks all current entries as replaceable by the next search"""
+        self._generation += 1
+
+    def lookup(self, key: int) -> TTEntry | None:
+        entry = self._entries[key % self.size]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, key: int, depth: int, flag: int, value: float, move: Move | None):
+        slot = key % self.size
+        entry = self._entries[slot]
+        if (
+            entry is None
+            or entry.generation != self._generation
+            or entry.key == key
+            or entry.depth <= depth
+        ):
+            self._entries[slot] = TTEntry(
+                key, depth, flag, value, move, self._generation
+            )
+            self.stores += 1
+
+    def clear(self):
+        self._entries = [None] * self.size
+        self.hits = self.misses = self.stores = 0
+
+    def stats(self) -> dict[str, float]:
+        probes = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "hit_rate": self.hits / probes if probes else 0.0,
+        }
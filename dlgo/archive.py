@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import mmap
+import struct
+from collections.abc import Iterator, Sequence
+
+from dlgo.goboard import Board, GameState, Move
+from dlgo.gotypes import Player, Point
+
+__all__ = ["ArchiveError", "ArchiveWriter", "Archive", "ArchivedGame", "move_code"]
+
+# File layout, little endian:
+#   magic, version
+#   per game: header, varint setup count, setup stones, varint move count, moves
+#   index: one uint64 file offset per game
+#   footer: index offset, game count, magic
+MAGIC = b"DLGA"
+VERSION = 1
+_PREAMBLE = struct.Struct("<4sB")
+# rows, cols, komi in half points, winner (0 if unknown), first player
+_HEADER = struct.Struct("<BBhBB")
+_FOOTER = struct.Struct("<QQ4s")
+_OFFSET = struct.Struct("<Q")
+
+# Move codes; a play is stored as 2 + (row - 1) * num_cols + (col - 1)
+PASS = 0
+RESIGN = 1
+FIRST_POINT = 2
+
+_PLAYERS = (None, Player.black, Player.white)
+
+
+class ArchiveError(ValueError):
+    pass
+
+
+def _write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos: int) -> tuple[int, int]:
+    """Returns the value at `pos` and the position after it"""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def move_code(move: Move, num_cols: int) -> int:
+    """PASS, RESIGN, or for a play 2 + the index of its point"""
+    if move.is_pass:
+        return PASS
+    if move.is_resign:
+        return RESIGN
+    return FIRST_POINT + (move.point.row - 1) * num_cols + move.point.col - 1
+
+
+class ArchiveWriter:
+    """Appends games to a new archive file; the index is written by `close`.
+
+    Games are added as the final GameState of each game. Stones on the
+    board of the first state are stored as setup stones.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "wb")
+        self._file.write(_PREAMBLE.pack(MAGIC, VERSION))
+        self._offsets: list[int] = []
+        self._offset = _PREAMBLE.size
+
+    def add(self, game_state: GameState, komi: float = 7.5):
+        moves = []
+        state = game_state
+        while state.previous_state is not None:
+            moves.append(move_code(state.last_move, state.board.num_cols))
+            state = state.previous_state
+        moves.reverse()
+        board = state.board
+
+        setup = []
+        for row in range(1, board.num_rows + 1):
+            for col in range(1, board.num_cols + 1):
+                player = board.get(Point(row=row, col=col))
+                if player is not None:
+                    setup.append((player, Point(row=row, col=col)))
+        self.add_moves(
+            (board.num_rows, board.num_cols),
+            moves,
+            game_state.winner(komi) if game_state.is_over() else None,
+            first_player=state.next_player,
+            setup=setup,
+            komi=komi,
+        )
+
+    def add_moves(
+        self,
+        board_size: tuple[int, int],
+        move_codes: list[int],
+        winner: Player | None,
+        first_player: Player = Player.black,
+        setup: Sequence[tuple[Player, Point]] = (),
+        komi: float = 7.5,
+    ):
+        """Adds a game given as move codes (see `move_code`), e.g. one
+        recorded without keeping its GameState"""
+        num_rows, num_cols = board_size
+        data = bytearray(
+            _HEADER.pack(
+                num_rows,
+                num_cols,
+                round(komi * 2),
+                0 if winner is None else winner.value,
+                first_player.value,
+            )
+        )
+        _write_varint(data, len(setup))
+        for player, point in setup:
+            index = (point.row - 1) * num_cols + point.col - 1
+            _write_varint(data, 2 * index + player.value - 1)
+        _write_varint(data, len(move_codes))
+        for code in move_codes:
+            _write_varint(data, code)
+
+        self._file.write(data)
+        self._offsets.append(self._offset)
+        self._offset += len(data)
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.write(struct.pack(f"<{len(self._offsets)}Q", *self._offsets))
+        self._file.write(_FOOTER.pack(self._offset, len(self._offsets), MAGIC))
+        self._file.close()
+
+    def __enter__(self) -> ArchiveWriter:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ArchivedGame:
+    """One game of an archive, decoded lazily from the file's bytes.
+
+    `data` is the whole mapped file and `offset` the start of the game in it;
+    no buffer is exported, so the archive can be closed at any time.
+    """
+
+    def __init__(self, data, offset: int = 0):
+        self._data = data
+        (
+            self.num_rows,
+            self.num_cols,
+            half_komi,
+            winner,
+            first_player,
+        ) = _HEADER.unpack_from(data, offset)
+        self.komi = half_komi / 2
+        self.winner = _PLAYERS[winner]
+        self.first_player = _PLAYERS[first_player]
+        num_setup, pos = _read_varint(data, offset + _HEADER.size)
+        self._setup_pos = pos
+        for _ in range(num_setup):
+            pos = _read_varint(data, pos)[1]
+        self.num_moves, self._moves_pos = _read_varint(data, pos)
+        self._num_setup = num_setup
+
+    def setup(self) -> Iterator[tuple[Player, Point]]:
+        data = self._data
+        pos = self._setup_pos
+        for _ in range(self._num_setup):
+            code, pos = _read_varint(data, pos)
+            index, color = divmod(code, 2)
+            yield _PLAYERS[color + 1], self._point(index)
+
+    def move_codes(self) -> Iterator[int]:
+        """Raw codes of the moves: PASS, RESIGN or 2 + point index"""
+        data = self._data
+        pos = self._moves_pos
+        for _ in range(self.num_moves):
+            code, pos = _read_varint(data, pos)
+            yield code
+
+    def moves(self) -> Iterator[Move]:
+        for code in self.move_codes():
+            if code == PASS:
+                yield Move.pass_turn()
+            elif code == RESIGN:
+                yield Move.resign()
+            else:
+                yield Move.play(self._point(code - FIRST_POINT))
+
+    def replay(self, board_cls: type = Board) -> Iterator[GameState]:
+        """Yields the state after the setup stones and after every move"""
+        board = board_cls(self.num_rows, self.num_cols)
+        for player, point in self.setup():
+            board.place_stone(player, point)
+        game_state = GameState(board, self.first_player, None, None)
+        yield game_state
+        for move in self.moves():
+            game_state = game_state.apply_move(move)
+            yield game_state
+
+    def _point(self, index: int) -> Point:
+        row, col = divmod(index, self.num_cols)
+        return Point(row=row + 1, col=col + 1)
+
+
+class Archive:
+    """Read access to an archive file through mmap.
+
+    Games are looked up by number through the offset index at the end of
+    the file and decoded straight from the mapped file, without copying.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ArchiveError(f"{path} is empty") from None
+        if (
+            len(self._mmap) < _PREAMBLE.size + _FOOTER.size
+            or _PREAMBLE.unpack_from(self._mmap)[0] != MAGIC
+        ):
+            self.close()
+            raise ArchiveError(f"{path} is not a game archive")
+        version = _PREAMBLE.unpack_from(self._mmap)[1]
+        if version != VERSION:
+            self.close()
+            raise ArchiveError(f"Unsupported archive version {version}")
+        self._index_offset, self._num_games, magic = _FOOTER.unpack_from(
+            self._mmap, len(self._mmap) - _FOOTER.size
+        )
+        if magic != MAGIC:
+            self.close()
+            raise ArchiveError(f"{path} has no index; was the writer closed?")
+
+    def __len__(self) -> int:
+        return self._num_games
+
+    def __getitem__(self, number: int) -> ArchivedGame:
+        if number < 0:
+            number += self._num_games
+        if not 0 <= number < self._num_games:
+            raise IndexError("game number out of range")
+        position = self._index_offset + _OFFSET.size * number
+        return ArchivedGame(self._mmap, _OFFSET.unpack_from(self._mmap, position)[0])
+
+    def __iter__(self) -> Iterator[ArchivedGame]:
+        for number in range(self._num_games):
+            yield self[number]
+
+    def close(self):
+        """Releases the mapping; games read from the archive can no longer
+        be decoded afterwards"""
+        self._mmap.close()
+
+    def __enter__(self) -> Archive:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import numpy as np
+
+from dlgo.goboard import GameState
+from dlgo.gotypes import Player, Point
+
+__all__ = ["BatchPlayout", "evaluate_territory_batch", "compute_game_results"]
+
+EMPTY = 0
+BLACK = Player.black.value
+WHITE = Player.white.value
+BORDER = 3
+
+
+def _pad(boards: np.ndarray, value) -> np.ndarray:
+    return np.pad(boards, ((0, 0), (1, 1), (1, 1)), constant_values=value)
+
+
+def _neighbors(padded: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Views of the four neighbors of every point of a padded batch"""
+    return (
+        padded[:, :-2, 1:-1],
+        padded[:, 2:, 1:-1],
+        padded[:, 1:-1, :-2],
+        padded[:, 1:-1, 2:],
+    )
+
+
+def _diagonals(padded: np.ndarray) -> tuple[np.ndarray, ...]:
+    return (
+        padded[:, :-2, :-2],
+        padded[:, :-2, 2:],
+        padded[:, 2:, :-2],
+        padded[:, 2:, 2:],
+    )
+
+
+def _dilate(mask: np.ndarray) -> np.ndarray:
+    """Points with at least one neighbor in `mask`"""
+    out = np.zeros_like(mask)
+    out[:, 1:] |= mask[:, :-1]
+    out[:, :-1] |= mask[:, 1:]
+    out[:, :, 1:] |= mask[:, :, :-1]
+    out[:, :, :-1] |= mask[:, :, 1:]
+    return out
+
+
+def _flood(seed: np.ndarray, within: np.ndarray) -> np.ndarray:
+    """Grows `seed` through orthogonally connected points of `within`"""
+    reached = seed & within
+    while True:
+        grown = reached | (_dilate(reached) & within)
+        if np.array_equal(grown, reached):
+            return reached
+        reached = grown
+
+
+def _has_liberty(boards: np.ndarray) -> np.ndarray:
+    """Stones whose string has at least one liberty. Both colors are
+    flooded together, only ever crossing between equal stones."""
+    stones = boards != EMPTY
+    # Links between each point and the one below / to the right
+    same_down = stones[:, :-1] & (boards[:, :-1] == boards[:, 1:])
+    same_right = stones[:, :, :-1] & (boards[:, :, :-1] == boards[:, :, 1:])
+    reached = stones & _dilate(~stones)
+    while True:
+        grown = reached.copy()
+        grown[:, 1:] |= reached[:, :-1] & same_down
+        grown[:, :-1] |= reached[:, 1:] & same_down
+        grown[:, :, 1:] |= reached[:, :, :-1] & same_right
+        grown[:, :, :-1] |= reached[:, :, 1:] & same_right
+        if np.array_equal(grown, reached):
+            return reached
+        reached = grown
+
+
+def _eyes(boards: np.ndarray, colors: np.ndarray) -> np.ndarray:
+    """Vectorized `dlgo.agents.helpers.is_point_an_eye` for every point,
+    with `colors` giving the player of each board"""
+    color = colors[:, None, None]
+    padded = _pad(boards, BORDER)
+    neighbors_ok = np.ones(boards.shape, dtype=bool)
+    for neighbor in _neighbors(padded):
+        neighbors_ok &= (neighbor == color) | (neighbor == BORDER)
+    friendly = np.zeros(boards.shape, dtype=np.int8)
+    off_board = np.zeros(boards.shape, dtype=np.int8)
+    for corner in _diagonals(padded):
+        friendly += corner == color
+        off_board += corner == BORDER
+    corners_ok = np.where(off_board > 0, off_board + friendly == 4, friendly >= 3)
+    return (boards == EMPTY) & neighbors_ok & corners_ok
+
+
+def evaluate_territory_batch(boards: np.ndarray) -> dict[str, np.ndarray]:
+    """Vectorized `dlgo.scoring.evaluate_territory` over a (N, rows, cols)
+    batch. An empty region is territory when it borders only one color,
+    and neutral otherwise. Returns per-board counts keyed like the
+    attributes of `Territory`."""
+    empty = boards == EMPTY
+    reaches_black = _flood(_dilate(boards == BLACK), empty)
+    reaches_white = _flood(_dilate(boards == WHITE), empty)
+    axes = (1, 2)
+    return {
+        "num_black_territory": (reaches_black & ~reaches_white).sum(axis=axes),
+        "num_white_territory": (reaches_white & ~reaches_black).sum(axis=axes),
+        "num_black_stones": (boards == BLACK).sum(axis=axes),
+        "num_white_stones": (boards == WHITE).sum(axis=axes),
+        "num_neutral": (empty & (reaches_black == reaches_white)).sum(axis=axes),
+    }
+
+
+def compute_game_results(
+    boards: np.ndarray, komi: float = 7.5
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Area scores and winners (`Player` values) for a batch of boards"""
+    territory = evaluate_territory_batch(boards)
+    black = territory["num_black_territory"] + territory["num_black_stones"]
+    white = territory["num_white_territory"] + territory["num_white_stones"]
+    winners = np.where(black > white + komi, BLACK, WHITE).astype(np.int8)
+    return black, white, winners
+
+
+class BatchPlayout:
+    """Plays N random games at once on a (N, rows, cols) int8 array.
+
+    Every `step` advances each unfinished board by one move for its side to
+    play, chosen uniformly among empty points that aren't the mover's own
+    eye, suicide or a simple-ko recapture, with a pass when none is left.
+    Captures are found by flooding liberties through each color's strings
+    for the whole batch at once. A board is finished after two passes in a
+    row. Like `dlgo.playout.random_playout` this uses simple ko, not
+    superko.
+    """
+
+    def __init__(
+        self,
+        num_boards: int,
+        num_rows: int,
+        num_cols: int,
+        komi: float = 7.5,
+        seed: int | None = None,
+    ):
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.komi = komi
+        self.boards = np.zeros((num_boards, num_rows, num_cols), dtype=np.int8)
+        self.next_color = np.full(num_boards, BLACK, dtype=np.int8)
+        self.passes = np.zeros(num_boards, dtype=np.int8)
+        self.ko = np.zeros(self.boards.shape, dtype=bool)
+        self.num_moves = 0
+        self._rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_game_state(
+        cls, game_state: GameState, num_boards: int, **kwargs
+    ) -> BatchPlayout:
+        """Starts every board of the batch from the same position"""
+        board = game_state.board
+        batch = cls(num_boards, board.num_rows, board.num_cols, **kwargs)
+        for row in range(1, board.num_rows + 1):
+            for col in range(1, board.num_cols + 1):
+                player = board.get(Point(row=row, col=col))
+                if player is not None:
+                    batch.boards[:, row - 1, col - 1] = player.value
+        batch.next_color[:] = game_state.next_player.value
+        return batch
+
+    @property
+    def done(self) -> np.ndarray:
+        return self.passes >= 2
+
+    def step(self):
+        """Plays one move (or a pass) on every unfinished board"""
+        num_points = self.num_rows * self.num_cols
+        candidates = (
+            (self.boards == EMPTY) & ~_eyes(self.boards, self.next_color) & ~self.ko
+        ).reshape(len(self.boards), num_points)
+        candidates[self.done] = False
+        moved = np.zeros(len(self.boards), dtype=bool)
+        self.ko[:] = False
+
+        pending = candidates.any(axis=1)
+        while pending.any():
+            rows = np.flatnonzero(pending)
+            # Uniform choice among candidates via random priorities
+            priority = self._rng.random((len(rows), num_points))
+            priority[~candidates[rows]] = -1.0
+            points = priority.argmax(axis=1)
+            legal = self._try_moves(rows, points)
+            moved[rows[legal]] = True
+            candidates[rows[~legal], points[~legal]] = False
+            pending[rows[legal]] = False
+            pending &= candidates.any(axis=1)
+
+        passed = ~moved & ~self.done
+        self.passes[moved] = 0
+        self.passes[passed] += 1
+        active = moved | passed
+        self.next_color[active] = BLACK + WHITE - self.next_color[active]
+        self.num_moves += 1
+
+    def _try_moves(self, rows: np.ndarray, points: np.ndarray) -> np.ndarray:
+        """Plays one point on each listed board, keeping the move only where
+        it is not suicide. Returns which moves were kept."""
+        colors = self.next_color[rows]
+        trial = self.boards[rows].copy()
+        flat = trial.reshape(len(rows), -1)
+        index = np.arange(len(rows))
+        flat[index, points] = colors
+
+        opponents = (BLACK + WHITE - colors)[:, None, None]
+        has_liberty = _has_liberty(trial)
+        dead = (trial == opponents) & ~has_liberty
+        captured = dead.reshape(len(rows), -1).sum(axis=1)
+        trial[dead] = EMPTY
+
+        # A capturing move always gains a liberty, so only moves that capture
+        # nothing can be suicide
+        alive = (captured > 0) | has_liberty.reshape(len(rows), -1)[index, points]
+        keep = rows[alive]
+        self.boards[keep] = trial[alive]
+
+        # Simple ko: a lone stone that captured one stone and has one liberty
+        row, col = np.divmod(points, self.num_cols)
+        padded = _pad(trial, BORDER)
+        around = np.stack([n[index, row, col] for n in _neighbors(padded)], axis=1)
+        lone = ~(around == colors[:, None]).any(axis=1)
+        one_liberty = (around == EMPTY).sum(axis=1) == 1
+        is_ko = alive & (captured == 1) & lone & one_liberty
+        self.ko[rows[is_ko]] = dead[is_ko]
+        return alive
+
+    def run(self, max_moves: int | None = None) -> np.ndarray:
+        """Plays until every board is finished, or `max_moves` steps, and
+        returns the winner of each board as a `Player` value"""
+        if max_moves is None:
+            max_moves = 3 * self.num_rows * self.num_cols
+        for _ in range(max_moves):
+            if self.done.all():
+                break
+            self.step()
+        return compute_game_results(self.boards, self.komi)[2]
+
+    def win_rate(self, player: Player, max_moves: int | None = None) -> float:
+        winners = self.run(max_moves)
+        return float(np.mean(winners == player.value))
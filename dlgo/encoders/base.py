@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import importlib
+import time
+from collections.abc import Sequence
+
+import numpy as np
+
+from dlgo.geometry import geometry_for
+from dlgo.goboard import GameState
+from dlgo.gotypes import Point
+
+__all__ = [
+    "Encoder",
+    "get_encoder_by_name",
+    "stone_grid",
+    "liberty_grid",
+    "positions_per_second",
+]
+
+
+class Encoder:
+    """Turns game states into feature planes of shape `shape()`.
+
+    Subclasses implement `name`, `num_planes` and `encode_into`, which
+    writes into zeroed planes, so a whole batch can be encoded into one
+    preallocated array with `encode_batch`.
+    """
+
+    def __init__(self, board_size: int | tuple[int, int]):
+        if isinstance(board_size, int):
+            board_size = (board_size, board_size)
+        self.num_rows, self.num_cols = board_size
+
+    def name(self) -> str:
+        raise NotImplementedError()
+
+    def num_planes(self) -> int:
+        raise NotImplementedError()
+
+    def encode_into(self, game_state: GameState, planes: np.ndarray):
+        raise NotImplementedError()
+
+    def encode(self, game_state: GameState) -> np.ndarray:
+        planes = np.zeros(self.shape(), dtype=np.float32)
+        self.encode_into(game_state, planes)
+        return planes
+
+    def encode_batch(
+        self, game_states: Sequence[GameState], out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Encodes every state into `out[i]`, allocating `out` if needed"""
+        if out is None:
+            out = np.zeros((len(game_states),) + self.shape(), dtype=np.float32)
+        else:
+            out[: len(game_states)] = 0
+        for planes, game_state in zip(out, game_states):
+            self.encode_into(game_state, planes)
+        return out
+
+    def encode_point(self, point: Point) -> int:
+        return self.num_cols * (point.row - 1) + (point.col - 1)
+
+    def decode_point_index(self, index: int) -> Point:
+        return geometry_for(self.num_rows, self.num_cols).points[index]
+
+    def num_points(self) -> int:
+        return self.num_rows * self.num_cols
+
+    def shape(self) -> tuple[int, int, int]:
+        return self.num_planes(), self.num_rows, self.num_cols
+
+
+def get_encoder_by_name(name: str, board_size: int | tuple[int, int]) -> Encoder:
+    """Creates the encoder defined by the module `dlgo.encoders.<name>`"""
+    module = importlib.import_module("dlgo.encoders." + name)
+    return module.create(board_size)
+
+
+def stone_grid(board) -> np.ndarray:
+    """A (rows, cols) int8 array of Player values, 0 for empty points"""
+    return _playing_area(board, np.frombuffer(board.color_grid(), dtype=np.int8))
+
+
+def liberty_grid(board) -> np.ndarray:
+    """A (rows, cols) array holding, for each stone, the number of
+    liberties of its string, and 0 for empty points"""
+    return _playing_area(board, np.array(board.liberty_grid(), dtype=np.int32))
+
+
+def _playing_area(board, padded: np.ndarray) -> np.ndarray:
+    """A copy of the points of a grid in the padded layout of `board`"""
+    grid = padded.reshape(board.num_rows + 2, board.num_cols + 2)
+    return grid[1:-1, 1:-1].copy()
+
+
+def positions_per_second(
+    encoder: Encoder, game_states: Sequence[GameState], batch_size: int = 256
+) -> float:
+    """Encode throughput over `game_states`, reusing one batch array"""
+    out = np.zeros((batch_size,) + encoder.shape(), dtype=np.float32)
+    start = time.perf_counter()
+    for begin in range(0, len(game_states), batch_size):
+        encoder.encode_batch(game_states[begin : begin + batch_size], out)
+    return len(game_states) / (time.perf_counter() - start)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import numpy as np
+
+from dlgo.encoders.base import Encoder, stone_grid
+from dlgo.goboard import GameState
+from dlgo.gotypes import Player
+
+
+class HistoryEncoder(Encoder):
+    """Stones of the last `history_length` positions, plus the side to move.
+
+    For each position k moves back (k = 0 is the current one), plane 2k
+    holds the stones of the player to move now and plane 2k + 1 the
+    opponent's. Positions before the start of the game stay empty. The
+    last plane is all ones when black is to move.
+    """
+
+    def __init__(self, board_size: int | tuple[int, int], history_length: int = 8):
+        super().__init__(board_size)
+        self.history_length = history_length
+
+    def name(self) -> str:
+        return "history"
+
+    def num_planes(self) -> int:
+        return 2 * self.history_length + 1
+
+    def encode_into(self, game_state: GameState, planes: np.ndarray):
+        player = game_state.next_player
+        state = game_state
+        for k in range(self.history_length):
+            if state is None:
+                break
+            stones = stone_grid(state.board)
+            planes[2 * k] = stones == player.value
+            planes[2 * k + 1] = stones == player.other.value
+            state = state.previous_state
+        if player == Player.black:
+            planes[-1] = 1
+
+
+def create(board_size: int | tuple[int, int]) -> HistoryEncoder:
+    return HistoryEncoder(board_size)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import numpy as np
+
+from dlgo.encoders.base import Encoder, stone_grid
+from dlgo.goboard import GameState
+
+
+class OnePlaneEncoder(Encoder):
+    """A single plane: 1 for stones of the player to move, -1 for the
+    opponent's and 0 for empty points"""
+
+    def name(self) -> str:
+        return "oneplane"
+
+    def num_planes(self) -> int:
+        return 1
+
+    def encode_into(self, game_state: GameState, planes: np.ndarray):
+        stones = stone_grid(game_state.board)
+        player = game_state.next_player
+        planes[0] = stones == player.value
+        planes[0] -= stones == player.other.value
+
+
+def create(board_size: int | tuple[int, int]) -> OnePlaneEncoder:
+    return OnePlaneEncoder(board_size)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import numpy as np
+
+from dlgo.encoders.base import Encoder, liberty_grid, stone_grid
+from dlgo.goboard import GameState, Move
+from dlgo.gotypes import Point
+
+
+class SevenPlaneEncoder(Encoder):
+    """Stones by owner and liberty count, plus ko.
+
+    Planes 0-2 hold the stones of the player to move in strings with 1, 2
+    and 3 or more liberties, planes 3-5 the same for the opponent, and
+    plane 6 the points where the player to move may not capture because
+    of ko.
+    """
+
+    def name(self) -> str:
+        return "sevenplane"
+
+    def num_planes(self) -> int:
+        return 7
+
+    def encode_into(self, game_state: GameState, planes: np.ndarray):
+        board = game_state.board
+        stones = stone_grid(board)
+        liberties = np.minimum(liberty_grid(board), 3)
+        player = game_state.next_player
+        for offset, color in ((0, player.value), (3, player.other.value)):
+            owned = stones == color
+            for count in (1, 2, 3):
+                planes[offset + count - 1] = owned & (liberties == count)
+
+        # Under positional superko any play can repeat an earlier position,
+        # so every empty point is checked
+        board_is_self_capture = board.is_self_capture
+        for row, col in zip(*np.nonzero(stones == 0)):
+            point = Point(row=int(row) + 1, col=int(col) + 1)
+            if board_is_self_capture(player, point):
+                continue
+            if game_state.does_move_violate_ko(player, Move.play(point)):
+                planes[6, row, col] = 1
+
+
+def create(board_size: int | tuple[int, int]) -> SevenPlaneEncoder:
+    return SevenPlaneEncoder(board_size)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from dlgo.gotypes import Point, points_for
+
+__all__ = ["BoardGeometry", "geometry_for"]
+
+
+class BoardGeometry:
+    """Neighbor, edge and index tables for one board size.
+
+    Point tables are dicts keyed by the on-board points and only list
+    on-board neighbors and diagonals, so users need no bounds checks.
+    `index[point]` is the row-major position `(row - 1) * num_cols + col - 1`
+    of a point and `points[index]` the interned point at it.
+
+    The `*_indices` tables and `point_at` use the padded layout of
+    FastBoard and scoring, `row * width + col` with a border ring around
+    the playing area. There, neighbors of edge points include border cells,
+    and the entries of border cells themselves are empty or None.
+    `blank_grid` is an empty board in that layout, with 3 in every border
+    cell and 0 in every point, as in the boards' `color_grid`.
+    """
+
+    def __init__(self, num_rows: int, num_cols: int):
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.points = points_for(num_rows, num_cols)
+        self.index = {point: index for index, point in enumerate(self.points)}
+
+        def on_grid(point: Point) -> bool:
+            return 1 <= point.row <= num_rows and 1 <= point.col <= num_cols
+
+        self.neighbors = {
+            point: tuple(n for n in point.neighbors() if on_grid(n))
+            for point in self.points
+        }
+        self.diagonals = {
+            point: tuple(d for d in point.diagonals() if on_grid(d))
+            for point in self.points
+        }
+        # Points with at least one side off the board, and those with two
+        self.edges = frozenset(
+            point for point in self.points if len(self.neighbors[point]) < 4
+        )
+        self.corners = frozenset(
+            point for point in self.points if len(self.neighbors[point]) < 3
+        )
+
+        self.width = width = num_cols + 2
+        self.size = size = (num_rows + 2) * width
+        offsets = (-width, width, -1, 1)
+        diagonal_offsets = (-width - 1, -width + 1, width - 1, width + 1)
+        neighbor_indices = [()] * size
+        diagonal_indices = [()] * size
+        point_at = [None] * size
+        for point in self.points:
+            index = point.row * width + point.col
+            neighbor_indices[index] = tuple(index + offset for offset in offsets)
+            diagonal_indices[index] = tuple(
+                index + offset for offset in diagonal_offsets
+            )
+            point_at[index] = point
+        self.neighbor_indices = tuple(neighbor_indices)
+        self.diagonal_indices = tuple(diagonal_indices)
+        self.point_at = tuple(point_at)
+        blank_grid = bytearray([3]) * size
+        for row in range(1, num_rows + 1):
+            blank_grid[row * width + 1 : row * width + 1 + num_cols] = bytes(num_cols)
+        self.blank_grid = bytes(blank_grid)
+
+
+_geometries: dict[tuple[int, int], BoardGeometry] = {}
+
+
+def geometry_for(num_rows: int, num_cols: int) -> BoardGeometry:
+    """Returns the shared geometry for a board size, building it on first use"""
+    key = (num_rows, num_cols)
+    geometry = _geometries.get(key)
+    if geometry is None:
+        geometry = _geometries[key] = BoardGeometry(num_rows, num_cols)
+    return geometry
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-import copy
-
 from dlgo import zobrist
-from dlgo.gotypes import Player, Point
+from dlgo.geometry import geometry_for
+from dlgo.history import PositionHistory
+from dlgo.gotypes import Player, Point, points_for
 from dlgo.scoring import GameResult, compute_game_result
 
 
 class Move:
+    """A play, pass or resignation. Moves are interned: `play` returns the
+    same object for equal points, and there is one pass and one resign."""
+
+    __slots__ = ("point", "is_play", "is_pass", "is_resign")
+
     def __init__(
         self, point: Point = None, is_pass: bool = False, is_resign: bool = False
     ):
@@ -20,19 +25,50 @@ class Move:
 
     @classmethod
     def play(cls, point: Point):
-        return Move(point=point)
+        move = _plays.get(point)
+        if move is None:
+            move = _plays[point] = Move(point=point)
+        return move
 
     @classmethod
     def pass_turn(cls):
-        return Move(is_pass=True)
+        return _PASS
 
     @classmethod
     def resign(cls):
-        return Move(is_resign=True)
+        return _RESIGN
+
+    def __reduce__(self):
+        # Unpickled and copied moves are the interned ones again
+        if self.is_pass:
+            return Move.pass_turn, ()
+        if self.is_resign:
+            return Move.resign, ()
+        return Move.play, (self.point,)
+
+
+_plays: dict[Point, Move] = {}
+_PASS = Move(is_pass=True)
+_RESIGN = Move(is_resign=True)
+# (num_rows, num_cols) -> a play for every point, in `points_for` order
+_moves: dict[tuple[int, int], tuple[Move, ...]] = {}
+
+
+def moves_for(num_rows: int, num_cols: int) -> tuple[Move, ...]:
+    """The interned play of every point of a board of that size, row by
+    row, aligned with `points_for(num_rows, num_cols)`"""
+    key = (num_rows, num_cols)
+    if key not in _moves:
+        _moves[key] = tuple(
+            Move.play(point) for point in points_for(num_rows, num_cols)
+        )
+    return _moves[key]
 
 
 class GoString:
     # Go strings are a chain of connected stones of the same color
+    __slots__ = ("color", "stones", "liberties")
+
     def __init__(
         self, color: Player, stones: frozenset[Point], liberties: frozenset[Point]
     ):
@@ -75,20 +111,53 @@ class Board:
     def __init__(self, num_rows: int, num_cols: int):
         self.num_rows = num_rows
         self.num_cols = num_cols
-        self._grid: dict[Point, GoString] = {}
+        # The grid is split into one dict per row so that copies can share
+        # every row they don't modify. Only rows in `_owned` may be written
+        # in place; any other row is shared with a parent or child board.
+        self._rows: list[dict[Point, GoString]] = [{} for _ in range(num_rows)]
+        self._owned: set[int] = set(range(num_rows))
+        # On-board neighbors of every point, shared by boards of this size
+        self._neighbors = geometry_for(num_rows, num_cols).neighbors
+        self._zobrist = zobrist.table_for(num_rows, num_cols)
         self._hash = zobrist.EMPTY_BOARD
+        # Per color, indexed by Player value: stones on the board, stones
+        # captured, and empty points whose neighbors are all its stones
+        self._stone_counts = [0, 0, 0]
+        self._captures = [0, 0, 0]
+        self._territory = [0, 0, 0]
+
+    def copy(self):
+        """Returns a copy of the board that shares all rows with this one
+        until either board writes to them"""
+        board = Board.__new__(Board)
+        board.num_rows = self.num_rows
+        board.num_cols = self.num_cols
+        board._rows = list(self._rows)
+        board._owned = set()
+        board._neighbors = self._neighbors
+        board._zobrist = self._zobrist
+        board._hash = self._hash
+        board._stone_counts = self._stone_counts[:]
+        board._captures = self._captures[:]
+        board._territory = self._territory[:]
+        # Rows are now shared, so this board must also copy before writing
+        self._owned = set()
+        return board
+
+    def __deepcopy__(self, memo):
+        board = self.copy()
+        memo[id(self)] = board
+        return board
 
     def place_stone(self, player: Player, point: Point):
         assert self.is_on_grid(point)
-        assert self._grid.get(point) is None
+        assert self._string_at(point) is None
 
         adjacent_same_color: list[GoString] = []
         adjacent_opposite_color: list[GoString] = []
         liberties: list[Point] = []
-        for neighbor in point.neighbors():
-            if not self.is_on_grid(neighbor):
-                continue
-            neighbor_string: GoString | None = self._grid.get(neighbor)
+        for neighbor in self._neighbors[point]:
+            neighbor_string: GoString | None = self._string_at(neighbor)
             if neighbor_string is None:
                 liberties.append(neighbor)
             elif neighbor_string.color == player:
@@ -103,9 +172,20 @@ class Board:
         for same_color_string in adjacent_same_color:
             new_string = new_string.merged_with(same_color_string)
         for new_string_point in new_string.stones:
-            self._grid[new_string_point] = new_string
+            self._set(new_string_point, new_string)
 
-        self._hash ^= zobrist.HASH_CODE[point, player]
+        self._hash ^= self._zobrist.stone(point, player)
+        self._stone_counts[player.value] += 1
+
+        if liberties:
+            # Empty neighbors may now be surrounded by this player alone
+            for liberty in liberties:
+                if self._owner(liberty) == player:
+                    self._territory[player.value] += 1
+        elif bool(adjacent_same_color) != bool(adjacent_opposite_color):
+            # The point itself was single-point territory
+            owner = (adjacent_same_color or adjacent_opposite_color)[0].color
+            self._territory[owner.value] -= 1
 
         for other_color_string in adjacent_opposite_color:
             replacement = other_color_string.without_liberty(point)
@@ -113,39 +193,138 @@ class Board:
                 self._replace_string(replacement)
             else:
                 self._remove_string(other_color_string)
+                self._captures[player.value] += len(other_color_string.stones)
+                # A lone captured stone touched only this player's stones;
+                # in a larger string each touches another emptied point
+                if len(other_color_string.stones) == 1:
+                    self._territory[player.value] += 1
 
     def is_on_grid(self, point: Point):
         return 1 <= point.row <= self.num_rows and 1 <= point.col <= self.num_cols
 
     def get(self, point: Point):
         """Returns the content of a point on the board"""
-        string = self._grid.get(point)
+        string = self._string_at(point)
         return None if string is None else string.color
 
     def get_go_string(self, point: Point):
         """Returns the string of stones connected to a point
         or None if the point is empty"""
-        string = self._grid.get(point)
-        return None if string is None else string
+        return self._string_at(point)
 
     def zobrist_hash(self):
         return self._hash
 
+    def color_grid(self) -> bytearray:
+        """Player values of all points, 0 for empty ones, in the padded
+        layout of the board's geometry (see `BoardGeometry.blank_grid`)"""
+        geometry = geometry_for(self.num_rows, self.num_cols)
+        width = geometry.width
+        grid = bytearray(geometry.blank_grid)
+        for row_strings in self._rows:
+            for point, string in row_strings.items():
+                grid[point.row * width + point.col] = string.color.value
+        return grid
+
+    def liberty_grid(self) -> list[int]:
+        """Liberties of the string at every point, 0 for empty points and
+        border cells, in the layout of `color_grid`"""
+        geometry = geometry_for(self.num_rows, self.num_cols)
+        width = geometry.width
+        grid = [0] * geometry.size
+        for row_strings in self._rows:
+            for point, string in row_strings.items():
+                grid[point.row * width + point.col] = string.num_liberties
+        return grid
+
+    def num_stones(self, player: Player) -> int:
+        return self._stone_counts[player.value]
+
+    def num_captures(self, player: Player) -> int:
+        """Number of stones `player` has captured on this board"""
+        return self._captures[player.value]
+
+    def area_estimate(self, player: Player) -> int:
+        """Stones of `player` plus empty points bordered only by them. This
+        is the exact area score when every empty region is a single point."""
+        return self._stone_counts[player.value] + self._territory[player.value]
+
+    def is_self_capture(self, player: Player, point: Point):
+        """Returns whether playing on an empty point would leave the new
+        string without liberties, without placing the stone"""
+        for neighbor in self._neighbors[point]:
+            neighbor_string = self._string_at(neighbor)
+            if neighbor_string is None:
+                return False
+            if neighbor_string.color == player:
+                if neighbor_string.num_liberties > 1:
+                    return False
+            elif neighbor_string.num_liberties == 1:
+                return False
+        return True
+
+    def zobrist_hash_after(self, player: Player, point: Point):
+        """Returns the hash the board would have after `player` plays on an
+        empty point, without placing the stone"""
+        new_hash = self._hash ^ self._zobrist.stone(point, player)
+        captured: list[GoString] = []
+        for neighbor in self._neighbors[point]:
+            neighbor_string = self._string_at(neighbor)
+            if (
+                neighbor_string is None
+                or neighbor_string.color == player
+                or neighbor_string.num_liberties > 1
+                or neighbor_string in captured
+            ):
+                continue
+            captured.append(neighbor_string)
+            for stone in neighbor_string.stones:
+                new_hash ^= self._zobrist.stone(stone, neighbor_string.color)
+        return new_hash
+
+    def _owner(self, point: Point) -> Player | None:
+        """The player whose stones are the only neighbors of an empty point"""
+        owner = None
+        for neighbor in self._neighbors[point]:
+            neighbor_string = self._string_at(neighbor)
+            if neighbor_string is None:
+                return None
+            if owner is not None and neighbor_string.color != owner:
+                return None
+            owner = neighbor_string.color
+        return owner
+
+    def _string_at(self, point: Point) -> GoString | None:
+        if 1 <= point.row <= self.num_rows:
+            return self._rows[point.row - 1].get(point)
+        return None
+
+    def _set(self, point: Point, string: GoString | None):
+        index = point.row - 1
+        if index not in self._owned:
+            self._rows[index] = dict(self._rows[index])
+            self._owned.add(index)
+        if string is None:
+            self._rows[index].pop(point, None)
+        else:
+            self._rows[index][point] = string
+
     def _replace_string(self, new_string: GoString):
         for point in new_string.stones:
-            self._grid[point] = new_string
+            self._set(point, new_string)
 
     def _remove_string(self, string: GoString):
+        self._stone_counts[string.color.value] -= len(string.stones)
         for point in string.stones:
-            for neighbor in point.neighbors():
-                neighbor_string = self._grid.get(neighbor)
+            for neighbor in self._neighbors[point]:
+                neighbor_string = self._string_at(neighbor)
                 if neighbor_string is None:
                     continue
                 if neighbor_string is not string:
                     self._replace_string(neighbor_string.with_liberty(point))
-            self._grid[point] = None
+            self._set(point, None)
 
-            self._hash ^= zobrist.HASH_CODE[point, string.color]
+            self._hash ^= self._zobrist.stone(point, string.color)
 
 
 class GameState:
@@ -156,27 +335,29 @@ class GameState:
         self.next_player = next_player
         self.previous_state = previous
         if self.previous_state is None:
-            self.previous_states = frozenset()
+            self.previous_states = PositionHistory()
         else:
-            self.previous_states = frozenset(
-                previous.previous_states
-                | {(previous.next_player, previous.board.zobrist_hash())}
+            self.previous_states = previous.previous_states.with_situation(
+                previous.next_player, previous.board.zobrist_hash()
             )
         self.last_move = move
+        self._legal_moves: list[Move] | None = None
 
     def apply_move(self, move: Move):
         if move.is_play:
-            next_board = copy.deepcopy(self.board)
+            next_board = self.board.copy()
             next_board.place_stone(self.next_player, move.point)
         else:
             next_board = self.board
         return GameState(next_board, self.next_player.other, self, move)
 
     @classmethod
-    def new_game(cls, board_size: int | tuple):
+    def new_game(cls, board_size: int | tuple, board_cls: type = Board):
+        """Starts a game on an empty board. `board_cls` selects the board
+        implementation, e.g. `dlgo.goboard_fast.FastBoard`."""
         if isinstance(board_size, int):
             board_size = (board_size, board_size)
-        board = Board(*board_size)
+        board = board_cls(*board_size)
         return GameState(board, Player.black, None, None)
 
     def is_over(self):
@@ -192,10 +373,7 @@ class GameState:
     def is_move_self_capture(self, player: Player, move: Move):
         if not move.is_play:
             return False
-        next_board = copy.deepcopy(self.board)
-        next_board.place_stone(player, move.point)
-        new_string: GoString = next_board.get_go_string(move.point)
-        return new_string.num_liberties == 0
+        return self.board.is_self_capture(player, move.point)
 
     @property
     def situation(self):
@@ -204,10 +382,8 @@ class GameState:
     def does_move_violate_ko(self, player: Player, move: Move):
         if not move.is_play:
             return False
-        next_board = copy.deepcopy(self.board)
-        next_board.place_stone(player, move.point)
-        next_situation = (player.other, next_board.zobrist_hash())
-        return next_situation in self.previous_states
+        next_hash = self.board.zobrist_hash_after(player, move.point)
+        return (player.other, next_hash) in self.previous_states
 
     def is_valid_move(self, move: Move):
         if self.is_over():
@@ -221,18 +397,28 @@ class GameState:
         )
 
     def legal_moves(self):
-        legal_moves: list[Move] = [Move.pass_turn(), Move.resign()]
-        for row in range(1, self.board.num_rows + 1):
-            for col in range(1, self.board.num_cols + 1):
-                move: Move = Move.play(Point(row=row, col=col))
-                if self.is_valid_move(move):
-                    legal_moves.append(move)
-        return legal_moves
-
-    def winner(self):
+        """Returns a new list of every legal move, computed once per state"""
+        if self._legal_moves is None:
+            legal_moves: list[Move] = [Move.pass_turn(), Move.resign()]
+            if not self.is_over():
+                board = self.board
+                player = self.next_player
+                for move in moves_for(board.num_rows, board.num_cols):
+                    point = move.point
+                    if board.get(point) is not None or board.is_self_capture(
+                        player, point
+                    ):
+                        continue
+                    next_hash = board.zobrist_hash_after(player, point)
+                    if (player.other, next_hash) not in self.previous_states:
+                        legal_moves.append(move)
+            self._legal_moves = legal_moves
+        return list(self._legal_moves)
+
+    def winner(self, komi: float = 7.5):
         if not self.is_over():
             return None
         if self.last_move.is_resign:
             return self.next_player
-        game_result: GameResult = compute_game_result(self)
+        game_result: GameResult = compute_game_result(self, komi)
         return game_result.winner
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+from dlgo import zobrist
+from dlgo.geometry import geometry_for
+from dlgo.goboard import GoString
+from dlgo.gotypes import Player, Point
+
+# (num_rows, num_cols) -> mask of every on-board bit
+_on_board_masks: dict[tuple[int, int], int] = {}
+
+
+def _dilate(mask: int, width: int) -> int:
+    """The mask with every bit also spread to its four neighbors. Bits that
+    land on the border or past the board must be masked off by the caller."""
+    return mask << 1 | mask >> 1 | mask << width | mask >> width
+
+
+def _indices(mask: int):
+    """The index of every set bit, lowest first"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class BitBoard:
+    """Board stored as integer bitmasks.
+
+    Bit `row * (num_cols + 2) + col` stands for a point, the padded layout
+    of FastBoard, so shifting a mask by 1 or by the row width moves every
+    bit to a neighbor and the border columns keep shifted bits from wrapping
+    onto the next row. `_colors` holds the stones of each color (indexed by
+    color value). Each string is a single mask, shared by all of its stones
+    through `_strings`. Merging strings is an OR, and liberties are the empty
+    bits of a string's dilation, counted with `int.bit_count`.
+
+    Stone counts and single-point territory are computed from the masks when
+    asked for; only captures are counted as stones are placed.
+    """
+
+    def __init__(self, num_rows: int, num_cols: int):
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        geometry = geometry_for(num_rows, num_cols)
+        self._width = geometry.width
+        self._neighbors = geometry.neighbor_indices
+        self._points = geometry.point_at
+        self._on_board = _on_board_masks.get((num_rows, num_cols))
+        if self._on_board is None:
+            self._on_board = _on_board_masks[num_rows, num_cols] = sum(
+                1 << point.row * self._width + point.col for point in geometry.points
+            )
+        # Stone keys, indexed by `2 * index + color - 1`
+        self._hash_codes = zobrist.table_for(num_rows, num_cols).stones
+        self._colors = [0, 0, 0]
+        self._strings = [0] * geometry.size
+        self._hash = zobrist.EMPTY_BOARD
+        self._captures = [0, 0, 0]
+
+    def copy(self):
+        board = BitBoard.__new__(BitBoard)
+        board.num_rows = self.num_rows
+        board.num_cols = self.num_cols
+        board._width = self._width
+        board._neighbors = self._neighbors
+        board._points = self._points
+        board._on_board = self._on_board
+        board._hash_codes = self._hash_codes
+        board._colors = self._colors[:]
+        # String masks are ints, so the copies can share them
+        board._strings = self._strings[:]
+        board._hash = self._hash
+        board._captures = self._captures[:]
+        return board
+
+    def __deepcopy__(self, memo):
+        board = self.copy()
+        memo[id(self)] = board
+        return board
+
+    def __reduce__(self):
+        # Only stones and captures are pickled; strings are rebuilt
+        return (
+            _bit_board_from_masks,
+            (self.num_rows, self.num_cols, self._colors[1:], self._captures),
+        )
+
+    @classmethod
+    def from_board(cls, board) -> BitBoard:
+        """Builds a BitBoard holding the same stones as any other board"""
+        if isinstance(board, BitBoard):
+            return board.copy()
+        bit_board = cls(board.num_rows, board.num_cols)
+        for point in geometry_for(board.num_rows, board.num_cols).points:
+            player = board.get(point)
+            if player is not None:
+                index = point.row * bit_board._width + point.col
+                bit_board._colors[player.value] |= 1 << index
+        bit_board._rebuild_strings()
+        return bit_board
+
+    def place_stone(self, player: Player, point: Point):
+        assert self.is_on_grid(point)
+        index = point.row * self._width + point.col
+        bit = 1 << index
+        colors = self._colors
+        assert not (colors[1] | colors[2]) & bit
+        color = player.value
+        other = 3 - color
+        strings = self._strings
+
+        string = bit
+        adjacent_opposite: list[int] = []
+        for neighbor in self._neighbors[index]:
+            neighbor_string = strings[neighbor]
+            if not neighbor_string:
+                continue
+            if colors[color] & neighbor_string:
+                string |= neighbor_string
+            elif neighbor_string not in adjacent_opposite:
+                adjacent_opposite.append(neighbor_string)
+
+        colors[color] |= bit
+        for stone in _indices(string):
+            strings[stone] = string
+        self._hash ^= self._hash_codes[2 * index + color - 1]
+
+        empty = self._on_board & ~(colors[1] | colors[2])
+        width = self._width
+        for captured in adjacent_opposite:
+            if _dilate(captured, width) & empty:
+                continue
+            colors[other] ^= captured
+            empty |= captured
+            self._captures[color] += captured.bit_count()
+            for stone in _indices(captured):
+                strings[stone] = 0
+                self._hash ^= self._hash_codes[2 * stone + other - 1]
+
+    def is_on_grid(self, point: Point):
+        return 1 <= point.row <= self.num_rows and 1 <= point.col <= self.num_cols
+
+    def get(self, point: Point):
+        """Returns the content of a point on the board"""
+        if not self.is_on_grid(point):
+            return None
+        bit = 1 << point.row * self._width + point.col
+        if self._colors[1] & bit:
+            return Player.black
+        if self._colors[2] & bit:
+            return Player.white
+        return None
+
+    def get_go_string(self, point: Point):
+        """Returns the string of stones connected to a point
+        or None if the point is empty"""
+        player = self.get(point)
+        if player is None:
+            return None
+        string = self._strings[point.row * self._width + point.col]
+        liberties = _dilate(string, self._width) & self._empty()
+        return GoString(
+            player,
+            [self._points[index] for index in _indices(string)],
+            [self._points[index] for index in _indices(liberties)],
+        )
+
+    def zobrist_hash(self):
+        return self._hash
+
+    def color_grid(self) -> bytearray:
+        """Player values of all points, 0 for empty ones, in the padded
+        layout of the board's geometry"""
+        grid = bytearray(geometry_for(self.num_rows, self.num_cols).blank_grid)
+        for color in (1, 2):
+            for index in _indices(self._colors[color]):
+                grid[index] = color
+        return grid
+
+    def liberty_grid(self) -> list[int]:
+        """Liberties of the string at every point, 0 for empty points and
+        border cells, in the layout of `color_grid`"""
+        grid = [0] * len(self._strings)
+        empty = self._empty()
+        width = self._width
+        remaining = self._colors[1] | self._colors[2]
+        while remaining:
+            string = self._strings[(remaining & -remaining).bit_length() - 1]
+            liberties = (_dilate(string, width) & empty).bit_count()
+            for index in _indices(string):
+                grid[index] = liberties
+            remaining &= ~string
+        return grid
+
+    def num_stones(self, player: Player) -> int:
+        return self._colors[player.value].bit_count()
+
+    def num_captures(self, player: Player) -> int:
+        """Number of stones `player` has captured on this board"""
+        return self._captures[player.value]
+
+    def area_estimate(self, player: Player) -> int:
+        """Stones of `player` plus empty points bordered only by them. This
+        is the exact area score when every empty region is a single point."""
+        own = self._colors[player.value]
+        opponent = self._colors[3 - player.value]
+        empty = self._empty()
+        width = self._width
+        territory = empty & ~_dilate(empty | opponent, width) & _dilate(own, width)
+        return own.bit_count() + territory.bit_count()
+
+    def is_self_capture(self, player: Player, point: Point):
+        """Returns whether playing on an empty point would leave the new
+        string without liberties, without placing the stone"""
+        index = point.row * self._width + point.col
+        strings = self._strings
+        neighbors = self._neighbors[index]
+        for neighbor in neighbors:
+            if not strings[neighbor] and self._on_board >> neighbor & 1:
+                return False
+        bit = 1 << index
+        width = self._width
+        empty = self._empty()
+        own = self._colors[player.value]
+        # The point itself no longer counts as a liberty once played
+        empty ^= bit
+        for neighbor in neighbors:
+            string = strings[neighbor]
+            if not string:
+                continue
+            has_liberty = bool(_dilate(string, width) & empty)
+            if bool(own & string) == has_liberty:
+                # A friendly string keeps a liberty or an enemy one is captured
+                return False
+        return True
+
+    def zobrist_hash_after(self, player: Player, point: Point):
+        """Returns the hash the board would have after `player` plays on an
+        empty point, without placing the stone"""
+        index = point.row * self._width + point.col
+        color = player.value
+        other = 3 - color
+        new_hash = self._hash ^ self._hash_codes[2 * index + color - 1]
+        opponent = self._colors[other]
+        width = self._width
+        empty = None
+        captured: list[int] = []
+        for neighbor in self._neighbors[index]:
+            string = self._strings[neighbor]
+            if not string & opponent or string in captured:
+                continue
+            if empty is None:
+                empty = self._empty() & ~(1 << index)
+            if _dilate(string, width) & empty:
+                continue
+            captured.append(string)
+            for stone in _indices(string):
+                new_hash ^= self._hash_codes[2 * stone + other - 1]
+        return new_hash
+
+    def _empty(self) -> int:
+        return self._on_board & ~(self._colors[1] | self._colors[2])
+
+    def _rebuild_strings(self):
+        """Recomputes `_strings` and the hash from `_colors` by flooding
+        each color mask from every stone not yet in a string"""
+        strings = self._strings = [0] * len(self._strings)
+        self._hash = zobrist.EMPTY_BOARD
+        width = self._width
+        for color in (1, 2):
+            stones = self._colors[color]
+            remaining = stones
+            while remaining:
+                string = remaining & -remaining
+                while True:
+                    grown = string | _dilate(string, width) & stones
+                    if grown == string:
+                        break
+                    string = grown
+                remaining &= ~string
+                for stone in _indices(string):
+                    strings[stone] = string
+                    self._hash ^= self._hash_codes[2 * stone + color - 1]
+
+
+def _bit_board_from_masks(
+    num_rows: int, num_cols: int, masks: list[int], captures: list[int] | None = None
+) -> BitBoard:
+    board = BitBoard(num_rows, num_cols)
+    board._colors = [0] + list(masks)
+    if captures is not None:
+        board._captures = list(captures)
+    board._rebuild_strings()
+    return board
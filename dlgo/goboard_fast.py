@@ -0,0 +1,572 @@
+from __future__ import annotations
+
+from array import array
+
+from dlgo import zobrist
+from dlgo.geometry import geometry_for
+from dlgo.goboard import GameState, GoString, Move, moves_for
+from dlgo.gotypes import Player, Point
+
+EMPTY = 0
+BLACK = Player.black.value
+WHITE = Player.white.value
+BORDER = 3
+
+_PLAYERS = (None, Player.black, Player.white, None)
+_BLACK_PLAYER = Player.black
+
+_NO_CAPTURES: list[int] = []
+
+
+class FastBoard:
+    """Board stored in padded 1-D arrays.
+
+    Every point is addressed by `row * (num_cols + 2) + col`, with a ring of
+    BORDER cells around the playing area so neighbor lookups never need a
+    bounds check. Strings are circular linked lists through `_next`, labelled
+    by the index of their head stone in `_string_id`. `_libs` holds the
+    pseudo-liberty count of each string (empty neighbors counted once per
+    adjacent stone), which is zero exactly when the string has no liberties.
+
+    Stone counts, captures and single-point territory are kept per color
+    (indexed by color value) as stones are placed and captured.
+    """
+
+    def __init__(self, num_rows: int, num_cols: int):
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self._width = num_cols + 2
+        size = (num_rows + 2) * self._width
+        geometry = geometry_for(num_rows, num_cols)
+        self._neighbors = geometry.neighbor_indices
+        self._diagonals = geometry.diagonal_indices
+        self._points = geometry.point_at
+        # Stone keys, indexed by `2 * index + color - 1`
+        self._hash_codes = zobrist.table_for(num_rows, num_cols).stones
+        self._stones = array("b", [BORDER]) * size
+        for row in range(1, num_rows + 1):
+            start = row * self._width + 1
+            self._stones[start : start + num_cols] = array("b", [EMPTY]) * num_cols
+        self._string_id = array("i", [0]) * size
+        self._next = array("i", [0]) * size
+        self._size = array("i", [0]) * size
+        self._libs = array("i", [0]) * size
+        self._hash = zobrist.EMPTY_BOARD
+        self._stone_counts = [0, 0, 0]
+        self._captures = [0, 0, 0]
+        self._territory = [0, 0, 0]
+
+    def copy(self):
+        board = FastBoard.__new__(FastBoard)
+        board.num_rows = self.num_rows
+        board.num_cols = self.num_cols
+        board._width = self._width
+        board._neighbors = self._neighbors
+        board._diagonals = self._diagonals
+        board._points = self._points
+        board._hash_codes = self._hash_codes
+        board._stones = self._stones[:]
+        board._string_id = self._string_id[:]
+        board._next = self._next[:]
+        board._size = self._size[:]
+        board._libs = self._libs[:]
+        board._hash = self._hash
+        board._stone_counts = self._stone_counts[:]
+        board._captures = self._captures[:]
+        board._territory = self._territory[:]
+        return board
+
+    def __deepcopy__(self, memo):
+        board = self.copy()
+        memo[id(self)] = board
+        return board
+
+    def __reduce__(self):
+        # Only stones and captures are pickled; the rest is rebuilt
+        return (
+            _fast_board_from_stones,
+            (self.num_rows, self.num_cols, self._stones.tobytes(), self._captures),
+        )
+
+    @classmethod
+    def from_board(cls, board) -> FastBoard:
+        """Builds a FastBoard holding the same stones as any other board"""
+        if isinstance(board, FastBoard):
+            return board.copy()
+        fast_board = cls(board.num_rows, board.num_cols)
+        for point in geometry_for(board.num_rows, board.num_cols).points:
+            player = board.get(point)
+            if player is not None:
+                index = point.row * fast_board._width + point.col
+                fast_board._stones[index] = player.value
+        fast_board._rebuild_strings()
+        return fast_board
+
+    def place_stone(self, player: Player, point: Point):
+        row, col = point
+        assert 1 <= row <= self.num_rows and 1 <= col <= self.num_cols
+        self._place(
+            BLACK if player is _BLACK_PLAYER else WHITE, row * self._width + col
+        )
+
+    def _place(self, color: int, index: int) -> list[int]:
+        """Places a stone by point index and returns the captured indices"""
+        stones = self._stones
+        assert stones[index] == EMPTY
+
+        string_id = self._string_id
+        libs = self._libs
+        stones[index] = color
+        next_ = self._next
+        string_id[index] = index
+        next_[index] = index
+        self._size[index] = 1
+        libs[index] = 0
+        self._hash ^= self._hash_codes[2 * index + color - 1]
+        self._stone_counts[color] += 1
+
+        head = index
+        liberties = 0
+        # Colors of the neighboring stones, as a bit mask of color values
+        around = 0
+        neighbors = self._neighbors[index]
+        for neighbor in neighbors:
+            neighbor_color = stones[neighbor]
+            if neighbor_color == EMPTY:
+                liberties += 1
+            elif neighbor_color != BORDER:
+                around |= neighbor_color
+                # The new stone takes away one pseudo-liberty from that string
+                neighbor_head = string_id[neighbor]
+                libs[neighbor_head] -= 1
+                if neighbor_color == color and neighbor_head != head:
+                    if head == index:
+                        # First friendly string: link the lone stone into it
+                        string_id[index] = neighbor_head
+                        next_[index] = next_[neighbor_head]
+                        next_[neighbor_head] = index
+                        self._size[neighbor_head] += 1
+                        head = neighbor_head
+                    else:
+                        head = self._merge(head, neighbor_head)
+        libs[head] += liberties
+
+        territory = self._territory
+        if liberties:
+            # Empty neighbors may now be surrounded by this color alone
+            all_neighbors = self._neighbors
+            for neighbor in neighbors:
+                if stones[neighbor] != EMPTY:
+                    continue
+                for other in all_neighbors[neighbor]:
+                    if stones[other] != color and stones[other] != BORDER:
+                        break
+                else:
+                    territory[color] += 1
+        elif around == BLACK or around == WHITE:
+            # The point itself was single-point territory
+            territory[around] -= 1
+
+        captured = _NO_CAPTURES
+        for neighbor in neighbors:
+            if stones[neighbor] + color == BLACK + WHITE:
+                neighbor_head = string_id[neighbor]
+                if libs[neighbor_head] == 0:
+                    removed = self._remove_string(neighbor_head)
+                    # A lone captured stone touched only stones of this
+                    # color; in a larger string each touches another one
+                    if len(removed) == 1:
+                        territory[color] += 1
+                    captured = captured + removed
+        self._captures[color] += len(captured)
+        return captured
+
+    def is_on_grid(self, point: Point):
+        return 1 <= point.row <= self.num_rows and 1 <= point.col <= self.num_cols
+
+    def get(self, point: Point):
+        """Returns the content of a point on the board"""
+        if not self.is_on_grid(point):
+            return None
+        return _PLAYERS[self._stones[point.row * self._width + point.col]]
+
+    def get_go_string(self, point: Point):
+        """Returns the string of stones connected to a point
+        or None if the point is empty"""
+        if self.get(point) is None:
+            return None
+        head = self._string_id[point.row * self._width + point.col]
+        stones = self._string_stones(head)
+        return GoString(
+            _PLAYERS[self._stones[head]],
+            [self._point(index) for index in stones],
+            [self._point(index) for index in self._liberties(stones)],
+        )
+
+    def zobrist_hash(self):
+        return self._hash
+
+    def color_grid(self) -> array:
+        """Player values of all points, 0 for empty ones, in the padded
+        layout of the board's geometry. This is the board's own array and
+        must not be modified."""
+        return self._stones
+
+    def liberty_grid(self) -> list[int]:
+        """Liberties of the string at every point, 0 for empty points and
+        border cells, in the layout of `color_grid`"""
+        stones = self._stones
+        string_id = self._string_id
+        neighbors = self._neighbors
+        # Only pseudo-liberties are kept, so count each empty point once
+        # per string it touches
+        counts = [0] * len(stones)
+        for index, color in enumerate(stones):
+            if color != EMPTY:
+                continue
+            heads = {
+                string_id[neighbor]
+                for neighbor in neighbors[index]
+                if stones[neighbor] == BLACK or stones[neighbor] == WHITE
+            }
+            for head in heads:
+                counts[head] += 1
+        return [
+            counts[string_id[index]] if color == BLACK or color == WHITE else 0
+            for index, color in enumerate(stones)
+        ]
+
+    def num_stones(self, player: Player) -> int:
+        return self._stone_counts[player.value]
+
+    def num_captures(self, player: Player) -> int:
+        """Number of stones `player` has captured on this board"""
+        return self._captures[player.value]
+
+    def area_estimate(self, player: Player) -> int:
+        """Stones of `player` plus empty points bordered only by them. This
+        is the exact area score when every empty region is a single point."""
+        return self._stone_counts[player.value] + self._territory[player.value]
+
+    def is_self_capture(self, player: Player, point: Point):
+        """Returns whether playing on an empty point would leave the new
+        string without liberties, without placing the stone"""
+        return self._is_self_capture(
+            BLACK if player is _BLACK_PLAYER else WHITE,
+            point.row * self._width + point.col,
+        )
+
+    def _is_self_capture(self, color: int, index: int) -> bool:
+        stones = self._stones
+        for neighbor in self._neighbors[index]:
+            neighbor_color = stones[neighbor]
+            if neighbor_color == EMPTY:
+                return False
+            if neighbor_color == BORDER:
+                continue
+            has_other = self._has_liberty_besides(self._string_id[neighbor], index)
+            if (neighbor_color == color) == has_other:
+                # A friendly string keeps a liberty or an enemy one is captured
+                return False
+        return True
+
+    def zobrist_hash_after(self, player: Player, point: Point):
+        """Returns the hash the board would have after `player` plays on an
+        empty point, without placing the stone"""
+        index = point.row * self._width + point.col
+        color = BLACK if player is _BLACK_PLAYER else WHITE
+        new_hash = self._hash ^ self._hash_codes[2 * index + color - 1]
+        stones = self._stones
+        captured: list[int] = []
+        for neighbor in self._neighbors[index]:
+            if stones[neighbor] + color != BLACK + WHITE:
+                continue
+            head = self._string_id[neighbor]
+            if head in captured or self._has_liberty_besides(head, index):
+                continue
+            captured.append(head)
+            offset = stones[head] - 1
+            for stone in self._string_stones(head):
+                new_hash ^= self._hash_codes[2 * stone + offset]
+        return new_hash
+
+    def _is_eye(self, color: int, index: int) -> bool:
+        """Same test as `dlgo.agents.helpers.is_point_an_eye`, by index"""
+        stones = self._stones
+        if stones[index] != EMPTY:
+            return False
+        for neighbor in self._neighbors[index]:
+            if stones[neighbor] != color and stones[neighbor] != BORDER:
+                return False
+        friendly_corners = 0
+        off_board_corners = 0
+        for corner in self._diagonals[index]:
+            if stones[corner] == color:
+                friendly_corners += 1
+            elif stones[corner] == BORDER:
+                off_board_corners += 1
+        if off_board_corners > 0:
+            return off_board_corners + friendly_corners == 4
+        return friendly_corners >= 3
+
+    def _owner(self, index: int) -> int:
+        """Color whose stones are the only neighbors of an empty point, or
+        EMPTY if it has an empty neighbor or touches both colors"""
+        stones = self._stones
+        owner = EMPTY
+        for neighbor in self._neighbors[index]:
+            neighbor_color = stones[neighbor]
+            if neighbor_color == EMPTY:
+                return EMPTY
+            if neighbor_color != BORDER:
+                if owner and neighbor_color != owner:
+                    return EMPTY
+                owner = neighbor_color
+        return owner
+
+    def _point(self, index: int) -> Point:
+        return self._points[index]
+
+    def _string_stones(self, head: int) -> list[int]:
+        stones = [head]
+        index = self._next[head]
+        while index != head:
+            stones.append(index)
+            index = self._next[index]
+        return stones
+
+    def _has_liberty_besides(self, head: int, index: int) -> bool:
+        """Whether a string has a liberty other than the empty point `index`.
+        Every pseudo-liberty beyond the ones from stones touching `index`
+        must be some other empty point."""
+        stones = self._stones
+        string_id = self._string_id
+        touching = 0
+        for neighbor in self._neighbors[index]:
+            if string_id[neighbor] == head and stones[neighbor] != EMPTY:
+                touching += 1
+        return self._libs[head] > touching
+
+    def _liberties(self, stones: list[int]) -> set[int]:
+        return {
+            neighbor
+            for index in stones
+            for neighbor in self._neighbors[index]
+            if self._stones[neighbor] == EMPTY
+        }
+
+    def _merge(self, head: int, other: int) -> int:
+        """Joins two strings, relabelling the smaller one, and returns the
+        head of the combined string"""
+        size = self._size
+        if size[head] < size[other]:
+            head, other = other, head
+        string_id = self._string_id
+        next_ = self._next
+        index = other
+        while True:
+            string_id[index] = head
+            index = next_[index]
+            if index == other:
+                break
+        next_[head], next_[other] = next_[other], next_[head]
+        size[head] += size[other]
+        self._libs[head] += self._libs[other]
+        return head
+
+    def _rebuild_strings(self):
+        """Recomputes strings, pseudo-liberties, counts and the hash from
+        `_stones`. Captures are not known from the stones and are kept."""
+        stones = self._stones
+        string_id = self._string_id
+        next_ = self._next
+        hash_codes = self._hash_codes
+        self._hash = zobrist.EMPTY_BOARD
+        self._stone_counts = [0, 0, 0]
+        self._territory = [0, 0, 0]
+        for index in range(len(stones)):
+            string_id[index] = next_[index] = self._size[index] = self._libs[index] = 0
+        for start in range(len(stones)):
+            color = stones[start]
+            if color == EMPTY:
+                # Slot 0 collects the points that belong to neither color
+                self._territory[self._owner(start)] += 1
+            if color not in (BLACK, WHITE) or string_id[start]:
+                continue
+            members = [start]
+            string_id[start] = start
+            liberties = 0
+            for index in members:
+                self._hash ^= hash_codes[2 * index + color - 1]
+                for neighbor in self._neighbors[index]:
+                    if stones[neighbor] == EMPTY:
+                        liberties += 1
+                    elif stones[neighbor] == color and not string_id[neighbor]:
+                        string_id[neighbor] = start
+                        members.append(neighbor)
+            for index, following in zip(members, members[1:] + [start]):
+                next_[index] = following
+            self._size[start] = len(members)
+            self._libs[start] = liberties
+            self._stone_counts[color] += len(members)
+
+    def _remove_string(self, head: int) -> list[int]:
+        stones = self._stones
+        removed = self._string_stones(head)
+        offset = stones[head] - 1
+        self._stone_counts[stones[head]] -= len(removed)
+        hash_codes = self._hash_codes
+        for index in removed:
+            stones[index] = EMPTY
+            self._hash ^= hash_codes[2 * index + offset]
+        string_id = self._string_id
+        libs = self._libs
+        for index in removed:
+            for neighbor in self._neighbors[index]:
+                if stones[neighbor] in (BLACK, WHITE):
+                    libs[string_id[neighbor]] += 1
+        return removed
+
+
+def _fast_board_from_stones(
+    num_rows: int, num_cols: int, stones: bytes, captures: list[int] | None = None
+) -> FastBoard:
+    board = FastBoard(num_rows, num_cols)
+    board._stones = array("b", stones)
+    if captures is not None:
+        board._captures = list(captures)
+    board._rebuild_strings()
+    return board
+
+
+class SearchState:
+    """Mutable game state for tree search.
+
+    Duck-types the parts of GameState that agents and evaluation functions
+    read (`board`, `next_player`, `last_move`, `is_over`, `legal_moves`), but
+    moves are made with `play` and taken back with `undo` instead of creating
+    a new state per move. `play` updates strings, captures and the hash
+    incrementally on a copy of the arrays and `undo` restores the previous
+    ones, so no move costs more than a few array copies.
+    """
+
+    def __init__(
+        self,
+        board: FastBoard,
+        next_player: Player,
+        situations: dict[tuple[Player, int], int] | None = None,
+        moves: list[Move] | None = None,
+    ):
+        self._boards = [board]
+        self.next_player = next_player
+        # Counts of every earlier (player, hash) situation, for superko
+        self._situations = dict(situations or {})
+        self._moves: list[Move | None] = list(moves or [])
+        # Moves made with `play`, i.e. nodes visited by a search
+        self.num_plays = 0
+
+    @classmethod
+    def from_game_state(cls, game_state: GameState) -> SearchState:
+        situations: dict[tuple[Player, int], int] = {}
+        for situation in game_state.previous_states:
+            situations[situation] = situations.get(situation, 0) + 1
+        moves = []
+        if game_state.previous_state is not None:
+            moves.append(game_state.previous_state.last_move)
+        moves.append(game_state.last_move)
+        return cls(
+            FastBoard.from_board(game_state.board),
+            game_state.next_player,
+            situations,
+            moves,
+        )
+
+    def __reduce__(self):
+        # Pickles the current position only, not the undo stack
+        return (
+            SearchState,
+            (self.board, self.next_player, self._situations, self._moves[-2:]),
+        )
+
+    def copy(self) -> SearchState:
+        """Returns an independent state at the current position, without the
+        undo stack. Boards on the stack are never modified, so it is shared."""
+        return SearchState(
+            self.board, self.next_player, self._situations, self._moves[-2:]
+        )
+
+    @property
+    def board(self) -> FastBoard:
+        return self._boards[-1]
+
+    @property
+    def last_move(self) -> Move | None:
+        return self._moves[-1] if self._moves else None
+
+    def play(self, move: Move):
+        """Applies a move in place. The move is assumed to be legal."""
+        board = self._boards[-1]
+        situation = (self.next_player, board._hash)
+        self._situations[situation] = self._situations.get(situation, 0) + 1
+        if move.is_play:
+            board = board.copy()
+            board.place_stone(self.next_player, move.point)
+        self._boards.append(board)
+        self._moves.append(move)
+        self.next_player = self.next_player.other
+        self.num_plays += 1
+
+    def undo(self):
+        """Takes back the last move made with `play`"""
+        self._boards.pop()
+        self._moves.pop()
+        self.next_player = self.next_player.other
+        situation = (self.next_player, self._boards[-1]._hash)
+        count = self._situations[situation] - 1
+        if count:
+            self._situations[situation] = count
+        else:
+            del self._situations[situation]
+
+    def is_over(self):
+        if not self._moves or self._moves[-1] is None:
+            return False
+        if self._moves[-1].is_resign:
+            return True
+        if len(self._moves) < 2 or self._moves[-2] is None:
+            return False
+        return self._moves[-1].is_pass and self._moves[-2].is_pass
+
+    def is_valid_move(self, move: Move):
+        if self.is_over():
+            return False
+        if move.is_pass or move.is_resign:
+            return True
+        board = self.board
+        player = self.next_player
+        return (
+            board.get(move.point) is None
+            and not board.is_self_capture(player, move.point)
+            and (player.other, board.zobrist_hash_after(player, move.point))
+            not in self._situations
+        )
+
+    def legal_moves(self):
+        legal_moves: list[Move] = [Move.pass_turn(), Move.resign()]
+        if self.is_over():
+            return legal_moves
+        board = self.board
+        player = self.next_player
+        opponent = player.other
+        width = board._width
+        stones = board._stones
+        for move in moves_for(board.num_rows, board.num_cols):
+            point = move.point
+            if stones[point.row * width + point.col] != EMPTY:
+                continue
+            if board.is_self_capture(player, point):
+                continue
+            next_hash = board.zobrist_hash_after(player, point)
+            if (opponent, next_hash) not in self._situations:
+                legal_moves.append(move)
+        return legal_moves
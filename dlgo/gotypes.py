@@ -12,13 +12,52 @@ class Player(enum.Enum):
 
 
 class Point(namedtuple("Point", "row col")):
+    __slots__ = ()
+
     row: int
     col: int
 
     def neighbors(self):
-        return [
-            Point(self.row - 1, self.col),
-            Point(self.row + 1, self.col),
-            Point(self.row, self.col - 1),
-            Point(self.row, self.col + 1),
-        ]
+        """The four orthogonal neighbors, built once per point and shared"""
+        neighbors = _neighbors.get(self)
+        if neighbors is None:
+            row, col = self
+            neighbors = _neighbors[self] = (
+                Point(row - 1, col),
+                Point(row + 1, col),
+                Point(row, col - 1),
+                Point(row, col + 1),
+            )
+        return neighbors
+
+    def diagonals(self):
+        """The four diagonal neighbors, built once per point and shared"""
+        diagonals = _diagonals.get(self)
+        if diagonals is None:
+            row, col = self
+            diagonals = _diagonals[self] = (
+                Point(row - 1, col - 1),
+                Point(row - 1, col + 1),
+                Point(row + 1, col - 1),
+                Point(row + 1, col + 1),
+            )
+        return diagonals
+
+
+_neighbors: dict[Point, tuple[Point, ...]] = {}
+_diagonals: dict[Point, tuple[Point, ...]] = {}
+# (num_rows, num_cols) -> every point of the board, row by row
+_points: dict[tuple[int, int], tuple[Point, ...]] = {}
+
+
+def points_for(num_rows: int, num_cols: int) -> tuple[Point, ...]:
+    """Every point of a board of that size, row by row. The same Point
+    objects are returned for every call."""
+    key = (num_rows, num_cols)
+    if key not in _points:
+        _points[key] = tuple(
+            Point(row=row, col=col)
+            for row in range(1, num_rows + 1)
+            for col in range(1, num_cols + 1)
+        )
+    return _points[key]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from dlgo.gotypes import Player
+
+__all__ = ["PositionHistory"]
+
+_BLOOM_BITS = 14
+_BLOOM_MASK = (1 << _BLOOM_BITS) - 1
+_BLOOM_HASHES = 3
+_PLAYER_MIX = {Player.black: 0x9E3779B97F4A7C15, Player.white: 0xC2B2AE3D27D4EB4F}
+
+
+def _bloom_bits(player: Player, board_hash: int) -> int:
+    key = board_hash ^ _PLAYER_MIX[player]
+    bits = 0
+    for _ in range(_BLOOM_HASHES):
+        bits |= 1 << (key & _BLOOM_MASK)
+        key >>= _BLOOM_BITS
+    return bits
+
+
+class PositionHistory:
+    """Persistent set of (player, zobrist hash) situations.
+
+    Each history is its parent plus one situation, so extending it is O(1)
+    and every branch of a game tree shares its common prefix. Membership is
+    first tested against a Bloom filter carried along the chain; only a
+    filter hit walks the chain to confirm the match exactly.
+    """
+
+    __slots__ = ("situation", "parent", "_bloom", "_len")
+
+    def __init__(self):
+        self.situation: tuple[Player, int] | None = None
+        self.parent: PositionHistory | None = None
+        self._bloom = 0
+        self._len = 0
+
+    def with_situation(self, player: Player, board_hash: int) -> PositionHistory:
+        history = PositionHistory.__new__(PositionHistory)
+        history.situation = (player, board_hash)
+        history.parent = self
+        history._bloom = self._bloom | _bloom_bits(player, board_hash)
+        history._len = self._len + 1
+        return history
+
+    def __contains__(self, situation: tuple[Player, int]):
+        player, board_hash = situation
+        bits = _bloom_bits(player, board_hash)
+        if self._bloom & bits != bits:
+            return False
+        return any(other == situation for other in self)
+
+    def __iter__(self):
+        history = self
+        while history.parent is not None:
+            yield history.situation
+            history = history.parent
+
+    def __len__(self):
+        return self._len
@@ -0,0 +1,280 @@
+"""Optional call counters, timers and profiles for the hot paths.
+
+Nothing here is active until `enable()` is called: it replaces the
+functions listed in TARGETS with timing wrappers, and `disable()` puts the
+originals back, so a disabled layer costs nothing at all. Functions that
+other modules imported by name are patched there too.
+
+    from dlgo import instrument
+
+    with instrument.instrumented():
+        bot.select_move(game_state)
+    print(instrument.report())
+
+`ProfilingAgent` wraps an agent to write a cProfile file or collapsed
+stack samples (for flamegraph.pl or speedscope) for every `select_move`.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import cProfile
+import functools
+import importlib
+import os
+import sys
+import threading
+import time
+
+from dlgo.agents.base import Agent
+from dlgo.goboard import GameState, Move
+
+__all__ = [
+    "enable",
+    "disable",
+    "is_enabled",
+    "instrumented",
+    "reset",
+    "stats",
+    "report",
+    "StackSampler",
+    "ProfilingAgent",
+]
+
+# (module, qualified name) of every instrumented function. _alpha_beta and
+# SearchState.play are called once per search node.
+TARGETS = [
+    ("dlgo.goboard", "Board.place_stone"),
+    ("dlgo.goboard", "Board._remove_string"),
+    ("dlgo.goboard_fast", "FastBoard._place"),
+    ("dlgo.goboard_fast", "FastBoard._remove_string"),
+    ("dlgo.goboard", "GameState.apply_move"),
+    ("dlgo.goboard", "GameState.is_valid_move"),
+    ("dlgo.goboard", "GameState.legal_moves"),
+    ("dlgo.goboard_fast", "SearchState.play"),
+    ("dlgo.goboard_fast", "SearchState.legal_moves"),
+    ("dlgo.scoring", "compute_game_result"),
+    ("dlgo.agents.helpers", "alpha_beta"),
+    ("dlgo.agents.helpers", "_alpha_beta"),
+]
+
+# name -> [calls, seconds]; time is only counted for the outermost call of
+# a recursive function
+_stats: dict[str, list] = collections.defaultdict(lambda: [0, 0.0])
+_active: dict[str, int] = collections.defaultdict(int)
+# (owner, attribute, original) for everything patched by enable()
+_patches: list[tuple[object, str, object]] = []
+# (attribute, wrapper, original) of the module-level functions, which
+# modules imported while enabled can bind by name
+_wrapped: list[tuple[str, object, object]] = []
+
+
+def _wrap(name: str, fn):
+    stats = _stats[name]
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        stats[0] += 1
+        if _active[name]:
+            return fn(*args, **kwargs)
+        _active[name] += 1
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            stats[1] += time.perf_counter() - start
+            _active[name] -= 1
+
+    return wrapper
+
+
+def enable():
+    """Wraps every target function; does nothing if already enabled"""
+    if _patches:
+        return
+    for module_name, qualname in TARGETS:
+        module = importlib.import_module(module_name)
+        owner_name, _, attribute = qualname.rpartition(".")
+        if owner_name:
+            owner = getattr(module, owner_name)
+            original = owner.__dict__[attribute]
+            owners = [owner]
+        else:
+            original = getattr(module, attribute)
+            # Also patch the modules that did `from ... import <function>`
+            owners = [
+                other
+                for other_name, other in list(sys.modules.items())
+                if other_name.split(".")[0] == "dlgo"
+                and getattr(other, attribute, None) is original
+            ]
+        wrapper = _wrap(qualname, original)
+        if not owner_name:
+            _wrapped.append((attribute, wrapper, original))
+        for owner in owners:
+            _patches.append((owner, attribute, original))
+            setattr(owner, attribute, wrapper)
+
+
+def disable():
+    """Restores the original functions; collected stats are kept"""
+    while _patches:
+        owner, attribute, original = _patches.pop()
+        setattr(owner, attribute, original)
+    # Modules imported while enabled hold wrappers that weren't patched in
+    modules = [
+        module
+        for name, module in list(sys.modules.items())
+        if name.split(".")[0] == "dlgo"
+    ]
+    while _wrapped:
+        attribute, wrapper, original = _wrapped.pop()
+        for module in modules:
+            if getattr(module, attribute, None) is wrapper:
+                setattr(module, attribute, original)
+
+
+def is_enabled() -> bool:
+    return bool(_patches)
+
+
+@contextlib.contextmanager
+def instrumented():
+    """Enables instrumentation for the duration of a block"""
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def reset():
+    for stats in _stats.values():
+        stats[0] = 0
+        stats[1] = 0.0
+
+
+def stats() -> dict[str, dict[str, float]]:
+    """Calls and cumulative seconds of every function called so far"""
+    return {
+        name: {"calls": calls, "seconds": seconds}
+        for name, (calls, seconds) in _stats.items()
+        if calls
+    }
+
+
+def report() -> str:
+    lines = [f"{'function':<32} {'calls':>10} {'seconds':>10} {'us/call':>10}"]
+    for name, (calls, seconds) in sorted(_stats.items(), key=lambda item: -item[1][1]):
+        if calls:
+            lines.append(
+                f"{name:<32} {calls:>10} {seconds:>10.4f} "
+                f"{seconds / calls * 1e6:>10.2f}"
+            )
+    return "\n".join(lines)
+
+
+class StackSampler:
+    """Samples the call stack of one thread from a background thread.
+
+    `collapsed()` returns the samples in the collapsed stack format, one
+    "outer;...;inner count" line per distinct stack, as read by
+    flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, interval: float = 0.001, thread_id: int | None = None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.samples: collections.Counter = collections.Counter()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> StackSampler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                name = getattr(code, "co_qualname", code.co_name)
+                module = frame.f_globals.get("__name__", "?")
+                stack.append(f"{module}:{name}")
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.samples.most_common()
+        )
+
+
+class ProfilingAgent(Agent):
+    """Wraps an agent and profiles every `select_move` into `out_dir`.
+
+    With mode "cprofile" each move is written as `move-NNNN.prof` (read
+    with pstats or snakeviz); with "samples" as collapsed stacks in
+    `move-NNNN.folded`. Other attributes are those of the wrapped agent.
+    """
+
+    CPROFILE = "cprofile"
+    SAMPLES = "samples"
+
+    def __init__(
+        self,
+        agent: Agent,
+        out_dir: str,
+        mode: str = CPROFILE,
+        interval: float = 0.001,
+    ):
+        if mode not in (self.CPROFILE, self.SAMPLES):
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        self.agent = agent
+        self.out_dir = out_dir
+        self.mode = mode
+        self.interval = interval
+        self.num_moves = 0
+        os.makedirs(out_dir, exist_ok=True)
+
+    def select_move(self, game_state: GameState) -> Move:
+        self.num_moves += 1
+        path = os.path.join(self.out_dir, f"move-{self.num_moves:04d}")
+        if self.mode == self.CPROFILE:
+            profile = cProfile.Profile()
+            try:
+                return profile.runcall(self.agent.select_move, game_state)
+            finally:
+                profile.dump_stats(path + ".prof")
+        sampler = StackSampler(self.interval)
+        try:
+            with sampler:
+                return self.agent.select_move(game_state)
+        finally:
+            with open(path + ".folded", "w") as f:
+                f.write(sampler.collapsed())
+
+    def __getattr__(self, name: str):
+        # Only called for attributes not found on the wrapper itself
+        if name == "agent":
+            raise AttributeError(name)
+        return getattr(self.agent, name)
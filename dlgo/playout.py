@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import random
+
+from dlgo.goboard_fast import BLACK, EMPTY, WHITE, FastBoard
+from dlgo.gotypes import Player
+
+__all__ = ["random_playout", "area_score"]
+
+
+def area_score(board: FastBoard) -> tuple[int, int]:
+    """Counts stones plus empty points bordered by only one color.
+
+    Matches `dlgo.scoring.evaluate_territory` on finished playouts, where
+    every remaining empty region is a single point.
+    """
+    return board.area_estimate(Player.black), board.area_estimate(Player.white)
+
+
+def random_playout(
+    board: FastBoard,
+    next_player: Player,
+    komi: float = 7.5,
+    max_moves: int | None = None,
+    rng: random.Random | None = None,
+) -> Player:
+    """Plays random moves on a copy of the board until both sides pass and
+    returns the winner.
+
+    Like RandomBot, a side never fills its own eyes and passes when it has no
+    other move. Playouts work on point indices only and use the simple ko
+    rule instead of superko, so no GameState or Move is created.
+    """
+    board = board.copy()
+    stones = board._stones
+    width = board._width
+    empties = [
+        index
+        for row in range(1, board.num_rows + 1)
+        for index in range(row * width + 1, row * width + board.num_cols + 1)
+        if stones[index] == EMPTY
+    ]
+    if max_moves is None:
+        max_moves = 3 * board.num_rows * board.num_cols
+    uniform = (rng or random).random
+    is_eye = board._is_eye
+    is_self_capture = board._is_self_capture
+    color = BLACK if next_player == Player.black else WHITE
+    ko = 0
+    passes = 0
+    for _ in range(max_moves):
+        move = 0
+        candidates = len(empties)
+        while candidates:
+            k = int(uniform() * candidates)
+            index = empties[k]
+            if (
+                index != ko
+                and not is_eye(color, index)
+                and not is_self_capture(color, index)
+            ):
+                move = index
+                empties[k] = empties[-1]
+                empties.pop()
+                break
+            # Park rejected points at the end of the list for this turn
+            candidates -= 1
+            empties[k], empties[candidates] = empties[candidates], empties[k]
+
+        if move:
+            passes = 0
+            ko = 0
+            captured = board._place(color, move)
+            if captured:
+                empties.extend(captured)
+                head = board._string_id[move]
+                if (
+                    len(captured) == 1
+                    and board._size[head] == 1
+                    and board._libs[head] == 1
+                ):
+                    ko = captured[0]
+        else:
+            passes += 1
+            ko = 0
+            if passes == 2:
+                break
+        color = BLACK + WHITE - color
+
+    black, white = area_score(board)
+    return Player.black if black > white + komi else Player.white
@@ -2,8 +2,13 @@ from __future__ import annotations
 
 from collections import namedtuple
 
+from dlgo.geometry import geometry_for
 from dlgo.gotypes import Player, Point
 
+# Values of a board's `color_grid`, besides the Player values
+_EMPTY = 0
+_BORDER = 3
+
 
 class Territory:
     def __init__(self, territory_map: dict[Point, Player | str]):
@@ -26,6 +31,24 @@ class Territory:
                 self.num_neutral += 1
                 self.neutral_points.append(point)
 
+    @classmethod
+    def from_counts(
+        cls,
+        num_black_stones: int,
+        num_white_stones: int,
+        num_black_territory: int,
+        num_white_territory: int,
+        neutral_points: list[Point],
+    ) -> Territory:
+        territory = cls({})
+        territory.num_black_stones = num_black_stones
+        territory.num_white_stones = num_white_stones
+        territory.num_black_territory = num_black_territory
+        territory.num_white_territory = num_white_territory
+        territory.num_neutral = len(neutral_points)
+        territory.neutral_points = neutral_points
+        return territory
+
 
 class GameResult(namedtuple("GameResult", "black white komi")):
     @property
@@ -47,56 +70,61 @@ class GameResult(namedtuple("GameResult", "black white komi")):
 
 
 def evaluate_territory(board):
-    status = {}
+    """Labels every empty region of the board as black or white territory
+    when all stones around it have one color, and as neutral otherwise"""
+    geometry = geometry_for(board.num_rows, board.num_cols)
+    grid = board.color_grid()
+    width = geometry.width
+    neighbor_indices = geometry.neighbor_indices
+    point_at = geometry.point_at
+    # Stone counts and territory sizes, both indexed by Player value
+    stones = [0, 0, 0]
+    territory = [0, 0, 0]
+    neutral_points = []
+    seen = bytearray(len(grid))
     for row in range(1, board.num_rows + 1):
-        for col in range(1, board.num_cols + 1):
-            point = Point(row=row, col=col)
-            if point in status:
+        start = row * width + 1
+        for index in range(start, start + board.num_cols):
+            color = grid[index]
+            if color != _EMPTY:
+                stones[color] += 1
+                continue
+            if seen[index]:
                 continue
-            stone = board.get(point)
-            if stone is not None:
-                status[point] = stone
+            # Flood the region with an explicit stack, noting which colors
+            # border it
+            seen[index] = 1
+            region = [index]
+            stack = [index]
+            borders = 0
+            while stack:
+                here = stack.pop()
+                for neighbor in neighbor_indices[here]:
+                    neighbor_color = grid[neighbor]
+                    if neighbor_color == _EMPTY:
+                        if not seen[neighbor]:
+                            seen[neighbor] = 1
+                            region.append(neighbor)
+                            stack.append(neighbor)
+                    elif neighbor_color != _BORDER:
+                        borders |= neighbor_color
+            if borders == Player.black.value or borders == Player.white.value:
+                territory[borders] += len(region)
             else:
-                group, neighbors = _collect_region(point, board)
-                if len(neighbors) == 1:
-                    neighbor_stone = neighbors.pop()
-                    stone_str = "b" if neighbor_stone == Player.black else "w"
-                    fill_with = "territory_" + stone_str
-                else:
-                    fill_with = "neutral"
-                for pos in group:
-                    status[pos] = fill_with
-    return Territory(status)
-
-
-def _collect_region(start_pos: Point, board, visited=None):
-    if visited is None:
-        visited = {}
-    if start_pos in visited:
-        return [], set()
-    all_points = [start_pos]
-    all_borders = set()
-    visited[start_pos] = True
-    here = board.get(start_pos)
-    deltas = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    for row_delta, col_delta in deltas:
-        next_point = Point(row=start_pos.row + row_delta, col=start_pos.col + col_delta)
-        if not board.is_on_grid(next_point):
-            continue
-        neighbor = board.get(next_point)
-        if neighbor == here:
-            points, borders = _collect_region(next_point, board, visited)
-            all_points += points
-            all_borders |= borders
-        else:
-            all_borders.add(neighbor)
-    return all_points, all_borders
+                neutral_points.extend(point_at[i] for i in region)
+    return Territory.from_counts(
+        stones[Player.black.value],
+        stones[Player.white.value],
+        territory[Player.black.value],
+        territory[Player.white.value],
+        neutral_points,
+    )
 
 
-def compute_game_result(game_state):
+def compute_game_result(game_state, komi: float = 7.5):
     territory = evaluate_territory(game_state.board)
     return GameResult(
         territory.num_black_territory + territory.num_black_stones,
         territory.num_white_territory + territory.num_white_stones,
-        komi=7.5,
+        komi=komi,
     )
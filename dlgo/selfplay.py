@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from dlgo.agents.base import Agent
+from dlgo.archive import FIRST_POINT, PASS, RESIGN, ArchiveWriter, move_code
+from dlgo.encoders.base import Encoder, get_encoder_by_name
+from dlgo.goboard import GameState
+from dlgo.gotypes import Player
+from dlgo.workers import init_worker, play_game
+
+__all__ = ["SelfPlayStats", "ShardWriter", "play_games"]
+
+# Set in each worker process by _init_worker
+_encoder: Encoder | None = None
+
+
+class SelfPlayStats(namedtuple("SelfPlayStats", "games moves samples seconds")):
+    games: int
+    moves: int
+    samples: int
+    seconds: float
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds else 0.0
+
+    @property
+    def moves_per_second(self) -> float:
+        return self.moves / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (
+            f"{self.games} games, {self.moves} moves, {self.samples} samples in "
+            f"{self.seconds:.1f}s ({self.games_per_second:.2f} games/s, "
+            f"{self.moves_per_second:.1f} moves/s)"
+        )
+
+
+class ShardWriter:
+    """Collects (features, move, outcome) samples and writes them to
+    `<prefix>-00000.npz`, `<prefix>-00001.npz`, ... with `shard_size`
+    samples per file; the last shard may be smaller."""
+
+    def __init__(self, prefix: str, shard_size: int = 4096):
+        self.prefix = prefix
+        self.shard_size = shard_size
+        self.num_shards = 0
+        self.num_samples = 0
+        self._pending: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self._num_pending = 0
+
+    def add(self, features: np.ndarray, moves: np.ndarray, outcomes: np.ndarray):
+        self._pending.append((features, moves, outcomes))
+        self._num_pending += len(moves)
+        self.num_samples += len(moves)
+        while self._num_pending >= self.shard_size:
+            self._write(self.shard_size)
+
+    def close(self):
+        if self._num_pending:
+            self._write(self._num_pending)
+
+    def _write(self, count: int):
+        features, moves, outcomes = (
+            np.concatenate(arrays) for arrays in zip(*self._pending)
+        )
+        np.savez(
+            f"{self.prefix}-{self.num_shards:05d}.npz",
+            features=features[:count],
+            moves=moves[:count],
+            outcomes=outcomes[:count],
+        )
+        self.num_shards += 1
+        self._num_pending -= count
+        self._pending = (
+            [(features[count:], moves[count:], outcomes[count:])]
+            if self._num_pending
+            else []
+        )
+
+
+def _init_worker(
+    black: Agent, white: Agent, board_size: tuple[int, int], encoder: str | None
+):
+    global _encoder
+    init_worker({Player.black: black, Player.white: white}, board_size)
+    _encoder = None if encoder is None else get_encoder_by_name(encoder, board_size)
+
+
+def _play_game(_game_number: int) -> tuple:
+    """Plays one game and returns its move codes, the winner and the
+    encoded samples (None without an encoder)"""
+    game = play_game(Player.black, Player.white)
+    num_cols = game.board.num_cols
+    states: list[GameState] = []
+    codes: list[int] = []
+    state = game
+    while state.previous_state is not None:
+        codes.append(move_code(state.last_move, num_cols))
+        state = state.previous_state
+        states.append(state)
+    states.reverse()
+    codes.reverse()
+    winner = game.winner()
+    if _encoder is None:
+        return codes, winner, None
+
+    # Resignations are not a training target
+    samples = [(s, c) for s, c in zip(states, codes) if c != RESIGN]
+    features = _encoder.encode_batch([state for state, _ in samples])
+    # Policy targets are point indices, with num_points for a pass
+    moves = np.array(
+        [_encoder.num_points() if c == PASS else c - FIRST_POINT for _, c in samples],
+        dtype=np.int32,
+    )
+    outcomes = np.array(
+        [1 if state.next_player == winner else -1 for state, _ in samples],
+        dtype=np.int8,
+    )
+    return codes, winner, (features, moves, outcomes)
+
+
+def play_games(
+    black: Agent,
+    white: Agent,
+    num_games: int,
+    out_dir: str,
+    board_size: int | tuple[int, int] = 9,
+    encoder: str | None = "oneplane",
+    workers: int = 4,
+    shard_size: int = 4096,
+    max_pending: int | None = None,
+) -> SelfPlayStats:
+    """Plays `num_games` games between two agents on a process pool.
+
+    Finished games are appended to `out_dir/games.dlga` (see
+    `dlgo.archive`) as they come in. With an `encoder` (a module name in
+    `dlgo.encoders`), every position is also written to
+    `out_dir/samples-NNNNN.npz` shards as its features, the move played and
+    the outcome for the player to move (+1 win, -1 loss). At most
+    `max_pending` games (default: twice the workers) are in flight, so
+    results never pile up in memory faster than they are written.
+    Agents must be picklable (see `dlgo.workers.init_worker`).
+    """
+    if isinstance(board_size, int):
+        board_size = (board_size, board_size)
+    if max_pending is None:
+        max_pending = 2 * workers
+    os.makedirs(out_dir, exist_ok=True)
+    shards = ShardWriter(os.path.join(out_dir, "samples"), shard_size)
+    num_moves = 0
+    start = time.perf_counter()
+    with ArchiveWriter(os.path.join(out_dir, "games.dlga")) as archive:
+        with ProcessPoolExecutor(
+            workers,
+            initializer=_init_worker,
+            initargs=(black, white, board_size, encoder),
+        ) as pool:
+            submitted = 0
+            pending = set()
+            while submitted < num_games or pending:
+                while submitted < num_games and len(pending) < max_pending:
+                    pending.add(pool.submit(_play_game, submitted))
+                    submitted += 1
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    codes, winner, samples = future.result()
+                    archive.add_moves(board_size, codes, winner)
+                    num_moves += len(codes)
+                    if samples is not None:
+                        shards.add(*samples)
+        shards.close()
+    return SelfPlayStats(
+        num_games, num_moves, shards.num_samples, time.perf_counter() - start
+    )
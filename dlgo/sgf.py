@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import mmap
+import re
+from collections.abc import Iterable, Iterator
+
+from dlgo.goboard import Board, GameState, Move
+from dlgo.gotypes import Player, Point
+from dlgo.scoring import compute_game_result
+
+__all__ = ["SGFError", "SGFGame", "iter_games", "parse_games", "to_sgf", "write_games"]
+
+# SGF coordinates, "a" to "z" then "A" to "Z"; "aa" is the top left corner
+_LETTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_COLORS = {"B": Player.black, "W": Player.white}
+
+# One token per match: a node holding nothing but a move, which is most of
+# any game record, then a tree delimiter or node marker, a property
+# identifier or a bracketed value, with anything else skipped
+_TOKEN = re.compile(
+    rb";\s*([BW])\[([A-Za-z]{0,2})\](?=\s*[;()])"
+    rb"|([();])|([A-Za-z]+)|\[((?:[^\\\]]|\\.)*)\]|[^();A-Za-z\[]+",
+    re.DOTALL,
+)
+
+
+class SGFError(ValueError):
+    pass
+
+
+class SGFGame:
+    """The main line of one game tree: the root properties, setup stones
+    placed before the first move and the moves themselves"""
+
+    def __init__(
+        self,
+        properties: dict[str, list[str]],
+        setup: list[tuple[Player | None, Point]],
+        moves: list[tuple[Player, Point | None]],
+    ):
+        self.properties = properties
+        # (player, point) for AB/AW stones, with None for AE
+        self.setup = setup
+        # (player, point) for each move, with None for a pass
+        self.moves = moves
+
+    @property
+    def board_size(self) -> tuple[int, int]:
+        return _parse_size(self.properties.get("SZ", ["19"])[0])
+
+    @property
+    def komi(self) -> float:
+        return float(self.properties.get("KM", ["0"])[0] or 0)
+
+    @property
+    def handicap(self) -> int:
+        return int(self.properties.get("HA", ["0"])[0] or 0)
+
+    def first_player(self) -> Player:
+        if self.moves:
+            return self.moves[0][0]
+        if "PL" in self.properties:
+            return _COLORS[self.properties["PL"][0].upper()]
+        return Player.white if self.handicap > 1 else Player.black
+
+    def replay(self, board_cls: type = Board) -> Iterator[GameState]:
+        """Yields the state after the setup stones and after every move.
+        When the same player moves twice in a row, a pass by the other
+        player is inserted so that turns alternate."""
+        stones: dict[Point, Player] = {}
+        for player, point in self.setup:
+            if player is None:
+                stones.pop(point, None)
+            else:
+                stones[point] = player
+        board = board_cls(*self.board_size)
+        for point, player in stones.items():
+            board.place_stone(player, point)
+        game_state = GameState(board, self.first_player(), None, None)
+        yield game_state
+        for player, point in self.moves:
+            if player != game_state.next_player:
+                game_state = game_state.apply_move(Move.pass_turn())
+                yield game_state
+            if point is None:
+                move = Move.pass_turn()
+            elif game_state.board.get(point) is None:
+                move = Move.play(point)
+            else:
+                raise SGFError(f"{player} plays on occupied point {point}")
+            game_state = game_state.apply_move(move)
+            yield game_state
+
+
+def iter_games(path: str) -> Iterator[SGFGame]:
+    """Lazily parses every game tree of an SGF file or collection. The file
+    is memory-mapped and tokenized as it is read, one game at a time."""
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return
+        with data:
+            yield from parse_games(data)
+
+
+def parse_games(data) -> Iterator[SGFGame]:
+    """Parses game trees from SGF bytes (or any bytes-like buffer), keeping
+    only the first variation at every branch"""
+    depth = 0
+    # Whether tokens still belong to the main line of the current tree
+    following = True
+    properties: dict[str, list[str]] = {}
+    # Coordinates are kept as text until the tree ends, since SZ may come
+    # after them in the root node
+    setup: list[tuple[Player | None, str]] = []
+    moves: list[tuple[Player, str]] = []
+    node = 0
+    ident = ""
+    for match in _TOKEN.finditer(data):
+        color, move, delimiter, name, value = match.groups()
+        if color is not None:
+            if following and depth:
+                node += 1
+                moves.append((_COLORS[color.decode("ascii")], move.decode("ascii")))
+        elif delimiter == b"(":
+            depth += 1
+        elif delimiter == b")":
+            if depth == 0:
+                raise SGFError(f"Unbalanced ')' at offset {match.start()}")
+            depth -= 1
+            # Anything after the first variation closes is a sibling
+            following = False
+            if depth == 0:
+                if node:
+                    yield _decode_game(properties, setup, moves)
+                following = True
+                properties, setup, moves = {}, [], []
+                node = 0
+        elif not following or depth == 0:
+            continue
+        elif delimiter == b";":
+            node += 1
+        elif name is not None:
+            # FF[3] allows lower case letters in identifiers
+            ident = "".join(c for c in name.decode("ascii") if c.isupper())
+        elif value is not None:
+            text = _unescape(value)
+            if ident in ("B", "W"):
+                moves.append((_COLORS[ident], text))
+            elif ident in ("AB", "AW", "AE"):
+                if moves:
+                    raise SGFError("Setup stones after the first move")
+                setup.append((_COLORS.get(ident[1]), text))
+            elif node == 1:
+                properties.setdefault(ident, []).append(text)
+    if depth:
+        raise SGFError("Unterminated game tree")
+
+
+def _decode_game(
+    properties: dict[str, list[str]],
+    setup: list[tuple[Player | None, str]],
+    moves: list[tuple[Player, str]],
+) -> SGFGame:
+    """Builds an SGFGame, decoding coordinates for the size in `properties`"""
+    num_rows, num_cols = _parse_size(properties.get("SZ", ["19"])[0])
+    return SGFGame(
+        properties,
+        [
+            (player, point)
+            for player, text in setup
+            for point in _decode_points(text, num_rows, num_cols)
+        ],
+        [(player, _decode_point(text, num_rows, num_cols)) for player, text in moves],
+    )
+
+
+def _parse_size(text: str) -> tuple[int, int]:
+    """(rows, cols) from an SZ value; a rectangular size is "cols:rows" """
+    if ":" in text:
+        cols, rows = text.split(":")
+        return int(rows), int(cols)
+    return int(text), int(text)
+
+
+def _unescape(value: bytes) -> str:
+    text = value.decode("utf-8", errors="replace")
+    if "\\" in text:
+        # Escaped line breaks are removed, other escapes keep the character
+        text = re.sub(r"\\\r?\n", "", text)
+        text = re.sub(r"\\(.)", r"\1", text, flags=re.DOTALL)
+    return text
+
+
+def _decode_point(text: str, num_rows: int, num_cols: int) -> Point | None:
+    if text == "" or (text == "tt" and num_rows <= 19 and num_cols <= 19):
+        return None
+    col = _LETTERS.index(text[0]) + 1
+    row = num_rows - _LETTERS.index(text[1])
+    if not (1 <= row <= num_rows and 1 <= col <= num_cols):
+        raise SGFError(f"Point {text!r} is off the board")
+    return Point(row=row, col=col)
+
+
+def _decode_points(text: str, num_rows: int, num_cols: int) -> list[Point]:
+    """A point or a compressed "ab:cd" rectangle of points"""
+    if ":" not in text:
+        return [_decode_point(text, num_rows, num_cols)]
+    first, second = text.split(":")
+    corner = _decode_point(first, num_rows, num_cols)
+    other = _decode_point(second, num_rows, num_cols)
+    return [
+        Point(row=row, col=col)
+        for row in range(min(corner.row, other.row), max(corner.row, other.row) + 1)
+        for col in range(min(corner.col, other.col), max(corner.col, other.col) + 1)
+    ]
+
+
+def _encode_point(point: Point, num_rows: int) -> str:
+    return _LETTERS[point.col - 1] + _LETTERS[num_rows - point.row]
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("]", "\\]")
+
+
+def to_sgf(game_state: GameState, komi: float = 7.5, **properties: str) -> str:
+    """Writes the game leading to `game_state` as one SGF game tree. Stones
+    on the board at the first state become AB/AW setup stones; the result
+    is added when the game is over. Extra root properties (e.g. PB, PW) can
+    be passed as keywords."""
+    states = []
+    state = game_state
+    while state is not None:
+        states.append(state)
+        state = state.previous_state
+    states.reverse()
+    board = states[0].board
+    num_rows, num_cols = board.num_rows, board.num_cols
+
+    size = str(num_rows) if num_rows == num_cols else f"{num_cols}:{num_rows}"
+    root = {"GM": "1", "FF": "4", "SZ": size, "KM": str(komi)}
+    if game_state.is_over():
+        if game_state.last_move.is_resign:
+            winner = game_state.next_player
+            root["RE"] = ("B" if winner == Player.black else "W") + "+R"
+        else:
+            root["RE"] = str(compute_game_result(game_state, komi))
+    root.update(properties)
+
+    parts = ["(;"]
+    parts.extend(f"{key}[{_escape(str(value))}]" for key, value in root.items())
+    for player, label in ((Player.black, "AB"), (Player.white, "AW")):
+        stones = [
+            _encode_point(Point(row=row, col=col), num_rows)
+            for row in range(1, num_rows + 1)
+            for col in range(1, num_cols + 1)
+            if board.get(Point(row=row, col=col)) == player
+        ]
+        if stones:
+            parts.append(label + "".join(f"[{stone}]" for stone in stones))
+    if states[0].next_player != Player.black:
+        parts.append("PL[W]")
+    for previous, state in zip(states, states[1:]):
+        move = state.last_move
+        if move.is_resign:
+            break
+        color = "B" if previous.next_player == Player.black else "W"
+        value = "" if move.is_pass else _encode_point(move.point, num_rows)
+        parts.append(f"\n;{color}[{value}]")
+    parts.append(")\n")
+    return "".join(parts)
+
+
+def write_games(path: str, game_states: Iterable[GameState], komi: float = 7.5):
+    """Writes one game tree per final state to a single SGF collection,
+    streaming each game out as it is produced"""
+    with open(path, "w", encoding="utf-8") as f:
+        for game_state in game_states:
+            f.write(to_sgf(game_state, komi))
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import itertools
+import math
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from dlgo.agents.base import Agent
+from dlgo.gotypes import Player
+from dlgo.workers import init_worker, play_game
+
+__all__ = ["SPRT", "AgentReport", "PairResult", "TournamentResult", "run_tournament"]
+
+ROUND_ROBIN = "round_robin"
+GAUNTLET = "gauntlet"
+
+# Keys of `Agent.stats()` that count search nodes, in order of preference
+_NODE_KEYS = ("nodes", "simulations")
+
+
+class SPRT(namedtuple("SPRT", "elo0 elo1 alpha beta")):
+    """Sequential probability ratio test of H0: the first agent of a pair is
+    `elo0` stronger than the second, against H1: it is `elo1` stronger,
+    with error rates `alpha` and `beta`"""
+
+    elo0: float
+    elo1: float
+    alpha: float
+    beta: float
+
+    def __new__(
+        cls,
+        elo0: float = 0.0,
+        elo1: float = 100.0,
+        alpha: float = 0.05,
+        beta: float = 0.05,
+    ):
+        return super().__new__(cls, elo0, elo1, alpha, beta)
+
+    def llr(self, wins: int, losses: int) -> float:
+        """Log-likelihood ratio of H1 to H0 after some games. Go games
+        with a fractional komi can't be drawn, so each game is one
+        Bernoulli trial."""
+        p0 = _expected_score(self.elo0)
+        p1 = _expected_score(self.elo1)
+        return wins * math.log(p1 / p0) + losses * math.log((1 - p1) / (1 - p0))
+
+    def decision(self, wins: int, losses: int) -> str | None:
+        """Returns "H1" or "H0" once the test has concluded, else None"""
+        llr = self.llr(wins, losses)
+        if llr >= math.log((1 - self.beta) / self.alpha):
+            return "H1"
+        if llr <= math.log(self.beta / (1 - self.alpha)):
+            return "H0"
+        return None
+
+
+def _expected_score(elo_diff: float) -> float:
+    return 1 / (1 + 10 ** (-elo_diff / 400))
+
+
+class PairResult(namedtuple("PairResult", "first second wins losses decision")):
+    """Games between two agents, counted for `first`. `decision` is the SPRT
+    outcome, or None if the pair ran out of games first."""
+
+    first: str
+    second: str
+    wins: int
+    losses: int
+    decision: str | None
+
+
+class AgentReport(
+    namedtuple("AgentReport", "name games wins elo seconds_per_move nodes_per_second")
+):
+    name: str
+    games: int
+    wins: int
+    elo: float
+    seconds_per_move: float
+    nodes_per_second: float
+
+
+class TournamentResult(namedtuple("TournamentResult", "agents pairs seconds")):
+    agents: list[AgentReport]
+    pairs: list[PairResult]
+    seconds: float
+
+    def __str__(self):
+        lines = [
+            f"{'agent':<20} {'games':>6} {'wins':>6} {'elo':>8} "
+            f"{'s/move':>8} {'nodes/s':>10}"
+        ]
+        for agent in sorted(self.agents, key=lambda agent: -agent.elo):
+            lines.append(
+                f"{agent.name:<20} {agent.games:>6} {agent.wins:>6} "
+                f"{agent.elo:>8.1f} {agent.seconds_per_move:>8.4f} "
+                f"{agent.nodes_per_second:>10.0f}"
+            )
+        for pair in self.pairs:
+            lines.append(
+                f"{pair.first} vs {pair.second}: +{pair.wins} -{pair.losses}"
+                + (f" (SPRT {pair.decision})" if pair.decision else "")
+            )
+        return "\n".join(lines)
+
+
+def _play_game(black: str, white: str) -> tuple[str, dict[str, tuple]]:
+    """Plays one game and returns the winner's name and, per agent, its
+    (moves, seconds thinking, nodes searched)"""
+    usage = {black: [0, 0.0, 0], white: [0, 0.0, 0]}
+
+    def count(name: str, agent: Agent, seconds: float):
+        totals = usage[name]
+        totals[0] += 1
+        totals[1] += seconds
+        stats = agent.stats() if hasattr(agent, "stats") else {}
+        totals[2] += next((stats[key] for key in _NODE_KEYS if key in stats), 0)
+
+    game = play_game(black, white, count)
+    winner = black if game.winner() == Player.black else white
+    return winner, {name: tuple(total) for name, total in usage.items()}
+
+
+def _elo_ratings(names: list[str], pairs: list[PairResult]) -> dict[str, float]:
+    """Bradley-Terry maximum likelihood ratings, with the first agent at 0.
+    Every pair gets half a virtual win each way so that unbeaten agents
+    still have a finite rating."""
+    wins = {
+        name: 0.5 * sum(name in (p.first, p.second) for p in pairs) for name in names
+    }
+    games: dict[tuple[str, str], float] = {}
+    for pair in pairs:
+        wins[pair.first] += pair.wins
+        wins[pair.second] += pair.losses
+        count = pair.wins + pair.losses + 1
+        games[pair.first, pair.second] = games[pair.second, pair.first] = count
+    strength = {name: 1.0 for name in names}
+    for _ in range(1000):
+        updated = {}
+        for name in names:
+            denominator = sum(
+                count / (strength[name] + strength[other])
+                for (player, other), count in games.items()
+                if player == name
+            )
+            updated[name] = wins[name] / denominator if denominator else 1.0
+        converged = all(
+            abs(math.log(updated[name] / strength[name])) < 1e-9 for name in names
+        )
+        strength = updated
+        if converged:
+            break
+    anchor = strength[names[0]]
+    return {name: 400 * math.log10(strength[name] / anchor) for name in names}
+
+
+def run_tournament(
+    agents: dict[str, Agent],
+    mode: str = ROUND_ROBIN,
+    games_per_pair: int = 100,
+    sprt: SPRT | None = SPRT(),
+    workers: int = 4,
+    board_size: int | tuple[int, int] = 9,
+) -> TournamentResult:
+    """Plays every pair of agents (round robin) or the first agent against
+    each of the others (gauntlet) on a process pool.
+
+    Each pair plays up to `games_per_pair` games with alternating colors.
+    With `sprt`, a pair stops being scheduled once the test concludes;
+    games already running still count. Elo ratings are relative to the
+    first agent. Think time is measured around `select_move`, and node
+    counts are read from `stats()` of agents that have one.
+    Agents must be picklable (see `dlgo.workers.init_worker`).
+    """
+    if mode not in (ROUND_ROBIN, GAUNTLET):
+        raise ValueError(f"Unknown tournament mode: {mode}")
+    if isinstance(board_size, int):
+        board_size = (board_size, board_size)
+    names = list(agents)
+    if mode == ROUND_ROBIN:
+        pairings = list(itertools.combinations(names, 2))
+    else:
+        pairings = [(names[0], other) for other in names[1:]]
+
+    # [wins, losses, games scheduled, decision] per pairing
+    scores = {pairing: [0, 0, 0, None] for pairing in pairings}
+    usage = {name: [0, 0.0, 0] for name in names}
+    games = {name: 0 for name in names}
+
+    def next_game() -> tuple[tuple[str, str], str, str] | None:
+        open_pairings = [
+            pairing
+            for pairing, (_, _, scheduled, decision) in scores.items()
+            if scheduled < games_per_pair and decision is None
+        ]
+        if not open_pairings:
+            return None
+        pairing = min(open_pairings, key=lambda pairing: scores[pairing][2])
+        first, second = pairing
+        scheduled = scores[pairing][2]
+        scores[pairing][2] += 1
+        if scheduled % 2:
+            return pairing, second, first
+        return pairing, first, second
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        workers, initializer=init_worker, initargs=(agents, board_size)
+    ) as pool:
+        pending = {}
+        while True:
+            while len(pending) < 2 * workers:
+                game = next_game()
+                if game is None:
+                    break
+                pairing, black, white = game
+                pending[pool.submit(_play_game, black, white)] = pairing
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pairing = pending.pop(future)
+                winner, game_usage = future.result()
+                score = scores[pairing]
+                score[0 if winner == pairing[0] else 1] += 1
+                if sprt is not None and score[3] is None:
+                    score[3] = sprt.decision(score[0], score[1])
+                for name, totals in game_usage.items():
+                    games[name] += 1
+                    for i, value in enumerate(totals):
+                        usage[name][i] += value
+
+    pairs = [
+        PairResult(first, second, wins, losses, decision)
+        for (first, second), (wins, losses, _, decision) in scores.items()
+    ]
+    ratings = _elo_ratings(names, pairs)
+    wins = {name: 0 for name in names}
+    for pair in pairs:
+        wins[pair.first] += pair.wins
+        wins[pair.second] += pair.losses
+    reports = []
+    for name in names:
+        moves, seconds, nodes = usage[name]
+        reports.append(
+            AgentReport(
+                name,
+                games[name],
+                wins[name],
+                ratings[name],
+                seconds / moves if moves else 0.0,
+                nodes / seconds if seconds else 0.0,
+            )
+        )
+    return TournamentResult(reports, pairs, time.perf_counter() - start)
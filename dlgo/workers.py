@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Callable, Hashable
+
+import numpy as np
+
+from dlgo.agents.base import Agent
+from dlgo.goboard import GameState
+from dlgo.gotypes import Player
+
+__all__ = ["init_worker", "play_game", "reseed"]
+
+# Set in each worker process by init_worker
+_agents: dict[Hashable, Agent] = {}
+_board_size: tuple[int, int] = (9, 9)
+
+
+def reseed():
+    """Forked workers inherit the parent's random state; gives this process
+    its own. Can be used as a pool initializer by itself."""
+    random.seed()
+    np.random.seed()
+
+
+def init_worker(agents: dict[Hashable, Agent], board_size: tuple[int, int]):
+    """Pool initializer for workers that play games with `play_game`.
+
+    The agents are pickled to every worker once, so they must be picklable,
+    and each worker keeps its own copies for all of its games.
+    """
+    global _agents, _board_size
+    reseed()
+    _agents = agents
+    _board_size = board_size
+
+
+def play_game(
+    black: Hashable,
+    white: Hashable,
+    on_move: Callable[[Hashable, Agent, float], None] | None = None,
+) -> GameState:
+    """Plays one game between the agents `init_worker` stored under the keys
+    `black` and `white`, and returns its final state. `on_move` is called
+    with the key, the agent and its think time after every move."""
+    keys = {Player.black: black, Player.white: white}
+    game = GameState.new_game(_board_size)
+    while not game.is_over():
+        key = keys[game.next_player]
+        agent = _agents[key]
+        start = time.perf_counter()
+        move = agent.select_move(game)
+        if on_move is not None:
+            on_move(key, agent, time.perf_counter() - start)
+        game = game.apply_move(move)
+    return game
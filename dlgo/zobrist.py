@@ -1,730 +1,50 @@
-from dlgo.gotypes import Player, Point
+from __future__ import annotations
+
+import random
+from array import array
 
-__all__ = ['HASH_CODE', 'EMPTY_BOARD']
+from dlgo.gotypes import Player, Point
 
-HASH_CODE = {
-    (Point(row=1, col=1), Player.black): 6555101123071851098,
-    (Point(row=1, col=1), Player.white): 2583147647829271043,
-    (Point(row=1, col=2), Player.black): 8783266040420602325,
-    (Point(row=1, col=2), Player.white): 8318353965379092381,
-    (Point(row=1, col=3), Player.black): 53345829171887256,
-    (Point(row=1, col=3), Player.white): 7887842467469636211,
-    (Point(row=1, col=4), Player.black): 7128806311316911782,
-    (Point(row=1, col=4), Player.white): 185021989556884549,
-    (Point(row=1, col=5), Player.black): 1204045090556938264,
-    (Point(row=1, col=5), Player.white): 6861494842891615038,
-    (Point(row=1, col=6), Player.black): 6735691207077144503,
-    (Point(row=1, col=6), Player.white): 1055783214295164161,
-    (Point(row=1, col=7), Player.black): 3544085544281029890,
-    (Point(row=1, col=7), Player.white): 2130365858740836503,
-    (Point(row=1, col=8), Player.black): 4243031724146598236,
-    (Point(row=1, col=8), Player.white): 6642498018850600549,
-    (Point(row=1, col=9), Player.black): 7675628574843942573,
-    (Point(row=1, col=9), Player.white): 739668733228970651,
-    (Point(row=1, col=10), Player.black): 3764132033554804838,
-    (Point(row=1, col=10), Player.white): 3626578994411883390,
-    (Point(row=1, col=11), Player.black): 4382376094032418276,
-    (Point(row=1, col=11), Player.white): 213414262208798269,
-    (Point(row=1, col=12), Player.black): 633892048426327333,
-    (Point(row=1, col=12), Player.white): 2826449372756657444,
-    (Point(row=1, col=13), Player.black): 4217787626811117913,
-    (Point(row=1, col=13), Player.white): 7304025837523222847,
-    (Point(row=1, col=14), Player.black): 6993045204705686724,
-    (Point(row=1, col=14), Player.white): 4038936995666977974,
-    (Point(row=1, col=15), Player.black): 2863175844629337451,
-    (Point(row=1, col=15), Player.white): 2748462900226216845,
-    (Point(row=1, col=16), Player.black): 7907843467462246023,
-    (Point(row=1, col=16), Player.white): 6203752889023272781,
-    (Point(row=1, col=17), Player.black): 5724609061515074564,
-    (Point(row=1, col=17), Player.white): 5766535203504656594,
-    (Point(row=1, col=18), Player.black): 378038084779932868,
-    (Point(row=1, col=18), Player.white): 4013654390432981519,
-    (Point(row=1, col=19), Player.black): 4767111213704128149,
-    (Point(row=1, col=19), Player.white): 1096718864606723362,
-    (Point(row=2, col=1), Player.black): 114812189963191026,
-    (Point(row=2, col=1), Player.white): 3835760766796625632,
-    (Point(row=2, col=2), Player.black): 8290122550117940024,
-    (Point(row=2, col=2), Player.white): 8482488720098215873,
-    (Point(row=2, col=3), Player.black): 1250572705460111347,
-    (Point(row=2, col=3), Player.white): 7801711072904832597,
-    (Point(row=2, col=4), Player.black): 3845816237684407155,
-    (Point(row=2, col=4), Player.white): 5797897394649424779,
-    (Point(row=2, col=5), Player.black): 6675254690284124486,
-    (Point(row=2, col=5), Player.white): 9218571098042298986,
-    (Point(row=2, col=6), Player.black): 7366891252641364753,
-    (Point(row=2, col=6), Player.white): 7722143228166176385,
-    (Point(row=2, col=7), Player.black): 3223106914872735103,
-    (Point(row=2, col=7), Player.white): 1550009074125290251,
-    (Point(row=2, col=8), Player.black): 7811729203586410253,
-    (Point(row=2, col=8), Player.white): 982176566790197685,
-    (Point(row=2, col=9), Player.black): 1153312030078513723,
-    (Point(row=2, col=9), Player.white): 9162984396462412701,
-    (Point(row=2, col=10), Player.black): 3245296228031786250,
-    (Point(row=2, col=10), Player.white): 8087672055387589724,
-    (Point(row=2, col=11), Player.black): 7409883924798665778,
-    (Point(row=2, col=11), Player.white): 8179093748924883098,
-    (Point(row=2, col=12), Player.black): 1296534775003485693,
-    (Point(row=2, col=12), Player.white): 4433929507361319871,
-    (Point(row=2, col=13), Player.black): 217129607331745902,
-    (Point(row=2, col=13), Player.white): 263572344019446979,
-    (Point(row=2, col=14), Player.black): 5886102685144989239,
-    (Point(row=2, col=14), Player.white): 6102950522297634318,
-    (Point(row=2, col=15), Player.black): 5102645912381151727,
-    (Point(row=2, col=15), Player.white): 8250038551320143266,
-    (Point(row=2, col=16), Player.black): 5568783901410125316,
-    (Point(row=2, col=16), Player.white): 749582758355432717,
-    (Point(row=2, col=17), Player.black): 8062298190437698197,
-    (Point(row=2, col=17), Player.white): 3060289468684901075,
-    (Point(row=2, col=18), Player.black): 3326007898823619962,
-    (Point(row=2, col=18), Player.white): 1181480474066220637,
-    (Point(row=2, col=19), Player.black): 1596624764562704714,
-    (Point(row=2, col=19), Player.white): 4097825731589304236,
-    (Point(row=3, col=1), Player.black): 2867304810045937952,
-    (Point(row=3, col=1), Player.white): 7613041438025757282,
-    (Point(row=3, col=2), Player.black): 1563214023404272027,
-    (Point(row=3, col=2), Player.white): 5206641511359630275,
-    (Point(row=3, col=3), Player.black): 3142087752407196894,
-    (Point(row=3, col=3), Player.white): 8225013475803406949,
-    (Point(row=3, col=4), Player.black): 5861899263689491709,
-    (Point(row=3, col=4), Player.white): 5222187383024614197,
-    (Point(row=3, col=5), Player.black): 944313434674820668,
-    (Point(row=3, col=5), Player.white): 3265852005871678081,
-    (Point(row=3, col=6), Player.black): 547302382444205941,
-    (Point(row=3, col=6), Player.white): 4035415023786479539,
-    (Point(row=3, col=7), Player.black): 6190200350108535520,
-    (Point(row=3, col=7), Player.white): 5347341302667180711,
-    (Point(row=3, col=8), Player.black): 8629870178542129394,
-    (Point(row=3, col=8), Player.white): 5348350312141607967,
-    (Point(row=3, col=9), Player.black): 5070223203400002997,
-    (Point(row=3, col=9), Player.white): 7366553557578832790,
-    (Point(row=3, col=10), Player.black): 1109858996952118154,
-    (Point(row=3, col=10), Player.white): 1592361151368127792,
-    (Point(row=3, col=11), Player.black): 7517445871830031974,
-    (Point(row=3, col=11), Player.white): 3255645727698441656,
-    (Point(row=3, col=12), Player.black): 1937775590186893901,
-    (Point(row=3, col=12), Player.white): 310875019448809046,
-    (Point(row=3, col=13), Player.black): 6386485414602076077,
-    (Point(row=3, col=13), Player.white): 2141280994066559421,
-    (Point(row=3, col=14), Player.black): 2192923281414797899,
-    (Point(row=3, col=14), Player.white): 7599754611207367952,
-    (Point(row=3, col=15), Player.black): 1013488160454135171,
-    (Point(row=3, col=15), Player.white): 3941232871037686378,
-    (Point(row=3, col=16), Player.black): 7788949729017502226,
-    (Point(row=3, col=16), Player.white): 2103858008870257873,
-    (Point(row=3, col=17), Player.black): 1269311832281982601,
-    (Point(row=3, col=17), Player.white): 8094423328345607186,
-    (Point(row=3, col=18), Player.black): 8497297875008526637,
-    (Point(row=3, col=18), Player.white): 6664416267571749423,
-    (Point(row=3, col=19), Player.black): 4286188953116418268,
-    (Point(row=3, col=19), Player.white): 933751391469601667,
-    (Point(row=4, col=1), Player.black): 6405540463306911759,
-    (Point(row=4, col=1), Player.white): 7099515171942684269,
-    (Point(row=4, col=2), Player.black): 2701998976999299356,
-    (Point(row=4, col=2), Player.white): 8551989075044980020,
-    (Point(row=4, col=3), Player.black): 3483633689416676984,
-    (Point(row=4, col=3), Player.white): 6328453785744136007,
-    (Point(row=4, col=4), Player.black): 3211611326041007572,
-    (Point(row=4, col=4), Player.white): 4286541900572553494,
-    (Point(row=4, col=5), Player.black): 8587864233545886810,
-    (Point(row=4, col=5), Player.white): 5250050133332803180,
-    (Point(row=4, col=6), Player.black): 2119570020959317229,
-    (Point(row=4, col=6), Player.white): 1071113332677257467,
-    (Point(row=4, col=7), Player.black): 3005841511970707452,
-    (Point(row=4, col=7), Player.white): 581060423062090528,
-    (Point(row=4, col=8), Player.black): 6749929111139681278,
-    (Point(row=4, col=8), Player.white): 5343395191585047458,
-    (Point(row=4, col=9), Player.black): 7819260316111176085,
-    (Point(row=4, col=9), Player.white): 8425347283766042848,
-    (Point(row=4, col=10), Player.black): 2182892820818573059,
-    (Point(row=4, col=10), Player.white): 9073141817645143079,
-    (Point(row=4, col=11), Player.black): 5457622750324006251,
-    (Point(row=4, col=11), Player.white): 3748711355671042282,
-    (Point(row=4, col=12), Player.black): 6458006227825821337,
-    (Point(row=4, col=12), Player.white): 5420610517222897770,
-    (Point(row=4, col=13), Player.black): 689099581867083674,
-    (Point(row=4, col=13), Player.white): 7698917523626013904,
-    (Point(row=4, col=14), Player.black): 1233300040833391215,
-    (Point(row=4, col=14), Player.white): 758353756225807898,
-    (Point(row=4, col=15), Player.black): 6002920075699139211,
-    (Point(row=4, col=15), Player.white): 7468245852079292808,
-    (Point(row=4, col=16), Player.black): 6394266984732463876,
-    (Point(row=4, col=16), Player.white): 7828782175652323659,
-    (Point(row=4, col=17), Player.black): 8575306845424226695,
-    (Point(row=4, col=17), Player.white): 8990198268024512871,
-    (Point(row=4, col=18), Player.black): 5204529288319085730,
-    (Point(row=4, col=18), Player.white): 6590203585168924568,
-    (Point(row=4, col=19), Player.black): 3976290193364791721,
-    (Point(row=4, col=19), Player.white): 8591353568708629902,
-    (Point(row=5, col=1), Player.black): 5714703663971395689,
-    (Point(row=5, col=1), Player.white): 3967476038008579847,
-    (Point(row=5, col=2), Player.black): 5635994994037111353,
-    (Point(row=5, col=2), Player.white): 1701880803064978236,
-    (Point(row=5, col=3), Player.black): 7128496778647552618,
-    (Point(row=5, col=3), Player.white): 259838617641955656,
-    (Point(row=5, col=4), Player.black): 6336516212580864498,
-    (Point(row=5, col=4), Player.white): 5891979962090286830,
-    (Point(row=5, col=5), Player.black): 284812616964311587,
-    (Point(row=5, col=5), Player.white): 4348256053669793830,
-    (Point(row=5, col=6), Player.black): 7307838992046930021,
-    (Point(row=5, col=6), Player.white): 5285036506729531021,
-    (Point(row=5, col=7), Player.black): 9211047051965411860,
-    (Point(row=5, col=7), Player.white): 3326203427681001832,
-    (Point(row=5, col=8), Player.black): 1614215731349180419,
-    (Point(row=5, col=8), Player.white): 1582027289601390568,
-    (Point(row=5, col=9), Player.black): 894757949682375251,
-    (Point(row=5, col=9), Player.white): 6476768218306352653,
-    (Point(row=5, col=10), Player.black): 1077600493010193893,
-    (Point(row=5, col=10), Player.white): 3539900927698599078,
-    (Point(row=5, col=11), Player.black): 202941318144666757,
-    (Point(row=5, col=11), Player.white): 7250903162657249101,
-    (Point(row=5, col=12), Player.black): 4542352131241305321,
-    (Point(row=5, col=12), Player.white): 4471366294177989135,
-    (Point(row=5, col=13), Player.black): 9126117011546859717,
-    (Point(row=5, col=13), Player.white): 2169001821731630251,
-    (Point(row=5, col=14), Player.black): 7523275776628324227,
-    (Point(row=5, col=14), Player.white): 6100153679468238049,
-    (Point(row=5, col=15), Player.black): 1561262041706122827,
-    (Point(row=5, col=15), Player.white): 430596646417385993,
-    (Point(row=5, col=16), Player.black): 8820747529770677807,
-    (Point(row=5, col=16), Player.white): 1671469749459017881,
-    (Point(row=5, col=17), Player.black): 709831443549045578,
-    (Point(row=5, col=17), Player.white): 3320370536022514703,
-    (Point(row=5, col=18), Player.black): 8259586766461295554,
-    (Point(row=5, col=18), Player.white): 4978745038385490333,
-    (Point(row=5, col=19), Player.black): 4416415952438704113,
-    (Point(row=5, col=19), Player.white): 8207621056389242876,
-    (Point(row=6, col=1), Player.black): 7918270269721946538,
-    (Point(row=6, col=1), Player.white): 2828469105786398752,
-    (Point(row=6, col=2), Player.black): 6624343863413279174,
-    (Point(row=6, col=2), Player.white): 5183568683973168425,
-    (Point(row=6, col=3), Player.black): 5677877146478163527,
-    (Point(row=6, col=3), Player.white): 6962921161091875566,
-    (Point(row=6, col=4), Player.black): 7830305515872067896,
-    (Point(row=6, col=4), Player.white): 7424592947325282707,
-    (Point(row=6, col=5), Player.black): 4650986670377142680,
-    (Point(row=6, col=5), Player.white): 3877382250892794117,
-    (Point(row=6, col=6), Player.black): 2273953080918249030,
-    (Point(row=6, col=6), Player.white): 6322060722423905795,
-    (Point(row=6, col=7), Player.black): 7083286195744347952,
-    (Point(row=6, col=7), Player.white): 7568514329134973964,
-    (Point(row=6, col=8), Player.black): 3450653539969175633,
-    (Point(row=6, col=8), Player.white): 4310421914295853097,
-    (Point(row=6, col=9), Player.black): 7613977258023686057,
-    (Point(row=6, col=9), Player.white): 8784796347324865954,
-    (Point(row=6, col=10), Player.black): 1407260982499933396,
-    (Point(row=6, col=10), Player.white): 763705837414064992,
-    (Point(row=6, col=11), Player.black): 5802433240652150674,
-    (Point(row=6, col=11), Player.white): 4245091455888453136,
-    (Point(row=6, col=12), Player.black): 511819013433463961,
-    (Point(row=6, col=12), Player.white): 2857985503365831262,
-    (Point(row=6, col=13), Player.black): 2228188105363303527,
-    (Point(row=6, col=13), Player.white): 8224173387307550102,
-    (Point(row=6, col=14), Player.black): 5927059592374692812,
-    (Point(row=6, col=14), Player.white): 8594856712017243406,
-    (Point(row=6, col=15), Player.black): 6681286390418888009,
-    (Point(row=6, col=15), Player.white): 5654082559262790940,
-    (Point(row=6, col=16), Player.black): 3706422919368557048,
-    (Point(row=6, col=16), Player.white): 6417506838411066183,
-    (Point(row=6, col=17), Player.black): 902088359145599528,
-    (Point(row=6, col=17), Player.white): 6921393709747536526,
-    (Point(row=6, col=18), Player.black): 1062942082463400967,
-    (Point(row=6, col=18), Player.white): 3481898372213217887,
-    (Point(row=6, col=19), Player.black): 5539574325838179495,
-    (Point(row=6, col=19), Player.white): 8867870277189406961,
-    (Point(row=7, col=1), Player.black): 6304744725792385265,
-    (Point(row=7, col=1), Player.white): 4659426463706837301,
-    (Point(row=7, col=2), Player.black): 8179737609578368196,
-    (Point(row=7, col=2), Player.white): 4332097216470772653,
-    (Point(row=7, col=3), Player.black): 2251569810592775187,
-    (Point(row=7, col=3), Player.white): 4795291235308194346,
-    (Point(row=7, col=4), Player.black): 7317252207486286461,
-    (Point(row=7, col=4), Player.white): 5114711671177670586,
-    (Point(row=7, col=5), Player.black): 6654706062448418413,
-    (Point(row=7, col=5), Player.white): 9132880872135425633,
-    (Point(row=7, col=6), Player.black): 6470363841940760284,
-    (Point(row=7, col=6), Player.white): 7005587716953573193,
-    (Point(row=7, col=7), Player.black): 9055365176749864822,
-    (Point(row=7, col=7), Player.white): 7592853483315435244,
-    (Point(row=7, col=8), Player.black): 6468665435233994699,
-    (Point(row=7, col=8), Player.white): 7146652130157693815,
-    (Point(row=7, col=9), Player.black): 8216241649988706402,
-    (Point(row=7, col=9), Player.white): 2902833754174350011,
-    (Point(row=7, col=10), Player.black): 3703451722278378693,
-    (Point(row=7, col=10), Player.white): 8359580456483501813,
-    (Point(row=7, col=11), Player.black): 8771104155914628004,
-    (Point(row=7, col=11), Player.white): 4127227675888543666,
-    (Point(row=7, col=12), Player.black): 3711602742823881539,
-    (Point(row=7, col=12), Player.white): 6610069368544254450,
-    (Point(row=7, col=13), Player.black): 7901677119191713871,
-    (Point(row=7, col=13), Player.white): 5659440361270754058,
-    (Point(row=7, col=14), Player.black): 8171969776449807165,
-    (Point(row=7, col=14), Player.white): 4915457485130065053,
-    (Point(row=7, col=15), Player.black): 2458127902481444391,
-    (Point(row=7, col=15), Player.white): 5949013651192084785,
-    (Point(row=7, col=16), Player.black): 3841117009574757485,
-    (Point(row=7, col=16), Player.white): 3680300429832797974,
-    (Point(row=7, col=17), Player.black): 1894917821887720048,
-    (Point(row=7, col=17), Player.white): 340304090207162229,
-    (Point(row=7, col=18), Player.black): 5704227227133036404,
-    (Point(row=7, col=18), Player.white): 9067897047500032610,
-    (Point(row=7, col=19), Player.black): 7079080729899346207,
-    (Point(row=7, col=19), Player.white): 3040102037542741151,
-    (Point(row=8, col=1), Player.black): 6154316466853965490,
-    (Point(row=8, col=1), Player.white): 82226686445496364,
-    (Point(row=8, col=2), Player.black): 733900591486808771,
-    (Point(row=8, col=2), Player.white): 1145331318860168126,
-    (Point(row=8, col=3), Player.black): 690156559101849542,
-    (Point(row=8, col=3), Player.white): 5769691683771008644,
-    (Point(row=8, col=4), Player.black): 2161155745443162979,
-    (Point(row=8, col=4), Player.white): 4063343241396521534,
-    (Point(row=8, col=5), Player.black): 4905608643833884923,
-    (Point(row=8, col=5), Player.white): 153343568682282010,
-    (Point(row=8, col=6), Player.black): 389160875782335561,
-    (Point(row=8, col=6), Player.white): 4289545993994548302,
-    (Point(row=8, col=7), Player.black): 7675082891959442172,
-    (Point(row=8, col=7), Player.white): 7385517950307562984,
-    (Point(row=8, col=8), Player.black): 4631178936682507253,
-    (Point(row=8, col=8), Player.white): 1717428407360680626,
-    (Point(row=8, col=9), Player.black): 2837397175492483204,
-    (Point(row=8, col=9), Player.white): 8429762247034913156,
-    (Point(row=8, col=10), Player.black): 1793752299275734236,
-    (Point(row=8, col=10), Player.white): 2072311359193434261,
-    (Point(row=8, col=11), Player.black): 527390981472905751,
-    (Point(row=8, col=11), Player.white): 4901186117336057807,
-    (Point(row=8, col=12), Player.black): 271543760151407284,
-    (Point(row=8, col=12), Player.white): 6758146326930411772,
-    (Point(row=8, col=13), Player.black): 1628162926579227177,
-    (Point(row=8, col=13), Player.white): 1214928324457295243,
-    (Point(row=8, col=14), Player.black): 5204063640826609985,
-    (Point(row=8, col=14), Player.white): 220054866742586855,
-    (Point(row=8, col=15), Player.black): 50417586456319865,
-    (Point(row=8, col=15), Player.white): 7403092364049932063,
-    (Point(row=8, col=16), Player.black): 4943813400710788008,
-    (Point(row=8, col=16), Player.white): 6021829391865995896,
-    (Point(row=8, col=17), Player.black): 6155228099082380479,
-    (Point(row=8, col=17), Player.white): 6820928679825301082,
-    (Point(row=8, col=18), Player.black): 1517701974045839049,
-    (Point(row=8, col=18), Player.white): 2115073412031937245,
-    (Point(row=8, col=19), Player.black): 7501617297841918856,
-    (Point(row=8, col=19), Player.white): 171040588059652781,
-    (Point(row=9, col=1), Player.black): 2493947051637335335,
-    (Point(row=9, col=1), Player.white): 1790831585999898435,
-    (Point(row=9, col=2), Player.black): 4080477793149048263,
-    (Point(row=9, col=2), Player.white): 8357361132396023402,
-    (Point(row=9, col=3), Player.black): 1046788240352012449,
-    (Point(row=9, col=3), Player.white): 2770714034493537735,
-    (Point(row=9, col=4), Player.black): 1738284516807891247,
-    (Point(row=9, col=4), Player.white): 4337256865576897708,
-    (Point(row=9, col=5), Player.black): 8360837437769241838,
-    (Point(row=9, col=5), Player.white): 5188021617355333482,
-    (Point(row=9, col=6), Player.black): 1819653565458637272,
-    (Point(row=9, col=6), Player.white): 1072431270891732115,
-    (Point(row=9, col=7), Player.black): 7881797901288606476,
-    (Point(row=9, col=7), Player.white): 3382082589731228587,
-    (Point(row=9, col=8), Player.black): 5589920306680587000,
-    (Point(row=9, col=8), Player.white): 2033304929707546648,
-    (Point(row=9, col=9), Player.black): 976084788273625399,
-    (Point(row=9, col=9), Player.white): 2770086836585025524,
-    (Point(row=9, col=10), Player.black): 3103670413715122547,
-    (Point(row=9, col=10), Player.white): 4332145677416836630,
-    (Point(row=9, col=11), Player.black): 8292149728209205098,
-    (Point(row=9, col=11), Player.white): 4274623538726752359,
-    (Point(row=9, col=12), Player.black): 8670817939710133805,
-    (Point(row=9, col=12), Player.white): 8853397301147196440,
-    (Point(row=9, col=13), Player.black): 7090370909159808185,
-    (Point(row=9, col=13), Player.white): 4253618545677808822,
-    (Point(row=9, col=14), Player.black): 7999821688482680494,
-    (Point(row=9, col=14), Player.white): 4922834331057934289,
-    (Point(row=9, col=15), Player.black): 4077387756465946760,
-    (Point(row=9, col=15), Player.white): 2379411151896115976,
-    (Point(row=9, col=16), Player.black): 4872703858185155300,
-    (Point(row=9, col=16), Player.white): 734219139398451303,
-    (Point(row=9, col=17), Player.black): 9062785458870249850,
-    (Point(row=9, col=17), Player.white): 98133010107975941,
-    (Point(row=9, col=18), Player.black): 8092125469166199648,
-    (Point(row=9, col=18), Player.white): 5226139781956615023,
-    (Point(row=9, col=19), Player.black): 8577747661013685977,
-    (Point(row=9, col=19), Player.white): 1438403586075154603,
-    (Point(row=10, col=1), Player.black): 1058609678809534439,
-    (Point(row=10, col=1), Player.white): 8451314145574273946,
-    (Point(row=10, col=2), Player.black): 7254559467878925436,
-    (Point(row=10, col=2), Player.white): 4700251885793345317,
-    (Point(row=10, col=3), Player.black): 501440686226459996,
-    (Point(row=10, col=3), Player.white): 4934917730384021155,
-    (Point(row=10, col=4), Player.black): 313810464071987318,
-    (Point(row=10, col=4), Player.white): 7141726808274460148,
-    (Point(row=10, col=5), Player.black): 7012484422610524109,
-    (Point(row=10, col=5), Player.white): 6638429989862059716,
-    (Point(row=10, col=6), Player.black): 1753829967915535744,
-    (Point(row=10, col=6), Player.white): 5276496912133919665,
-    (Point(row=10, col=7), Player.black): 6873471881720065918,
-    (Point(row=10, col=7), Player.white): 1596978936582972811,
-    (Point(row=10, col=8), Player.black): 2470435093914357604,
-    (Point(row=10, col=8), Player.white): 3656046245781837265,
-    (Point(row=10, col=9), Player.black): 1364300018668433802,
-    (Point(row=10, col=9), Player.white): 335167338848410495,
-    (Point(row=10, col=10), Player.black): 700771231204131733,
-    (Point(row=10, col=10), Player.white): 7946218889657728649,
-    (Point(row=10, col=11), Player.black): 8267331720669953715,
-    (Point(row=10, col=11), Player.white): 529538737863714358,
-    (Point(row=10, col=12), Player.black): 7788712072097444027,
-    (Point(row=10, col=12), Player.white): 5896297344052551540,
-    (Point(row=10, col=13), Player.black): 236793969941871273,
-    (Point(row=10, col=13), Player.white): 1375165871627500591,
-    (Point(row=10, col=14), Player.black): 6414836136331494304,
-    (Point(row=10, col=14), Player.white): 8731294946490785806,
-    (Point(row=10, col=15), Player.black): 8645220007620808610,
-    (Point(row=10, col=15), Player.white): 6288735279165116057,
-    (Point(row=10, col=16), Player.black): 1907311205686189785,
-    (Point(row=10, col=16), Player.white): 6539708549691204061,
-    (Point(row=10, col=17), Player.black): 5440695690245473254,
-    (Point(row=10, col=17), Player.white): 1895947183477124530,
-    (Point(row=10, col=18), Player.black): 3183100748597626558,
-    (Point(row=10, col=18), Player.white): 3496925292053448064,
-    (Point(row=10, col=19), Player.black): 5420837156604605698,
-    (Point(row=10, col=19), Player.white): 4265751028182127894,
-    (Point(row=11, col=1), Player.black): 2256862106278170602,
-    (Point(row=11, col=1), Player.white): 1241632302990962025,
-    (Point(row=11, col=2), Player.black): 9174711798919017160,
-    (Point(row=11, col=2), Player.white): 2130843249541661767,
-    (Point(row=11, col=3), Player.black): 527081274303094587,
-    (Point(row=11, col=3), Player.white): 797908338184056509,
-    (Point(row=11, col=4), Player.black): 5393050840849015311,
-    (Point(row=11, col=4), Player.white): 4084597294560529218,
-    (Point(row=11, col=5), Player.black): 4377996604721204065,
-    (Point(row=11, col=5), Player.white): 9166311027784395114,
-    (Point(row=11, col=6), Player.black): 3302285740520710160,
-    (Point(row=11, col=6), Player.white): 756408933716618156,
-    (Point(row=11, col=7), Player.black): 7130255532766012614,
-    (Point(row=11, col=7), Player.white): 4575720604126558093,
-    (Point(row=11, col=8), Player.black): 6439462931165350671,
-    (Point(row=11, col=8), Player.white): 5352246380256468607,
-    (Point(row=11, col=9), Player.black): 8177748515517663880,
-    (Point(row=11, col=9), Player.white): 113777812278834359,
-    (Point(row=11, col=10), Player.black): 3751162186985693208,
-    (Point(row=11, col=10), Player.white): 6187613577233441455,
-    (Point(row=11, col=11), Player.black): 7514878831389221027,
-    (Point(row=11, col=11), Player.white): 3328732427890516003,
-    (Point(row=11, col=12), Player.black): 7790049171371103904,
-    (Point(row=11, col=12), Player.white): 7818451703917130086,
-    (Point(row=11, col=13), Player.black): 7073581078129784981,
-    (Point(row=11, col=13), Player.white): 1739538963834753756,
-    (Point(row=11, col=14), Player.black): 6838093487797087045,
-    (Point(row=11, col=14), Player.white): 3435373722255817405,
-    (Point(row=11, col=15), Player.black): 7795230658571374845,
-    (Point(row=11, col=15), Player.white): 7502370275493415897,
-    (Point(row=11, col=16), Player.black): 4562408278649690274,
-    (Point(row=11, col=16), Player.white): 1876885661305605431,
-    (Point(row=11, col=17), Player.black): 6812625236932941606,
-    (Point(row=11, col=17), Player.white): 4964070717315291295,
-    (Point(row=11, col=18), Player.black): 184891089734507695,
-    (Point(row=11, col=18), Player.white): 3853087188778417315,
-    (Point(row=11, col=19), Player.black): 6433635169528981598,
-    (Point(row=11, col=19), Player.white): 6030749390912184020,
-    (Point(row=12, col=1), Player.black): 7716782154626643163,
-    (Point(row=12, col=1), Player.white): 1656423480723652677,
-    (Point(row=12, col=2), Player.black): 2086670114838202610,
-    (Point(row=12, col=2), Player.white): 5612563224060195388,
-    (Point(row=12, col=3), Player.black): 2013588987735888476,
-    (Point(row=12, col=3), Player.white): 2952059624488051639,
-    (Point(row=12, col=4), Player.black): 3626810291779966935,
-    (Point(row=12, col=4), Player.white): 1292229412712747793,
-    (Point(row=12, col=5), Player.black): 2438110388502361819,
-    (Point(row=12, col=5), Player.white): 7420401712560349499,
-    (Point(row=12, col=6), Player.black): 8942504227876617675,
-    (Point(row=12, col=6), Player.white): 9194505417402848138,
-    (Point(row=12, col=7), Player.black): 7262064224731598325,
-    (Point(row=12, col=7), Player.white): 5813240701952597072,
-    (Point(row=12, col=8), Player.black): 4376655515285522072,
-    (Point(row=12, col=8), Player.white): 8333553907393913386,
-    (Point(row=12, col=9), Player.black): 8295463265285966524,
-    (Point(row=12, col=9), Player.white): 1080251493584541964,
-    (Point(row=12, col=10), Player.black): 3923268942781634437,
-    (Point(row=12, col=10), Player.white): 6958158319566333361,
-    (Point(row=12, col=11), Player.black): 8378594752059586027,
-    (Point(row=12, col=11), Player.white): 8183585960388648934,
-    (Point(row=12, col=12), Player.black): 8817266602545334557,
-    (Point(row=12, col=12), Player.white): 8160691262720677635,
-    (Point(row=12, col=13), Player.black): 3022947726095521385,
-    (Point(row=12, col=13), Player.white): 7502695596286851606,
-    (Point(row=12, col=14), Player.black): 7020699317924162413,
-    (Point(row=12, col=14), Player.white): 6175743126320915876,
-    (Point(row=12, col=15), Player.black): 9033135259493487925,
-    (Point(row=12, col=15), Player.white): 1814077539931344123,
-    (Point(row=12, col=16), Player.black): 4497879101492390279,
-    (Point(row=12, col=16), Player.white): 3266103537924695620,
-    (Point(row=12, col=17), Player.black): 2873471860961018542,
-    (Point(row=12, col=17), Player.white): 4473101058382281910,
-    (Point(row=12, col=18), Player.black): 3103679649019816029,
-    (Point(row=12, col=18), Player.white): 5555512895999186400,
-    (Point(row=12, col=19), Player.black): 2576689948830867305,
-    (Point(row=12, col=19), Player.white): 8606495038187528742,
-    (Point(row=13, col=1), Player.black): 8589255974469555152,
-    (Point(row=13, col=1), Player.white): 5863739182895446015,
-    (Point(row=13, col=2), Player.black): 7302145516431184284,
-    (Point(row=13, col=2), Player.white): 7182360980356898070,
-    (Point(row=13, col=3), Player.black): 3795034359376642904,
-    (Point(row=13, col=3), Player.white): 6054051892024845314,
-    (Point(row=13, col=4), Player.black): 6962245873472219613,
-    (Point(row=13, col=4), Player.white): 4075291780906064041,
-    (Point(row=13, col=5), Player.black): 7303193125244283708,
-    (Point(row=13, col=5), Player.white): 4397909970262458599,
-    (Point(row=13, col=6), Player.black): 931767921491413475,
-    (Point(row=13, col=6), Player.white): 8607031182851766156,
-    (Point(row=13, col=7), Player.black): 256373553422265050,
-    (Point(row=13, col=7), Player.white): 6043129260569564557,
-    (Point(row=13, col=8), Player.black): 2207619482130790615,
-    (Point(row=13, col=8), Player.white): 3123334001601911502,
-    (Point(row=13, col=9), Player.black): 3745471938903870959,
-    (Point(row=13, col=9), Player.white): 3090508585728743860,
-    (Point(row=13, col=10), Player.black): 4400882414504986918,
-    (Point(row=13, col=10), Player.white): 2099428137205526222,
-    (Point(row=13, col=11), Player.black): 7272904747516304950,
-    (Point(row=13, col=11), Player.white): 4265208856773267351,
-    (Point(row=13, col=12), Player.black): 7075113122390261380,
-    (Point(row=13, col=12), Player.white): 1761224542180662215,
-    (Point(row=13, col=13), Player.black): 2268555469968863214,
-    (Point(row=13, col=13), Player.white): 234040419713008457,
-    (Point(row=13, col=14), Player.black): 5751618077026534775,
-    (Point(row=13, col=14), Player.white): 2816353015400982171,
-    (Point(row=13, col=15), Player.black): 5405930401670332310,
-    (Point(row=13, col=15), Player.white): 3679047913159322600,
-    (Point(row=13, col=16), Player.black): 2212946352612206195,
-    (Point(row=13, col=16), Player.white): 2295201820556959892,
-    (Point(row=13, col=17), Player.black): 2703354569375012007,
-    (Point(row=13, col=17), Player.white): 3069616971560952211,
-    (Point(row=13, col=18), Player.black): 972005923873370642,
-    (Point(row=13, col=18), Player.white): 1861808180110792808,
-    (Point(row=13, col=19), Player.black): 2620264042852454487,
-    (Point(row=13, col=19), Player.white): 6619850008027148702,
-    (Point(row=14, col=1), Player.black): 6360899572247090529,
-    (Point(row=14, col=1), Player.white): 4651773993659865377,
-    (Point(row=14, col=2), Player.black): 1353171986189607685,
-    (Point(row=14, col=2), Player.white): 5517514002525083179,
-    (Point(row=14, col=3), Player.black): 6162162178425106526,
-    (Point(row=14, col=3), Player.white): 682405246741760205,
-    (Point(row=14, col=4), Player.black): 8029558815887686053,
-    (Point(row=14, col=4), Player.white): 924904358656235151,
-    (Point(row=14, col=5), Player.black): 6737880768049771836,
-    (Point(row=14, col=5), Player.white): 3027840704118895998,
-    (Point(row=14, col=6), Player.black): 1968676761731129858,
-    (Point(row=14, col=6), Player.white): 7600069469336985991,
-    (Point(row=14, col=7), Player.black): 8621988612547135314,
-    (Point(row=14, col=7), Player.white): 6671522707771478745,
-    (Point(row=14, col=8), Player.black): 6043899083925010462,
-    (Point(row=14, col=8), Player.white): 540191513460278008,
-    (Point(row=14, col=9), Player.black): 1672874884387725953,
-    (Point(row=14, col=9), Player.white): 8928409411758094255,
-    (Point(row=14, col=10), Player.black): 3979933937820369691,
-    (Point(row=14, col=10), Player.white): 4283874287324719624,
-    (Point(row=14, col=11), Player.black): 987750703018353578,
-    (Point(row=14, col=11), Player.white): 4734829226864757870,
-    (Point(row=14, col=12), Player.black): 8147683438071550029,
-    (Point(row=14, col=12), Player.white): 6317764066504052896,
-    (Point(row=14, col=13), Player.black): 6292033327809487102,
-    (Point(row=14, col=13), Player.white): 3960025320049659093,
-    (Point(row=14, col=14), Player.black): 4746713835109918460,
-    (Point(row=14, col=14), Player.white): 1708403560973751046,
-    (Point(row=14, col=15), Player.black): 4559213146900456974,
-    (Point(row=14, col=15), Player.white): 7425799999379256611,
-    (Point(row=14, col=16), Player.black): 8453542855526208783,
-    (Point(row=14, col=16), Player.white): 1510336498495428281,
-    (Point(row=14, col=17), Player.black): 7282392085042504608,
-    (Point(row=14, col=17), Player.white): 444730876297318200,
-    (Point(row=14, col=18), Player.black): 1117355516016980170,
-    (Point(row=14, col=18), Player.white): 2561115227683160727,
-    (Point(row=14, col=19), Player.black): 1206448788890790915,
-    (Point(row=14, col=19), Player.white): 5439816703622570394,
-    (Point(row=15, col=1), Player.black): 8603800356521824542,
-    (Point(row=15, col=1), Player.white): 8620816073171543205,
-    (Point(row=15, col=2), Player.black): 5358149852739709139,
-    (Point(row=15, col=2), Player.white): 2560683208378991097,
-    (Point(row=15, col=3), Player.black): 2169598964006433624,
-    (Point(row=15, col=3), Player.white): 355181740086329890,
-    (Point(row=15, col=4), Player.black): 7672820135063734624,
-    (Point(row=15, col=4), Player.white): 5609884930667435931,
-    (Point(row=15, col=5), Player.black): 779607862438076364,
-    (Point(row=15, col=5), Player.white): 6673886458268097374,
-    (Point(row=15, col=6), Player.black): 2588188665077724855,
-    (Point(row=15, col=6), Player.white): 2949060125807624800,
-    (Point(row=15, col=7), Player.black): 6335504780537219186,
-    (Point(row=15, col=7), Player.white): 844902942664160654,
-    (Point(row=15, col=8), Player.black): 8083927856594645467,
-    (Point(row=15, col=8), Player.white): 6728389135272782784,
-    (Point(row=15, col=9), Player.black): 3066525896852095203,
-    (Point(row=15, col=9), Player.white): 3781401740989330032,
-    (Point(row=15, col=10), Player.black): 4571728298453482633,
-    (Point(row=15, col=10), Player.white): 6539083874928342825,
-    (Point(row=15, col=11), Player.black): 8138681840312356967,
-    (Point(row=15, col=11), Player.white): 1010135293534611768,
-    (Point(row=15, col=12), Player.black): 981978760953159316,
-    (Point(row=15, col=12), Player.white): 1618376156935040633,
-    (Point(row=15, col=13), Player.black): 3189521539067349822,
-    (Point(row=15, col=13), Player.white): 8466475045972157409,
-    (Point(row=15, col=14), Player.black): 3572535914839382024,
-    (Point(row=15, col=14), Player.white): 3900274906736066565,
-    (Point(row=15, col=15), Player.black): 8911694770975989563,
-    (Point(row=15, col=15), Player.white): 1381884581346747023,
-    (Point(row=15, col=16), Player.black): 5292109175626677476,
-    (Point(row=15, col=16), Player.white): 5386683092595848829,
-    (Point(row=15, col=17), Player.black): 129511669750200408,
-    (Point(row=15, col=17), Player.white): 8626010874431940000,
-    (Point(row=15, col=18), Player.black): 3925138616277272192,
-    (Point(row=15, col=18), Player.white): 107508781798745495,
-    (Point(row=15, col=19), Player.black): 5294486645410798168,
-    (Point(row=15, col=19), Player.white): 6276578876601959954,
-    (Point(row=16, col=1), Player.black): 3200079289261394790,
-    (Point(row=16, col=1), Player.white): 6496832630471963366,
-    (Point(row=16, col=2), Player.black): 8610268627232284844,
-    (Point(row=16, col=2), Player.white): 1136851559793580927,
-    (Point(row=16, col=3), Player.black): 1100971010082876096,
-    (Point(row=16, col=3), Player.white): 7127656057070557506,
-    (Point(row=16, col=4), Player.black): 145338947607854980,
-    (Point(row=16, col=4), Player.white): 4933643109963802784,
-    (Point(row=16, col=5), Player.black): 7005890644715012296,
-    (Point(row=16, col=5), Player.white): 6240596401185902562,
-    (Point(row=16, col=6), Player.black): 4999902097681842656,
-    (Point(row=16, col=6), Player.white): 7560021491555601392,
-    (Point(row=16, col=7), Player.black): 4954314409094246902,
-    (Point(row=16, col=7), Player.white): 4659788264698087240,
-    (Point(row=16, col=8), Player.black): 1814736966128432147,
-    (Point(row=16, col=8), Player.white): 375677147540475577,
-    (Point(row=16, col=9), Player.black): 3659539896898017724,
-    (Point(row=16, col=9), Player.white): 6105242183296965052,
-    (Point(row=16, col=10), Player.black): 3528981949705201385,
-    (Point(row=16, col=10), Player.white): 532332343064750646,
-    (Point(row=16, col=11), Player.black): 8033628029377630751,
-    (Point(row=16, col=11), Player.white): 3775409838841862247,
-    (Point(row=16, col=12), Player.black): 7644895904968302309,
-    (Point(row=16, col=12), Player.white): 2043931321223081023,
-    (Point(row=16, col=13), Player.black): 9003301116632880598,
-    (Point(row=16, col=13), Player.white): 4533619156159165340,
-    (Point(row=16, col=14), Player.black): 872419624074560164,
-    (Point(row=16, col=14), Player.white): 4450343738719579285,
-    (Point(row=16, col=15), Player.black): 8288636907308386090,
-    (Point(row=16, col=15), Player.white): 1210325879639776094,
-    (Point(row=16, col=16), Player.black): 6996886806411820540,
-    (Point(row=16, col=16), Player.white): 2562987041584337904,
-    (Point(row=16, col=17), Player.black): 7067763185798090156,
-    (Point(row=16, col=17), Player.white): 6280200666454291219,
-    (Point(row=16, col=18), Player.black): 7744677212944602736,
-    (Point(row=16, col=18), Player.white): 1986630624055227310,
-    (Point(row=16, col=19), Player.black): 465875597854078736,
-    (Point(row=16, col=19), Player.white): 2374147881306849162,
-    (Point(row=17, col=1), Player.black): 564600994876505311,
-    (Point(row=17, col=1), Player.white): 8225022460899802028,
-    (Point(row=17, col=2), Player.black): 3341952638820822155,
-    (Point(row=17, col=2), Player.white): 3907854206965515651,
-    (Point(row=17, col=3), Player.black): 1259636502363751701,
-    (Point(row=17, col=3), Player.white): 3770530182026177282,
-    (Point(row=17, col=4), Player.black): 4193234291993163058,
-    (Point(row=17, col=4), Player.white): 2121042822862712563,
-    (Point(row=17, col=5), Player.black): 7110656416625958245,
-    (Point(row=17, col=5), Player.white): 6198335867863316090,
-    (Point(row=17, col=6), Player.black): 8455796624058227342,
-    (Point(row=17, col=6), Player.white): 5007824818078322800,
-    (Point(row=17, col=7), Player.black): 354809268672562196,
-    (Point(row=17, col=7), Player.white): 742774880211240240,
-    (Point(row=17, col=8), Player.black): 251735860253471671,
-    (Point(row=17, col=8), Player.white): 1851074020477284663,
-    (Point(row=17, col=9), Player.black): 2093714084201854444,
-    (Point(row=17, col=9), Player.white): 6516728209457383406,
-    (Point(row=17, col=10), Player.black): 2409699121066129815,
-    (Point(row=17, col=10), Player.white): 1254501986164780359,
-    (Point(row=17, col=11), Player.black): 6848196917188928254,
-    (Point(row=17, col=11), Player.white): 5698706469830434921,
-    (Point(row=17, col=12), Player.black): 1217145472986690303,
-    (Point(row=17, col=12), Player.white): 7382382075767429838,
-    (Point(row=17, col=13), Player.black): 3317494220971117709,
-    (Point(row=17, col=13), Player.white): 5864083561592344949,
-    (Point(row=17, col=14), Player.black): 1789532079620855415,
-    (Point(row=17, col=14), Player.white): 3038158020764231396,
-    (Point(row=17, col=15), Player.black): 3478909927286315265,
-    (Point(row=17, col=15), Player.white): 2317359258834528148,
-    (Point(row=17, col=16), Player.black): 4939750055908360583,
-    (Point(row=17, col=16), Player.white): 632145767958504146,
-    (Point(row=17, col=17), Player.black): 6016697044496060580,
-    (Point(row=17, col=17), Player.white): 8134592369018638585,
-    (Point(row=17, col=18), Player.black): 7915064874871253162,
-    (Point(row=17, col=18), Player.white): 5358674682833406750,
-    (Point(row=17, col=19), Player.black): 9012343078478708208,
-    (Point(row=17, col=19), Player.white): 6098720453134670700,
-    (Point(row=18, col=1), Player.black): 8350465613185537934,
-    (Point(row=18, col=1), Player.white): 974301434920350715,
-    (Point(row=18, col=2), Player.black): 3009727691195648752,
-    (Point(row=18, col=2), Player.white): 1376103882195948696,
-    (Point(row=18, col=3), Player.black): 649726059917279708,
-    (Point(row=18, col=3), Player.white): 2043375520661740367,
-    (Point(row=18, col=4), Player.black): 1941898196016959677,
-    (Point(row=18, col=4), Player.white): 3480925600386533814,
-    (Point(row=18, col=5), Player.black): 1040342760093938088,
-    (Point(row=18, col=5), Player.white): 4529254583755652034,
-    (Point(row=18, col=6), Player.black): 2876838706345648487,
-    (Point(row=18, col=6), Player.white): 6851969044995059188,
-    (Point(row=18, col=7), Player.black): 1914167837190894207,
-    (Point(row=18, col=7), Player.white): 5037550827024462683,
-    (Point(row=18, col=8), Player.black): 2767897552029462082,
-    (Point(row=18, col=8), Player.white): 593708809879312628,
-    (Point(row=18, col=9), Player.black): 246265034743580633,
-    (Point(row=18, col=9), Player.white): 5565399205865794949,
-    (Point(row=18, col=10), Player.black): 8239717780129317749,
-    (Point(row=18, col=10), Player.white): 7412994552436829072,
-    (Point(row=18, col=11), Player.black): 6068085827687278400,
-    (Point(row=18, col=11), Player.white): 1394724559225004638,
-    (Point(row=18, col=12), Player.black): 659306207697146169,
-    (Point(row=18, col=12), Player.white): 7763728843163074904,
-    (Point(row=18, col=13), Player.black): 2159692872969217906,
-    (Point(row=18, col=13), Player.white): 7882707080317011962,
-    (Point(row=18, col=14), Player.black): 8376308906232485996,
-    (Point(row=18, col=14), Player.white): 8181714787802718148,
-    (Point(row=18, col=15), Player.black): 2072577619043371877,
-    (Point(row=18, col=15), Player.white): 3096473207006946238,
-    (Point(row=18, col=16), Player.black): 6859748869063497812,
-    (Point(row=18, col=16), Player.white): 3934599285106038148,
-    (Point(row=18, col=17), Player.black): 271811452733850356,
-    (Point(row=18, col=17), Player.white): 7034474398954093849,
-    (Point(row=18, col=18), Player.black): 1731759173917580147,
-    (Point(row=18, col=18), Player.white): 4737011068280254000,
-    (Point(row=18, col=19), Player.black): 9056169705952542964,
-    (Point(row=18, col=19), Player.white): 8562989346905895381,
-    (Point(row=19, col=1), Player.black): 3682113533556259571,
-    (Point(row=19, col=1), Player.white): 7917556071630600229,
-    (Point(row=19, col=2), Player.black): 4577950578250642525,
-    (Point(row=19, col=2), Player.white): 853113694333926991,
-    (Point(row=19, col=3), Player.black): 111997021439767129,
-    (Point(row=19, col=3), Player.white): 280218911980697469,
-    (Point(row=19, col=4), Player.black): 4786687558742812057,
-    (Point(row=19, col=4), Player.white): 8409463791715217698,
-    (Point(row=19, col=5), Player.black): 1347683180792527901,
-    (Point(row=19, col=5), Player.white): 168437212750471728,
-    (Point(row=19, col=6), Player.black): 1870682204755946787,
-    (Point(row=19, col=6), Player.white): 2226874191425961940,
-    (Point(row=19, col=7), Player.black): 2323141037621011520,
-    (Point(row=19, col=7), Player.white): 1047593341257423423,
-    (Point(row=19, col=8), Player.black): 6829366827242321217,
-    (Point(row=19, col=8), Player.white): 3540002336103435450,
-    (Point(row=19, col=9), Player.black): 6465046427187206410,
-    (Point(row=19, col=9), Player.white): 6577923515876713869,
-    (Point(row=19, col=10), Player.black): 4037912005966461605,
-    (Point(row=19, col=10), Player.white): 738297872830271998,
-    (Point(row=19, col=11), Player.black): 2063583050628123875,
-    (Point(row=19, col=11), Player.white): 1512720735026932572,
-    (Point(row=19, col=12), Player.black): 709804610474346149,
-    (Point(row=19, col=12), Player.white): 418807211278513699,
-    (Point(row=19, col=13), Player.black): 7560865353977499535,
-    (Point(row=19, col=13), Player.white): 878670366179654044,
-    (Point(row=19, col=14), Player.black): 7623398580339754242,
-    (Point(row=19, col=14), Player.white): 8027661929724033814,
-    (Point(row=19, col=15), Player.black): 1083751097326513146,
-    (Point(row=19, col=15), Player.white): 6137482293877218360,
-    (Point(row=19, col=16), Player.black): 2575579262361446479,
-    (Point(row=19, col=16), Player.white): 3406979579199174741,
-    (Point(row=19, col=17), Player.black): 7608971385374540652,
-    (Point(row=19, col=17), Player.white): 3314507696717049956,
-    (Point(row=19, col=18), Player.black): 8693366377741736329,
-    (Point(row=19, col=18), Player.white): 2794885002027769985,
-    (Point(row=19, col=19), Player.black): 5376868983414675871,
-    (Point(row=19, col=19), Player.white): 2562840772791037473,
-}
+__all__ = ["EMPTY_BOARD", "SEED", "ZobristTable", "table_for"]
 
 EMPTY_BOARD = 0
+SEED = 20190419
+
+
+class ZobristTable:
+    """Random 64-bit hash keys for one board size.
+
+    Points are addressed by their index in the padded board layout,
+    `row * (num_cols + 2) + col`. `stones[2 * index + color - 1]` is the key
+    for a stone of `color` (the `Player` value) on that point, `ko[index]` the
+    key for a ko ban on it, and `side_to_move` is XORed in when white is to
+    play. Keys only depend on the board size and `seed`.
+    """
+
+    def __init__(self, num_rows: int, num_cols: int, seed: int = SEED):
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.width = num_cols + 2
+        size = (num_rows + 2) * self.width
+        rng = random.Random(f"{seed}:{num_rows}x{num_cols}")
+        self.stones = array("Q", (rng.getrandbits(64) for _ in range(2 * size)))
+        self.ko = array("Q", (rng.getrandbits(64) for _ in range(size)))
+        self.side_to_move = rng.getrandbits(64)
+
+    def point_index(self, point: Point) -> int:
+        return point.row * self.width + point.col
+
+    def stone(self, point: Point, player: Player) -> int:
+        return self.stones[2 * (point.row * self.width + point.col) + player.value - 1]
+
+
+_tables: dict[tuple[int, int], ZobristTable] = {}
+
+
+def table_for(num_rows: int, num_cols: int) -> ZobristTable:
+    """Returns the shared table for a board size, generating it on first use"""
+    key = (num_rows, num_cols)
+    table = _tables.get(key)
+    if table is None:
+        table = _tables[key] = ZobristTable(num_rows, num_cols)
+    return table
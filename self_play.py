@@ -0,0 +1,27 @@
+"""Plays RandomBot self-play games into an archive and sample shards."""
+
+import argparse
+
+from dlgo.agents.naive import RandomBot
+from dlgo.selfplay import play_games
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out_dir", help="directory for games.dlga and the samples")
+    args = parser.parse_args()
+
+    stats = play_games(
+        RandomBot(),
+        RandomBot(),
+        num_games=100,
+        out_dir=args.out_dir,
+        board_size=9,
+        encoder="sevenplane",
+        workers=4,
+    )
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import numpy as np
+
+from dlgo.batch_playout import BatchPlayout, evaluate_territory_batch
+from dlgo.goboard_fast import FastBoard
+from dlgo.gotypes import Player, Point
+from dlgo.scoring import evaluate_territory
+from tests.util import final_state, random_game
+
+
+def _grid(board) -> np.ndarray:
+    grid = np.zeros((board.num_rows, board.num_cols), dtype=np.int8)
+    for row in range(board.num_rows):
+        for col in range(board.num_cols):
+            player = board.get(Point(row + 1, col + 1))
+            if player is not None:
+                grid[row, col] = player.value
+    return grid
+
+
+def test_territory_matches_the_scalar_version():
+    for size in (3, 5, (7, 11)):
+        finals = [final_state(size, seed, FastBoard) for seed in range(6)]
+        # Unfinished positions have larger and shared empty regions
+        games = list(random_game(size, 9, FastBoard))
+        finals.append(games[len(games) // 3])
+        counts = evaluate_territory_batch(np.stack([_grid(g.board) for g in finals]))
+        for number, game in enumerate(finals):
+            territory = evaluate_territory(game.board)
+            for name, values in counts.items():
+                assert values[number] == getattr(territory, name), name
+
+
+def test_steps_match_place_stone():
+    start = list(random_game(5, 2, FastBoard))[8]
+    batch = BatchPlayout.from_game_state(start, 16, seed=0)
+    boards = [start.board.copy() for _ in range(16)]
+    for _ in range(100):
+        if batch.done.all():
+            break
+        before = batch.boards.copy()
+        colors = batch.next_color.copy()
+        batch.step()
+        for number, board in enumerate(boards):
+            placed = np.argwhere((before[number] == 0) & (batch.boards[number] != 0))
+            assert len(placed) <= 1
+            if len(placed):
+                row, col = placed[0]
+                board.place_stone(Player(colors[number]), Point(row + 1, col + 1))
+            assert (_grid(board) == batch.boards[number]).all()
+            for row, col in np.argwhere(batch.boards[number] != 0):
+                string = board.get_go_string(Point(row + 1, col + 1))
+                assert string.num_liberties > 0
+    assert batch.done.all()
@@ -0,0 +1,18 @@
+from benchmarks import compare
+
+
+def test_compare_flags_regressions():
+    baseline = {
+        "rate": {"value": 100.0, "unit": "games/s"},
+        "time": {"value": 10.0, "unit": "us"},
+        "gone": {"value": 1.0, "unit": "us"},
+    }
+    results = {
+        "rate": {"value": 89.0, "unit": "games/s"},
+        "time": {"value": 10.5, "unit": "us"},
+        "new": {"value": 1.0, "unit": "us"},
+    }
+    assert compare(results, baseline, 0.1) == ["rate"]
+    results["time"]["value"] = 11.5
+    assert compare(results, baseline, 0.1) == ["rate", "time"]
+    assert compare(results, baseline, 0.2) == []
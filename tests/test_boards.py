@@ -0,0 +1,194 @@
+import copy
+import pickle
+
+import pytest
+
+from dlgo.geometry import geometry_for
+from dlgo.goboard import Board, GameState
+from dlgo.goboard_bit import BitBoard
+from dlgo.goboard_fast import FastBoard
+from dlgo.gotypes import Player, Point
+from tests.util import final_state, random_game
+
+BOARD_CLASSES = [Board, FastBoard, BitBoard]
+SIZES = [1, 2, 3, 5, (7, 11)]
+
+
+def _points(board):
+    for row in range(1, board.num_rows + 1):
+        for col in range(1, board.num_cols + 1):
+            yield Point(row, col)
+
+
+def _brute_counts(board, player: Player) -> tuple[int, int]:
+    """Stones of `player`, and those stones plus single-point territory"""
+    stones = territory = 0
+    for point in _points(board):
+        color = board.get(point)
+        if color == player:
+            stones += 1
+        elif color is None:
+            neighbors = [board.get(n) for n in point.neighbors() if board.is_on_grid(n)]
+            if neighbors and all(n == player for n in neighbors):
+                territory += 1
+    return stones, stones + territory
+
+
+def _counters(board) -> list:
+    return [
+        (board.num_stones(p), board.num_captures(p), board.area_estimate(p))
+        for p in Player
+    ]
+
+
+def _snapshot(board) -> list:
+    return [(board.get(point), board.get_go_string(point)) for point in _points(board)]
+
+
+@pytest.mark.parametrize("board_cls", [FastBoard, BitBoard])
+@pytest.mark.parametrize("size", SIZES)
+def test_engine_plays_like_board(board_cls, size):
+    for seed in range(2):
+        game = None
+        for expected in random_game(size, seed):
+            if game is None:
+                game = GameState.new_game(size, board_cls=board_cls)
+            else:
+                game = game.apply_move(expected.last_move)
+            board, expected_board = game.board, expected.board
+            assert _snapshot(board) == _snapshot(expected_board)
+            assert board.zobrist_hash() == expected_board.zobrist_hash()
+            assert _counters(board) == _counters(expected_board)
+            assert bytes(board.color_grid()) == bytes(expected_board.color_grid())
+            assert list(board.liberty_grid()) == list(expected_board.liberty_grid())
+            for point in _points(board):
+                if expected_board.get(point) is not None:
+                    continue
+                for player in Player:
+                    assert board.is_self_capture(
+                        player, point
+                    ) == expected_board.is_self_capture(player, point)
+                    assert board.zobrist_hash_after(
+                        player, point
+                    ) == expected_board.zobrist_hash_after(player, point)
+            assert game.legal_moves() == expected.legal_moves()
+            assert game.is_over() == expected.is_over()
+        assert game.winner() == expected.winner()
+
+
+@pytest.mark.parametrize("board_cls", [FastBoard, BitBoard])
+def test_from_board(board_cls):
+    board = final_state((7, 11), 2).board
+    converted = board_cls.from_board(board)
+    assert _snapshot(converted) == _snapshot(board)
+    assert converted.zobrist_hash() == board.zobrist_hash()
+    # Captures can't be known from the stones alone
+    for player in Player:
+        assert converted.num_stones(player) == board.num_stones(player)
+        assert converted.area_estimate(player) == board.area_estimate(player)
+        assert converted.num_captures(player) == 0
+    assert bytes(Board(7, 11).color_grid()) == geometry_for(7, 11).blank_grid
+
+
+@pytest.mark.parametrize("board_cls", BOARD_CLASSES)
+@pytest.mark.parametrize("size", SIZES)
+def test_applied_moves_leave_earlier_boards_alone(board_cls, size):
+    for seed in range(2):
+        games, snapshots = [], []
+        for game in random_game(size, seed, board_cls):
+            games.append(game)
+            snapshots.append((_snapshot(game.board), game.board.zobrist_hash()))
+        for game, snapshot in zip(games, snapshots):
+            assert (_snapshot(game.board), game.board.zobrist_hash()) == snapshot
+
+
+@pytest.mark.parametrize("board_cls", BOARD_CLASSES)
+def test_copies_are_independent(board_cls):
+    board = final_state(9, 1, board_cls).board
+    before = _snapshot(board)
+    for duplicate in (
+        board.copy(),
+        copy.deepcopy(board),
+        pickle.loads(pickle.dumps(board)),
+    ):
+        assert _snapshot(duplicate) == before
+        assert duplicate.zobrist_hash() == board.zobrist_hash()
+        assert _counters(duplicate) == _counters(board)
+    duplicate = board.copy()
+    empty = [point for point in _points(board) if board.get(point) is None]
+    duplicate.place_stone(Player.black, empty[0])
+    assert _snapshot(board) == before
+    assert duplicate.get(empty[0]) == Player.black
+    # Writes to the original after a copy don't leak into the copy either
+    duplicate = board.copy()
+    board.place_stone(Player.white, empty[-1])
+    assert duplicate.get(empty[-1]) is None
+
+
+@pytest.mark.parametrize("board_cls", BOARD_CLASSES)
+def test_capture_and_liberties(board_cls):
+    board = board_cls(5, 5)
+    board.place_stone(Player.white, Point(1, 1))
+    board.place_stone(Player.black, Point(1, 2))
+    assert board.get_go_string(Point(1, 1)).num_liberties == 1
+    board.place_stone(Player.black, Point(2, 1))
+    assert board.get(Point(1, 1)) is None
+    assert board.get_go_string(Point(1, 2)).num_liberties == 3
+    expected = board_cls(5, 5)
+    expected.place_stone(Player.black, Point(1, 2))
+    expected.place_stone(Player.black, Point(2, 1))
+    assert board.zobrist_hash() == expected.zobrist_hash()
+
+
+@pytest.mark.parametrize("board_cls", BOARD_CLASSES)
+@pytest.mark.parametrize("size", [1, 2, 3, 5])
+def test_legality_matches_placing_a_stone(board_cls, size):
+    for seed in range(3):
+        for game in random_game(size, seed, board_cls):
+            board = game.board
+            legal = {move.point for move in game.legal_moves() if move.is_play}
+            expected = set()
+            for point in _points(board):
+                if board.get(point) is not None:
+                    continue
+                for player in Player:
+                    after = board.copy()
+                    after.place_stone(player, point)
+                    captured = after.get_go_string(point).num_liberties == 0
+                    assert board.is_self_capture(player, point) == captured
+                    if captured:
+                        continue
+                    assert board.zobrist_hash_after(player, point) == (
+                        after.zobrist_hash()
+                    )
+                    situation = (player.other, after.zobrist_hash())
+                    if (
+                        player == game.next_player
+                        and situation not in game.previous_states
+                    ):
+                        expected.add(point)
+            assert legal == (set() if game.is_over() else expected)
+            moves = game.legal_moves()
+            moves.clear()
+            assert len(game.legal_moves()) == len(legal) + 2
+
+
+@pytest.mark.parametrize("board_cls", BOARD_CLASSES)
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 9])
+def test_counters_match_brute_force(board_cls, size):
+    for seed in range(3):
+        captures = {Player.black: 0, Player.white: 0}
+        previous = None
+        for game in random_game(size, seed, board_cls):
+            board = game.board
+            if previous is not None and game.last_move.is_play:
+                mover = previous.next_player
+                captures[mover] += previous.board.num_stones(
+                    mover.other
+                ) - board.num_stones(mover.other)
+            for player in Player:
+                stones, area = _brute_counts(board, player)
+                assert board.num_stones(player) == stones
+                assert board.area_estimate(player) == area
+                assert board.num_captures(player) == captures[player]
+            previous = game
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from dlgo.encoders.base import get_encoder_by_name, liberty_grid, stone_grid
+from dlgo.goboard import Board, GameState, Move
+from dlgo.goboard_bit import BitBoard
+from dlgo.goboard_fast import FastBoard
+from dlgo.gotypes import Player, Point
+from tests.util import random_game
+
+
+def _seven_planes(game: GameState) -> np.ndarray:
+    """The sevenplane encoding, one point at a time"""
+    board = game.board
+    player = game.next_player
+    planes = np.zeros((7, board.num_rows, board.num_cols))
+    for row in range(board.num_rows):
+        for col in range(board.num_cols):
+            point = Point(row + 1, col + 1)
+            string = board.get_go_string(point)
+            if string is None:
+                if game.does_move_violate_ko(player, Move.play(point)):
+                    planes[6, row, col] = 1
+            else:
+                offset = 0 if string.color == player else 3
+                planes[offset + min(string.num_liberties, 3) - 1, row, col] = 1
+    return planes
+
+
+@pytest.mark.parametrize("board_cls", [Board, FastBoard, BitBoard])
+@pytest.mark.parametrize("size", [5, (7, 11)])
+def test_encoders_match_reference(board_cls, size):
+    encoders = {
+        name: get_encoder_by_name(name, size)
+        for name in ("oneplane", "sevenplane", "history")
+    }
+    for seed in range(2):
+        for game in random_game(size, seed, board_cls):
+            expected = _seven_planes(game)
+            assert (encoders["sevenplane"].encode(game) == expected).all()
+            own, other = expected[:3].sum(0), expected[3:6].sum(0)
+            assert (encoders["oneplane"].encode(game)[0] == own - other).all()
+            history = encoders["history"].encode(game)
+            assert (history[0] == own).all() and (history[1] == other).all()
+            assert history[-1].all() == (game.next_player == Player.black)
+
+
+def test_ko_plane_marks_quiet_repetitions():
+    # Under positional superko, a play that captures nothing can still
+    # repeat an earlier position
+    point = Point(row=3, col=3)
+    earlier = Board(5, 5)
+    earlier.place_stone(Player.black, point)
+    previous = GameState(earlier, Player.white, None, None)
+    game = GameState(Board(5, 5), Player.black, previous, Move.pass_turn())
+    planes = get_encoder_by_name("sevenplane", 5).encode(game)
+    assert planes[6].sum() == 1
+    assert planes[6, point.row - 1, point.col - 1] == 1
+
+
+def test_grids_agree_across_boards():
+    for game in random_game(9, 4):
+        grids = [
+            (stone_grid(board), liberty_grid(board))
+            for board in (
+                game.board,
+                FastBoard.from_board(game.board),
+                BitBoard.from_board(game.board),
+            )
+        ]
+        for stones, liberties in grids[1:]:
+            assert (stones == grids[0][0]).all()
+            assert (liberties == grids[0][1]).all()
+
+
+def test_encode_batch_reuses_output():
+    encoder = get_encoder_by_name("sevenplane", 5)
+    games = list(random_game(5, 1))
+    out = np.ones((len(games) + 3,) + encoder.shape(), dtype=np.float32)
+    encoder.encode_batch(games, out)
+    for planes, game in zip(out, games):
+        assert (planes == encoder.encode(game)).all()
+
+
+def test_points_round_trip():
+    encoder = get_encoder_by_name("oneplane", (7, 11))
+    assert encoder.num_points() == 77
+    for index in range(encoder.num_points()):
+        assert encoder.encode_point(encoder.decode_point_index(index)) == index
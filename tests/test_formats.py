@@ -0,0 +1,133 @@
+import pytest
+
+from dlgo import sgf
+from dlgo.archive import Archive, ArchiveError, ArchiveWriter
+from dlgo.goboard import GameState, Move
+from dlgo.goboard_fast import FastBoard
+from dlgo.gotypes import Player, Point
+from tests.util import final_state
+
+
+@pytest.fixture(scope="module")
+def finals() -> list[GameState]:
+    return [final_state(size, seed) for size in (5, 9, (7, 11)) for seed in range(3)]
+
+
+def _last(states):
+    *_, last = states
+    return last
+
+
+def test_sgf_round_trip(finals, tmp_path):
+    path = str(tmp_path / "games.sgf")
+    sgf.write_games(path, finals)
+    games = list(sgf.iter_games(path))
+    assert len(games) == len(finals)
+    for game, final in zip(games, finals):
+        board = final.board
+        assert game.board_size == (board.num_rows, board.num_cols)
+        last = _last(game.replay(FastBoard))
+        assert last.board.zobrist_hash() == board.zobrist_hash()
+        assert last.is_over() and last.winner() == final.winner()
+
+
+def test_sgf_main_line_setup_and_escapes():
+    text = rb"""junk (;GM[1]FF[4]SZ[9]HA[2]KM[0.5]C[a \] and (parens);]AB[cc][gg]
+    AW[ee:ef]AE[ef];W[dd](;B[ed];W[fd](;B[aa])(;B[bb]))(;B[zz]))
+    (;GaMe[1]SiZe[5];B[aa];B[bb];W[])"""
+    first, second = sgf.parse_games(text)
+    assert first.handicap == 2 and first.komi == 0.5
+    assert first.properties["C"] == ["a ] and (parens);"]
+    assert first.setup[-1] == (None, Point(row=4, col=5))
+    assert [point for _, point in first.moves] == [
+        Point(row=6, col=4),
+        Point(row=6, col=5),
+        Point(row=6, col=6),
+        Point(row=9, col=1),
+    ]
+    start = next(first.replay())
+    assert start.next_player == Player.white
+    assert start.board.num_stones(Player.black) == 2
+    assert start.board.num_stones(Player.white) == 1
+    # Turns alternate, so a pass is inserted between two black moves
+    moves = [state.last_move for state in second.replay()][1:]
+    assert [move.is_pass for move in moves] == [False, True, False, True]
+    with pytest.raises(sgf.SGFError):
+        list(sgf.parse_games(b"(;SZ[5];B[aa]"))
+
+
+def test_sgf_size_after_points():
+    (game,) = sgf.parse_games(b"(;GM[1]AB[aa]SZ[9];W[bb])")
+    assert game.setup == [(Player.black, Point(row=9, col=1))]
+    assert game.moves == [(Player.white, Point(row=8, col=2))]
+
+
+def _one_stone_game() -> GameState:
+    game = GameState.new_game(5)
+    for move in (Move.play(Point(3, 3)), Move.pass_turn(), Move.pass_turn()):
+        game = game.apply_move(move)
+    return game
+
+
+def test_sgf_result_uses_komi():
+    game = _one_stone_game()
+    assert "KM[30]RE[W+5]" in sgf.to_sgf(game, komi=30)
+    assert "KM[0.5]RE[B+24.5]" in sgf.to_sgf(game, komi=0.5)
+
+
+def _assert_same_game(archived, game: GameState):
+    last = _last(archived.replay())
+    assert last.board.zobrist_hash() == game.board.zobrist_hash()
+    assert last.next_player == game.next_player
+    assert archived.winner == game.winner()
+
+
+def test_archive_round_trip(finals, tmp_path):
+    path = str(tmp_path / "games.dlga")
+    resigned = _last(
+        _last(sgf.parse_games(b"(;SZ[9]HA[2]AB[cc][gg];W[dd];B[ee])")).replay()
+    ).apply_move(Move.resign())
+    games = finals + [resigned]
+    with ArchiveWriter(path) as writer:
+        for game in games:
+            writer.add(game)
+    with Archive(path) as archive:
+        assert len(archive) == len(games)
+        for number, game in enumerate(games):
+            _assert_same_game(archive[number], game)
+        assert archive[-1].first_player == Player.white
+        assert archive[-1].winner == Player.black
+        # Games still referenced when the archive closes must not stop it
+        for archived in archive:
+            list(archived.moves())
+
+
+def test_archive_winner_uses_komi(tmp_path):
+    path = str(tmp_path / "komi.dlga")
+    game = _one_stone_game()
+    with ArchiveWriter(path) as writer:
+        writer.add(game, komi=30)
+        writer.add(game, komi=0.5)
+    with Archive(path) as archive:
+        assert [archived.winner for archived in archive] == [
+            Player.white,
+            Player.black,
+        ]
+        assert archive[0].komi == 30
+
+
+def test_archive_errors(tmp_path):
+    empty = tmp_path / "empty.dlga"
+    empty.write_bytes(b"")
+    with pytest.raises(ArchiveError):
+        Archive(str(empty))
+    other = tmp_path / "other.dlga"
+    other.write_bytes(b"(;GM[1]SZ[9]" + bytes(40))
+    with pytest.raises(ArchiveError):
+        Archive(str(other))
+    truncated = tmp_path / "truncated.dlga"
+    with ArchiveWriter(str(truncated)) as writer:
+        writer.add(GameState.new_game(5))
+    truncated.write_bytes(truncated.read_bytes()[:-1])
+    with pytest.raises(ArchiveError):
+        Archive(str(truncated))
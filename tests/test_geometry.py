@@ -0,0 +1,60 @@
+import pytest
+
+from dlgo.agents.helpers import is_point_an_eye
+from dlgo.geometry import geometry_for
+from dlgo.goboard import Board
+from dlgo.goboard_bit import BitBoard
+from dlgo.goboard_fast import FastBoard
+from dlgo.gotypes import Player, Point
+from tests.util import random_game
+
+
+def _is_eye(board, point: Point, color: Player) -> bool:
+    """is_point_an_eye with explicit bounds checks"""
+    if board.get(point) is not None:
+        return False
+    for neighbor in point.neighbors():
+        if board.is_on_grid(neighbor) and board.get(neighbor) != color:
+            return False
+    friendly_corners = off_board_corners = 0
+    for corner in point.diagonals():
+        if not board.is_on_grid(corner):
+            off_board_corners += 1
+        elif board.get(corner) == color:
+            friendly_corners += 1
+    if off_board_corners:
+        return off_board_corners + friendly_corners == 4
+    return friendly_corners >= 3
+
+
+@pytest.mark.parametrize("size", [(1, 1), (1, 4), (2, 3), (7, 11)])
+def test_tables_match_points(size):
+    geometry = geometry_for(*size)
+    assert geometry is geometry_for(*size)
+    board = Board(*size)
+    width = geometry.width
+    for index, point in enumerate(geometry.points):
+        assert geometry.index[point] == index
+        on_grid = [n for n in point.neighbors() if board.is_on_grid(n)]
+        assert list(geometry.neighbors[point]) == on_grid
+        diagonals = [d for d in point.diagonals() if board.is_on_grid(d)]
+        assert list(geometry.diagonals[point]) == diagonals
+        assert (point in geometry.edges) == (len(on_grid) < 4)
+        padded = point.row * width + point.col
+        assert geometry.point_at[padded] is point
+        assert [geometry.point_at[n] for n in geometry.neighbor_indices[padded]] == [
+            n if board.is_on_grid(n) else None for n in point.neighbors()
+        ]
+    assert geometry.size == (size[0] + 2) * width
+    assert sum(point is not None for point in geometry.point_at) == len(geometry.points)
+
+
+@pytest.mark.parametrize("board_cls", [Board, FastBoard, BitBoard])
+def test_is_point_an_eye(board_cls):
+    for size in (1, 2, 3, 5, 9):
+        for game in random_game(size, size, board_cls):
+            for point in geometry_for(size, size).points:
+                for player in Player:
+                    assert is_point_an_eye(game.board, point, player) == _is_eye(
+                        game.board, point, player
+                    )
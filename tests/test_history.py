@@ -0,0 +1,34 @@
+import random
+
+from dlgo.gotypes import Player
+from dlgo.history import PositionHistory
+from tests.util import random_game
+
+
+def test_history_matches_a_set():
+    rng = random.Random(0)
+    # Few distinct hashes in few bits, so the Bloom filter gives false hits
+    keys = [(rng.choice(list(Player)), rng.getrandbits(20)) for _ in range(300)]
+    history, seen = PositionHistory(), set()
+    for player, board_hash in keys[:150]:
+        parent = history
+        history = history.with_situation(player, board_hash)
+        seen.add((player, board_hash))
+        assert len(history) == len(parent) + 1
+    assert set(history) == seen
+    for key in keys:
+        assert (key in history) == (key in seen)
+    assert (Player.black, keys[0][1]) not in PositionHistory()
+
+
+def test_branches_share_their_prefix():
+    games = list(random_game(5, 0))
+    middle = len(games) // 2
+    history = games[middle].previous_states
+    assert set(history) == {
+        (game.next_player, game.board.zobrist_hash()) for game in games[:middle]
+    }
+    branch = history.with_situation(Player.black, 12345)
+    assert (Player.black, 12345) in branch
+    assert (Player.black, 12345) not in games[-1].previous_states
+    assert set(branch) - set(history) == {(Player.black, 12345)}
@@ -0,0 +1,61 @@
+import importlib
+import sys
+
+import dlgo.agents
+from dlgo import instrument
+from dlgo.agents import helpers
+from dlgo.goboard import GameState
+
+
+def _bindings() -> dict:
+    """Every binding of an instrumented function, as (owner, attribute)"""
+    bindings = {}
+    for module_name, qualname in instrument.TARGETS:
+        module = importlib.import_module(module_name)
+        owner_name, _, attribute = qualname.rpartition(".")
+        if owner_name:
+            owner = getattr(module, owner_name)
+            bindings[owner, attribute] = owner.__dict__[attribute]
+            continue
+        for name, other in list(sys.modules.items()):
+            if name.split(".")[0] == "dlgo" and hasattr(other, attribute):
+                bindings[other, attribute] = getattr(other, attribute)
+    return bindings
+
+
+def _constant(state) -> int:
+    return 0
+
+
+def test_call_counts_and_restore():
+    originals = _bindings()
+    instrument.reset()
+    with instrument.instrumented():
+        assert instrument.is_enabled()
+        assert all(
+            getattr(owner, attribute) is not original
+            for (owner, attribute), original in originals.items()
+        )
+        # On an empty 3x3 board every point is a move. The first reply is
+        # searched in full, after that each reply is cut off after one move:
+        # 1 root + 9 replies + 8 + 8 * 1 leaves
+        helpers.alpha_beta(GameState.new_game(3), 2, _constant, True)
+    assert not instrument.is_enabled()
+    restored = _bindings()
+    assert restored.keys() == originals.keys()
+    assert all(restored[key] is original for key, original in originals.items())
+    stats = instrument.stats()
+    assert stats["alpha_beta"]["calls"] == 1
+    assert stats["_alpha_beta"]["calls"] == 26
+    assert stats["SearchState.play"]["calls"] == 25
+
+
+def test_disable_restores_modules_imported_while_enabled(monkeypatch):
+    # A fresh import binds whatever helpers holds at that moment
+    monkeypatch.delitem(sys.modules, "dlgo.agents.parallel", raising=False)
+    monkeypatch.delattr(dlgo.agents, "parallel", raising=False)
+    original = helpers._alpha_beta
+    with instrument.instrumented():
+        parallel = importlib.import_module("dlgo.agents.parallel")
+        assert parallel._alpha_beta is helpers._alpha_beta is not original
+    assert parallel._alpha_beta is original
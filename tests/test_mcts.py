@@ -0,0 +1,122 @@
+import random
+
+import pytest
+
+from dlgo.agents.helpers import is_point_an_eye
+from dlgo.agents.mcts import MCTSBot, MCTSNode, ParallelMCTSBot, candidate_moves
+from dlgo.goboard import GameState
+from dlgo.goboard_fast import FastBoard, SearchState
+from dlgo.gotypes import Player
+from dlgo.playout import area_score, random_playout
+from dlgo.scoring import compute_game_result
+from tests.util import random_game
+
+
+def _starts():
+    for size in (5, 9):
+        games = list(random_game(size, size, FastBoard))
+        yield from games[:: len(games) // 4]
+
+
+@pytest.fixture
+def placements(monkeypatch):
+    """Records the board, color, point index and hashes before and after
+    every stone a playout places"""
+    placed = []
+    place = FastBoard._place
+
+    def _place(board, color, index):
+        before = board.zobrist_hash()
+        assert not is_point_an_eye(board, board._point(index), Player(color))
+        captured = place(board, color, index)
+        placed.append((board, color, index, before, board.zobrist_hash()))
+        return captured
+
+    monkeypatch.setattr(FastBoard, "_place", _place)
+    return placed
+
+
+def test_playouts_follow_the_rules(placements):
+    for game in _starts():
+        for seed in range(5):
+            placements.clear()
+            winner = random_playout(
+                game.board, game.next_player, rng=random.Random(seed)
+            )
+            for previous, move in zip(placements, placements[1:]):
+                # A simple ko recapture would repeat the position from before
+                # the opponent's stone
+                if previous[1] != move[1]:
+                    assert move[4] != previous[3]
+            board = placements[0][0] if placements else game.board
+            result = compute_game_result(GameState(board, Player.black, None, None))
+            assert area_score(board) == (result.black, result.white)
+            assert winner == result.winner
+
+
+def _position(state: SearchState) -> tuple:
+    board = state.board
+    return (
+        bytes(board._stones),
+        board.zobrist_hash(),
+        state.next_player,
+        [(move.is_pass, move.point) for move in state.legal_moves()],
+    )
+
+
+def test_simulations_return_to_the_root():
+    random.seed(0)
+    bot = MCTSBot(num_rounds=0)
+    for game in _starts():
+        if game.is_over():
+            continue
+        state = SearchState.from_game_state(game)
+        root = MCTSNode(
+            None, None, state.next_player, candidate_moves(state), state.is_over()
+        )
+        before = _position(state)
+        for rounds in range(1, 60):
+            bot._simulate(root, state)
+            assert _position(state) == before
+            assert root.num_rollouts == rounds
+        assert sum(child.num_rollouts for child in root.children) == 59
+
+
+def test_mcts_bot_plays_legal_moves():
+    random.seed(1)
+    bot = MCTSBot(num_rounds=100)
+    for game in _starts():
+        if game.is_over():
+            continue
+        move = bot.select_move(game)
+        assert game.is_valid_move(move)
+        if move.is_play:
+            assert not is_point_an_eye(game.board, move.point, game.next_player)
+        assert bot.stats()["simulations"] == 100
+
+
+def _nodes(node: MCTSNode):
+    yield node
+    for child in node.children:
+        yield from _nodes(child)
+
+
+@pytest.mark.parametrize("mode", [ParallelMCTSBot.ROOT, ParallelMCTSBot.LEAF])
+def test_parallel_mcts_plays_legal_moves(mode):
+    bot = ParallelMCTSBot(num_rounds=40, workers=2, mode=mode)
+    try:
+        for game in list(random_game(5, 3))[:30:6]:
+            move = bot.select_move(game)
+            assert game.is_valid_move(move)
+            if move.is_play:
+                assert not is_point_an_eye(game.board, move.point, game.next_player)
+            if mode == ParallelMCTSBot.LEAF:
+                # Every virtual loss is replaced by a result on backup
+                root = bot._leaf_parallel(SearchState.from_game_state(game))
+                assert root.num_rollouts == 40
+                for node in _nodes(root):
+                    assert node.num_rollouts == sum(node.win_counts.values())
+    finally:
+        bot.close()
+    with pytest.raises(ValueError):
+        ParallelMCTSBot(mode="branch")
@@ -0,0 +1,54 @@
+import pytest
+
+from dlgo.goboard import Board, GameState, Move
+from dlgo.goboard_bit import BitBoard
+from dlgo.goboard_fast import FastBoard
+from dlgo.gotypes import Player, Point
+from dlgo.scoring import compute_game_result, evaluate_territory
+from tests.util import final_state
+
+BOARD_CLASSES = [Board, FastBoard, BitBoard]
+
+
+@pytest.mark.parametrize("board_cls", BOARD_CLASSES)
+def test_evaluate_territory(board_cls):
+    # Walls on columns 2 and 4 leave black the first column, white the last
+    # and nobody the middle one
+    board = board_cls(5, 5)
+    for row in range(1, 6):
+        board.place_stone(Player.black, Point(row, 2))
+        board.place_stone(Player.white, Point(row, 4))
+    territory = evaluate_territory(board)
+    assert territory.num_black_stones == territory.num_white_stones == 5
+    assert territory.num_black_territory == 5
+    assert territory.num_white_territory == 5
+    assert sorted(territory.neutral_points) == [Point(row, 3) for row in range(1, 6)]
+
+
+@pytest.mark.parametrize("board_cls", BOARD_CLASSES)
+def test_large_regions(board_cls):
+    # One region of 9999 points would overflow a recursive flood
+    board = board_cls(100, 100)
+    board.place_stone(Player.white, Point(50, 50))
+    territory = evaluate_territory(board)
+    assert territory.num_white_territory == 9999
+    assert territory.num_black_territory == territory.num_neutral == 0
+
+
+def test_board_classes_agree():
+    for size in (5, 9, (7, 11)):
+        for seed in range(3):
+            results = [
+                vars(evaluate_territory(final_state(size, seed, board_cls).board))
+                for board_cls in BOARD_CLASSES
+            ]
+            assert results[0] == results[1] == results[2]
+
+
+def test_komi_decides_the_winner():
+    game = GameState.new_game(5)
+    for move in (Move.play(Point(3, 3)), Move.pass_turn(), Move.pass_turn()):
+        game = game.apply_move(move)
+    assert compute_game_result(game).winner == Player.black
+    assert str(compute_game_result(game, komi=30)) == "W+5"
+    assert game.winner(komi=30) == Player.white
@@ -0,0 +1,226 @@
+import random
+import time
+
+import numpy as np
+import pytest
+
+from dlgo.agents.helpers import (
+    SearchTimeout,
+    alpha_beta,
+    capture_diff,
+    current_score,
+    eye_points,
+    is_point_an_eye,
+)
+from dlgo.agents.naive import AlphaBetaBot
+from dlgo.agents.parallel import RootSplitSearch
+from dlgo.agents.transposition import (
+    EXACT,
+    LOWER_BOUND,
+    TranspositionTable,
+    position_key,
+)
+from dlgo.geometry import geometry_for
+from dlgo.goboard import Board, GameState, Move
+from dlgo.goboard_bit import BitBoard
+from dlgo.goboard_fast import FastBoard, SearchState
+from dlgo.gotypes import Player, Point
+from dlgo.scoring import compute_game_result
+from tests.util import random_game
+
+
+def _random_position(rng: random.Random, size: int, max_moves: int) -> GameState:
+    game = GameState.new_game(size)
+    for _ in range(rng.randint(0, max_moves)):
+        moves = [move for move in game.legal_moves() if move.is_play]
+        if not moves:
+            break
+        game = game.apply_move(rng.choice(moves))
+    return game
+
+
+def _minimax(game: GameState, depth: int, eval_fn, maximizing: bool) -> float:
+    if game.is_over():
+        return np.inf if compute_game_result(game).winner == Player.black else -np.inf
+    if depth == 0:
+        return eval_fn(game)
+    values = [
+        _minimax(game.apply_move(move), depth - 1, eval_fn, not maximizing)
+        for move in game.legal_moves()
+        if move.is_play
+        and not is_point_an_eye(game.board, move.point, game.next_player)
+    ]
+    if not values:
+        return -np.inf if maximizing else np.inf
+    return max(values) if maximizing else min(values)
+
+
+def _keys(moves) -> list:
+    return [(move.is_pass, move.is_resign, move.point) for move in moves]
+
+
+def _position(board) -> tuple:
+    return tuple(
+        board.get(Point(row, col))
+        for row in range(1, board.num_rows + 1)
+        for col in range(1, board.num_cols + 1)
+    ) + (board.zobrist_hash(),)
+
+
+def test_play_and_undo_restore_the_state():
+    for seed in range(3):
+        games = list(random_game(5, seed))
+        state = SearchState.from_game_state(games[0])
+        for previous, game in zip(games, games[1:]):
+            before = _position(state.board)
+            legal = state.legal_moves()
+            for move in legal[2:]:
+                state.play(move)
+                state.undo()
+                assert _position(state.board) == before
+                assert _keys(state.legal_moves()) == _keys(legal)
+            assert _keys(legal) == _keys(previous.legal_moves())
+            state.play(game.last_move)
+            assert _position(state.board) == _position(game.board)
+            assert state.is_over() == game.is_over()
+
+
+@pytest.mark.parametrize("board_cls", [Board, FastBoard, BitBoard])
+def test_eye_points_match_per_point_test(board_cls):
+    for size in (1, 2, 3, 5, 9):
+        for game in random_game(size, size, board_cls):
+            board = game.board
+            for player in Player:
+                expected = {
+                    point
+                    for point in geometry_for(size, size).points
+                    if is_point_an_eye(board, point, player)
+                }
+                assert eye_points(board, player) == expected
+
+
+def test_from_board():
+    for game in random_game((7, 11), 2):
+        converted = FastBoard.from_board(game.board)
+        assert _position(converted) == _position(game.board)
+        for row in range(1, 8):
+            for col in range(1, 12):
+                point = Point(row, col)
+                assert converted.get_go_string(point) == game.board.get_go_string(point)
+
+
+def test_transposition_table_replacement():
+    tt = TranspositionTable(8)
+    move = Move.play(Point(1, 1))
+    tt.store(3, 4, EXACT, 1.0, move)
+    assert tt.lookup(3).move is move
+    assert tt.lookup(11) is None
+    # A shallower result for another key doesn't evict a deeper one...
+    tt.store(11, 2, LOWER_BOUND, 5.0, None)
+    assert tt.lookup(3).depth == 4
+    # ...unless the deeper one is left over from an earlier search
+    tt.new_search()
+    tt.store(11, 2, LOWER_BOUND, 5.0, None)
+    assert tt.lookup(3) is None and tt.lookup(11).value == 5.0
+    assert tt.stats()["hits"] == 3 and tt.stats()["misses"] == 2
+    tt.clear()
+    assert tt.lookup(11) is None and tt.stats()["stores"] == 0
+
+
+def test_position_key_includes_side_to_move():
+    game = GameState.new_game(5)
+    passed = game.apply_move(Move.pass_turn())
+    assert game.board.zobrist_hash() == passed.board.zobrist_hash()
+    assert position_key(game) != position_key(passed)
+    assert position_key(passed.apply_move(Move.pass_turn())) == position_key(game)
+
+
+def test_alpha_beta_matches_minimax():
+    rng = random.Random(5)
+    for _ in range(20):
+        game = _random_position(rng, rng.choice([4, 5]), 12)
+        depth = rng.choice([1, 2, 3])
+        eval_fn = rng.choice([capture_diff, current_score])
+        maximizing = game.next_player == Player.black
+        expected = _minimax(game, depth, eval_fn, maximizing)
+        assert alpha_beta(game, depth, eval_fn, maximizing) == expected
+        tt = TranspositionTable(1 << 12)
+        assert alpha_beta(game, depth, eval_fn, maximizing, tt=tt) == expected
+        # A second search starts from the entries of the first
+        tt.new_search()
+        assert alpha_beta(game, depth, eval_fn, maximizing, tt=tt) == expected
+
+
+@pytest.mark.parametrize("tt_size", [0, 1 << 10])
+def test_alpha_beta_bot_plays_legal_moves(tt_size):
+    bot = AlphaBetaBot(depth=2, tt_size=tt_size)
+    game = GameState.new_game(4)
+    for _ in range(6):
+        move = bot.select_move(game)
+        assert game.is_valid_move(move)
+        game = game.apply_move(move)
+    assert (bot.stats().get("hits", 0) > 0) == bool(tt_size)
+
+
+def test_alpha_beta_times_out():
+    game = GameState.new_game(9)
+    with pytest.raises(SearchTimeout):
+        alpha_beta(game, 6, capture_diff, True, deadline=time.monotonic() + 0.05)
+
+
+def test_iterative_deepening_keeps_to_the_time_limit():
+    bot = AlphaBetaBot(time_limit=0.2)
+    game = GameState.new_game(5)
+    for _ in range(2):
+        start = time.perf_counter()
+        move = bot.select_move(game)
+        assert time.perf_counter() - start < 1.0
+        assert game.is_valid_move(move) and move.is_play
+        assert bot.last_depth >= 1
+        game = game.apply_move(move)
+
+
+@pytest.fixture(scope="module")
+def root_split():
+    search = RootSplitSearch(2)
+    yield search
+    search.close()
+
+
+def test_root_split_matches_serial_search(root_split):
+    rng = random.Random(3)
+    for trial in range(10):
+        game = _random_position(rng, 5, 10)
+        depth = rng.choice([1, 2, 3])
+        eval_fn = rng.choice([capture_diff, current_score])
+        maximizing = game.next_player == Player.black
+        np.random.seed(trial)
+        move = root_split.search(
+            SearchState.from_game_state(game), depth, eval_fn, maximizing
+        )
+        np.random.seed(trial)
+        expected = alpha_beta(game, depth, eval_fn, maximizing, return_move=True)
+        assert _keys([move]) == _keys([expected])
+
+
+def _slow_eval(game_state) -> int:
+    time.sleep(0.02)
+    return capture_diff(game_state)
+
+
+def test_root_split_shares_the_deadline(root_split):
+    state = SearchState.from_game_state(GameState.new_game(5))
+    for _ in range(2):
+        # The first root move is searched before the deadline, but all of
+        # them take longer; a queued move must not get a fresh time budget
+        start = time.monotonic()
+        with pytest.raises(SearchTimeout):
+            root_split.search(state, 1, _slow_eval, True, deadline=start + 0.1)
+        assert time.monotonic() - start < 0.5
+    # Leftovers of the timed out searches don't disturb the next one
+    game = GameState.new_game(4)
+    np.random.seed(0)
+    move = root_split.search(SearchState.from_game_state(game), 2, capture_diff, True)
+    np.random.seed(0)
+    expected = alpha_beta(game, 2, capture_diff, True, return_move=True)
+    assert _keys([move]) == _keys([expected])
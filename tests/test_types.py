@@ -0,0 +1,35 @@
+import copy
+import pickle
+
+import pytest
+
+from dlgo.goboard import GameState, GoString, Move, moves_for
+from dlgo.gotypes import Player, Point, points_for
+
+
+def test_moves_are_interned():
+    point = Point(3, 4)
+    assert Move.play(point) is Move.play(Point(3, 4))
+    assert Move.pass_turn() is Move.pass_turn()
+    assert Move.resign() is Move.resign()
+    for move in (Move.play(point), Move.pass_turn(), Move.resign()):
+        assert pickle.loads(pickle.dumps(move)) is move
+        assert copy.deepcopy(move) is move
+    with pytest.raises(AttributeError):
+        Move.play(point).extra = 1
+    assert not hasattr(GoString(Player.black, frozenset(), frozenset()), "__dict__")
+
+
+def test_shared_points_and_moves():
+    points = points_for(7, 11)
+    assert points is points_for(7, 11)
+    assert list(points) == [Point(r, c) for r in range(1, 8) for c in range(1, 12)]
+    assert [move.point for move in moves_for(7, 11)] == list(points)
+    assert all(move is Move.play(move.point) for move in moves_for(7, 11))
+    point = Point(2, 2)
+    assert point.neighbors() is Point(2, 2).neighbors()
+    assert set(point.diagonals()) == {(1, 1), (1, 3), (3, 1), (3, 3)}
+    game = GameState.new_game(5)
+    assert all(
+        move is Move.play(move.point) for move in game.legal_moves() if move.is_play
+    )
@@ -0,0 +1,53 @@
+import numpy as np
+
+from dlgo import workers
+from dlgo.agents.naive import RandomBot
+from dlgo.archive import Archive
+from dlgo.selfplay import play_games
+from dlgo.tournament import SPRT, run_tournament
+
+
+def test_play_game_reports_every_move():
+    workers.init_worker({"a": RandomBot(), "b": RandomBot()}, (5, 5))
+    seen = []
+    game = workers.play_game("a", "b", lambda key, agent, seconds: seen.append(key))
+    assert game.is_over()
+    assert seen == ["a", "b"] * (len(seen) // 2) + ["a"] * (len(seen) % 2)
+    assert game.board.num_rows == 5
+
+
+def test_self_play_writes_games_and_samples(tmp_path):
+    stats = play_games(
+        RandomBot(), RandomBot(), 6, str(tmp_path), board_size=5, workers=2
+    )
+    assert stats.games == 6
+    with Archive(str(tmp_path / "games.dlga")) as archive:
+        assert len(archive) == 6
+        assert sum(game.num_moves for game in archive) == stats.moves
+        for number in range(len(archive)):
+            *_, last = archive[number].replay()
+            assert last.is_over() and last.winner() == archive[number].winner
+    samples = np.load(tmp_path / "samples-00000.npz")
+    assert len(samples["moves"]) == stats.samples
+    assert samples["features"].shape[1:] == (1, 5, 5)
+    assert set(np.unique(samples["outcomes"])) <= {-1, 1}
+
+
+def test_tournament_counts_every_game():
+    result = run_tournament(
+        {"a": RandomBot(), "b": RandomBot(), "c": RandomBot()},
+        games_per_pair=4,
+        sprt=None,
+        workers=2,
+        board_size=5,
+    )
+    assert [agent.games for agent in result.agents] == [8, 8, 8]
+    assert sum(pair.wins + pair.losses for pair in result.pairs) == 12
+    assert result.agents[0].elo == 0
+
+
+def test_sprt_decisions():
+    sprt = SPRT(0, 100)
+    assert sprt.decision(0, 0) is None
+    assert sprt.decision(60, 10) == "H1"
+    assert sprt.decision(10, 60) == "H0"
@@ -0,0 +1,35 @@
+import pytest
+
+from dlgo import zobrist
+from dlgo.goboard import Board
+from dlgo.goboard_bit import BitBoard
+from dlgo.goboard_fast import FastBoard
+from dlgo.gotypes import Point
+from tests.util import random_game
+
+
+@pytest.mark.parametrize("board_cls", [Board, FastBoard, BitBoard])
+@pytest.mark.parametrize("size", [1, 5, (7, 11), 13])
+def test_hash_is_the_xor_of_the_stones(board_cls, size):
+    for game in random_game(size, 0, board_cls):
+        board = game.board
+        table = zobrist.table_for(board.num_rows, board.num_cols)
+        expected = zobrist.EMPTY_BOARD
+        for row in range(1, board.num_rows + 1):
+            for col in range(1, board.num_cols + 1):
+                point = Point(row, col)
+                player = board.get(point)
+                if player is not None:
+                    expected ^= table.stone(point, player)
+        assert board.zobrist_hash() == expected
+
+
+def test_tables_are_shared_and_reproducible():
+    table = zobrist.table_for(9, 9)
+    assert zobrist.table_for(9, 9) is table
+    fresh = zobrist.ZobristTable(9, 9)
+    assert fresh.stones == table.stones and fresh.ko == table.ko
+    assert fresh.side_to_move == table.side_to_move
+    keys = list(table.stones) + list(table.ko) + [table.side_to_move]
+    assert len(set(keys)) == len(keys)
+    assert zobrist.table_for(9, 11).stones != table.stones
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator
+
+from dlgo.agents.naive import RandomBot
+from dlgo.goboard import Board, GameState
+
+
+def random_game(
+    board_size: int | tuple[int, int], seed: int, board_cls: type = Board
+) -> Iterator[GameState]:
+    """Yields every state of a game between two RandomBots, reproducibly"""
+    random.seed(seed)
+    bot = RandomBot()
+    game = GameState.new_game(board_size, board_cls=board_cls)
+    yield game
+    while not game.is_over():
+        game = game.apply_move(bot.select_move(game))
+        yield game
+
+
+def final_state(
+    board_size: int | tuple[int, int], seed: int, board_cls: type = Board
+) -> GameState:
+    *_, game = random_game(board_size, seed, board_cls)
+    return game